@@ -5,7 +5,12 @@ set -e
 
 # MCP_PACKAGE 환경 변수가 설정되어 있으면 해당 패키지 실행
 if [ -n "$MCP_PACKAGE" ]; then
-    echo "Starting MCP Server: $MCP_PACKAGE"
+    echo "Starting MCP Server: $MCP_PACKAGE" >&2
+
+    if [ "$MCP_PREINSTALLED" = "1" ]; then
+        # 서버별 이미지 (mcp/<server>): 이미지에 설치된 패키지를 네트워크 없이 실행
+        exec npx --offline --no "$MCP_PACKAGE"
+    fi
 
     # NPX로 MCP 서버 실행 (설치 없이 바로 실행)
     exec npx -y "$MCP_PACKAGE"
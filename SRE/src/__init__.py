@@ -1,10 +1,14 @@
 """War Room 2.0 - Dynamic MCP-based SRE Automation"""
 
+from .container_orchestrator import (
+    ContainerPoolConfig,
+    ContainerPoolOrchestrator,
+    ReplicaPolicy,
+)
+from .integrated_war_room import IntegratedWarRoom
 from .mcp_catalog import MCPCatalogSync, MCPServerCandidate
 from .problem_analyzer import ProblemAnalyzer, quick_analyze
-from .integrated_war_room import IntegratedWarRoom
-from .container_orchestrator import ContainerPoolOrchestrator, ContainerPoolConfig
-from .tier_manager import TierManager, ServerTier
+from .tier_manager import ServerTier, TierManager
 
 __all__ = [
     "MCPCatalogSync",
@@ -14,6 +18,7 @@ __all__ = [
     "IntegratedWarRoom",
     "ContainerPoolOrchestrator",
     "ContainerPoolConfig",
+    "ReplicaPolicy",
     "TierManager",
     "ServerTier",
 ]
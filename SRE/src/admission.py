@@ -0,0 +1,303 @@
+"""
+Admission Controller
+컨테이너 시작 요청 우선순위 큐 및 동시 시작 수 제한
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from .latency_stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+# 장애 심각도 → 우선순위 (낮을수록 먼저)
+SEVERITY_PRIORITY = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+    "background": 4,  # min_replicas 보충, scale-out 등 풀 내부 작업
+}
+
+# 같은 심각도 안에서는 Hot 서버 먼저 (대기 중 사용자가 많을 가능성)
+TIER_PRIORITY = {
+    "tier1_hot": 0,
+    "tier2_warm": 1,
+    "tier3_cold": 2,
+}
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 차서 시작 요청 거절"""
+
+
+@dataclass
+class AdmissionTicket:
+    """대기 중인 시작 요청 1건"""
+    severity: str
+    tier: Optional[str]
+    source: str
+    enqueued_at: float
+    future: asyncio.Future
+    seq: int = 0
+
+    @property
+    def priority(self) -> tuple:
+        return (
+            SEVERITY_PRIORITY.get(self.severity, SEVERITY_PRIORITY["medium"]),
+            TIER_PRIORITY.get(self.tier or "", len(TIER_PRIORITY)),
+        )
+
+    def sort_key(self) -> tuple:
+        return (self.priority, self.seq)
+
+
+@dataclass
+class _SourceQueue:
+    heap: List[tuple] = field(default_factory=list)
+    last_served: int = 0
+
+
+class AdmissionController:
+    """
+    컨테이너 시작 승인 제어
+
+    주요 기능:
+    - 이미지 pull/빌드 + 컨테이너 시작을 동시에 max_concurrent_starts개로 제한
+    - 심각도 → 티어 순 우선순위 큐 (대기열 크기 제한)
+    - 같은 우선순위 안에서는 요청 출처(source)별 라운드 로빈
+    - 대기열 길이 / 대기 시간 지표
+    """
+
+    def __init__(
+        self,
+        max_concurrent_starts: int = 2,
+        max_queue_size: int = 50,
+        wait_sample_size: int = 1000
+    ):
+        """
+        Args:
+            max_concurrent_starts: 동시에 진행할 수 있는 시작 작업 수
+            max_queue_size: 대기열 최대 길이 (초과 시 우선순위 낮은 요청 거절)
+            wait_sample_size: 대기 시간 지표용 최근 샘플 수
+        """
+        self.max_concurrent_starts = max_concurrent_starts
+        self.max_queue_size = max_queue_size
+        self._sources: Dict[str, _SourceQueue] = {}
+        # 대기 중 우선순위를 올릴 수 있는 요청 (key → ticket)
+        self._keyed: Dict[str, AdmissionTicket] = {}
+        self._queued = 0
+        self._in_flight = 0
+        self._seq = itertools.count()
+        self._serve_seq = itertools.count(1)
+
+        self._waits: deque = deque(maxlen=wait_sample_size)
+        self.admitted = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        severity: str = "medium",
+        tier: Optional[str] = None,
+        source: str = "default",
+        key: Optional[str] = None
+    ) -> AsyncIterator[float]:
+        """
+        시작 작업 슬롯 획득 (대기 시간 반환)
+
+        Args:
+            key: 대기 중 promote()로 우선순위를 올릴 때 쓰는 식별자
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 차고 더 급한 요청에 밀린 경우
+        """
+        waited = await self._acquire(severity, tier, source, key)
+        try:
+            yield waited
+        finally:
+            self._release()
+
+    async def _acquire(
+        self,
+        severity: str,
+        tier: Optional[str],
+        source: str,
+        key: Optional[str]
+    ) -> float:
+        started = time.monotonic()
+        if self._in_flight < self.max_concurrent_starts and self._queued == 0:
+            self._in_flight += 1
+            self._record_wait(0.0)
+            return 0.0
+
+        ticket = AdmissionTicket(
+            severity=severity,
+            tier=tier,
+            source=source,
+            enqueued_at=started,
+            future=asyncio.get_running_loop().create_future(),
+            seq=next(self._seq)
+        )
+        self._enqueue(ticket)
+        if key is not None:
+            self._keyed[key] = ticket
+
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            # 대기 중 취소되면 asyncio가 ticket.future도 함께 취소함
+            if ticket.future.cancelled() or not ticket.future.done():
+                ticket.future.cancel()
+                self._queued -= 1
+            elif ticket.future.exception() is None:
+                # 슬롯을 받은 직후 취소됨 → 다음 요청에 넘김
+                self._release()
+            raise
+        finally:
+            if key is not None and self._keyed.get(key) is ticket:
+                del self._keyed[key]
+
+        waited = time.monotonic() - started
+        self._record_wait(waited)
+        return waited
+
+    def _enqueue(self, ticket: AdmissionTicket):
+        if self._queued >= self.max_queue_size:
+            worst = self._worst_queued()
+            if worst is None or worst.sort_key() <= ticket.sort_key():
+                self.rejected += 1
+                raise AdmissionRejected(
+                    f"시작 대기열 가득 참 ({self._queued}건), 요청 거절: {ticket.source}"
+                )
+            # 더 급한 요청을 위해 가장 덜 급한 대기 요청을 밀어냄
+            self.rejected += 1
+            self._queued -= 1
+            worst.future.set_exception(AdmissionRejected(
+                f"더 급한 요청에 밀려 거절: {worst.source} ({worst.severity})"
+            ))
+
+        queue = self._sources.setdefault(ticket.source, _SourceQueue())
+        heapq.heappush(queue.heap, (ticket.sort_key(), ticket))
+        self._queued += 1
+        logger.info(
+            f"컨테이너 시작 대기: {ticket.source} ({ticket.severity}, "
+            f"대기열 {self._queued}건)"
+        )
+
+    def promote(self, key: str, severity: str, tier: Optional[str] = None) -> bool:
+        """
+        대기 중인 요청의 우선순위를 올림 (더 급한 호출자가 같은 시작 작업에 합류한 경우)
+
+        Returns:
+            우선순위가 바뀌었으면 True
+        """
+        ticket = self._keyed.get(key)
+        if ticket is None or ticket.future.done():
+            return False
+
+        promoted = AdmissionTicket(
+            severity=severity,
+            tier=tier or ticket.tier,
+            source=ticket.source,
+            enqueued_at=ticket.enqueued_at,
+            future=ticket.future,
+            seq=ticket.seq
+        )
+        if promoted.priority >= ticket.priority:
+            return False
+
+        logger.info(
+            f"시작 대기 우선순위 상향: {key} ({ticket.severity} → {severity})"
+        )
+        ticket.severity, ticket.tier = promoted.severity, promoted.tier
+        queue = self._sources.get(ticket.source)
+        if queue is not None:
+            queue.heap = [(t.sort_key(), t) for _, t in queue.heap]
+            heapq.heapify(queue.heap)
+        return True
+
+    def _worst_queued(self) -> Optional[AdmissionTicket]:
+        waiting = [
+            ticket
+            for queue in self._sources.values()
+            for _, ticket in queue.heap
+            if not ticket.future.done()
+        ]
+        return max(waiting, key=AdmissionTicket.sort_key, default=None)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """빈 슬롯만큼 다음 요청 승인"""
+        while self._in_flight < self.max_concurrent_starts:
+            ticket = self._next_ticket()
+            if ticket is None:
+                return
+            self._queued -= 1
+            self._in_flight += 1
+            ticket.future.set_result(None)
+
+    def _next_ticket(self) -> Optional[AdmissionTicket]:
+        """
+        가장 급한 우선순위의 출처 중 가장 오래 서비스받지 못한 출처의 요청
+
+        취소/거절된 요청은 여기서 버림
+        """
+        best = None
+        for name, queue in list(self._sources.items()):
+            while queue.heap and queue.heap[0][1].future.done():
+                heapq.heappop(queue.heap)
+            if not queue.heap:
+                del self._sources[name]
+                continue
+            head = queue.heap[0][1]
+            key = (head.priority, queue.last_served, head.seq)
+            if best is None or key < best[0]:
+                best = (key, queue)
+
+        if best is None:
+            return None
+        queue = best[1]
+        _, ticket = heapq.heappop(queue.heap)
+        queue.last_served = next(self._serve_seq)
+        return ticket
+
+    def _record_wait(self, seconds: float):
+        self.admitted += 1
+        self._waits.append(seconds)
+
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def get_stats(self) -> Dict:
+        by_source: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        for name, queue in self._sources.items():
+            for _, ticket in queue.heap:
+                if ticket.future.done():
+                    continue
+                by_source[name] = by_source.get(name, 0) + 1
+                by_severity[ticket.severity] = by_severity.get(ticket.severity, 0) + 1
+
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "queued_by_source": by_source,
+            "queued_by_severity": by_severity,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_p50_seconds": round(percentile(self._waits, 50), 3),
+            "wait_p95_seconds": round(percentile(self._waits, 95), 3),
+            "wait_max_seconds": round(max(self._waits, default=0.0), 3),
+        }
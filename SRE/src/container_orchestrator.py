@@ -4,12 +4,38 @@ Docker 컨테이너 기반 MCP 서버 생명주기 관리
 """
 
 import asyncio
+import logging
+import re
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
 import docker
 from docker.models.containers import Container
-from typing import Dict, Optional, List
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-import logging
+from mcp import types as mcp_types
+
+from .admission import AdmissionController, AdmissionRejected
+from .docker_fleet import DockerFleet, Placement, parse_memory_mb
+from .docker_stdio import open_attach_socket
+from .eviction import EvictionCandidate, TraceEvent, make_policy, save_trace
+from .expiry_scheduler import ExpiryScheduler
+from .image_builder import ImageBuilder
+from .npm_cache import (
+    NPM_CACHE_PATH,
+    NpmCacheStats,
+    ensure_registry_proxy,
+    npm_environment,
+    parse_npm_fetch_log,
+)
+from .readiness import ReadinessProber, ReadinessResult
+from .resource_limits import LimitsAutotuner, cpu_cores_from_stats
+from .session_pool import MCPSessionPool
+from .start_cost import StartCostSample
+from .teardown import TeardownReport, TeardownTarget, teardown_containers
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +50,10 @@ class ContainerStatus:
     last_used_at: datetime
     memory_usage_mb: int = 0
     auto_stop_at: Optional[datetime] = None
+    idle_timeout_minutes: int = 30
+    inflight_requests: int = 0
+    tier: Optional[str] = None
+    host: Optional[str] = None  # 실행 중인 Docker 호스트 이름
 
     def is_idle(self) -> bool:
         """Idle 상태 확인"""
@@ -38,9 +68,33 @@ class ContainerStatus:
     def update_last_used(self):
         """마지막 사용 시간 업데이트"""
         self.last_used_at = datetime.now()
-        # Idle 타임아웃 재설정 (30분)
-        self.auto_stop_at = datetime.now() + timedelta(minutes=30)
-        self.status = "running"
+        # Idle 타임아웃 재설정
+        self.auto_stop_at = self.last_used_at + timedelta(minutes=self.idle_timeout_minutes)
+        # MCP 핸드셰이크 전(starting)이면 상태 유지
+        if self.status != "starting":
+            self.status = "running"
+
+
+@dataclass
+class LaunchSpec:
+    """컨테이너 실행 사양 (레플리카 추가 시에도 동일하게 사용)"""
+    image_tag: Optional[str] = None
+    environment: Dict[str, str] = field(default_factory=dict)
+    tier: Optional[str] = None
+    # 시작 대기열 우선순위 (장애 심각도) 및 공정 큐잉 단위 (요청 출처)
+    severity: str = "medium"
+    source: str = "default"
+
+
+@dataclass
+class ReplicaPolicy:
+    """서버별 레플리카 정책"""
+    min_replicas: int = 1
+    max_replicas: int = 3
+    # 가장 한가한 레플리카의 처리 중 요청 수가 이 값 이상이면 scale-out
+    scale_out_queue_depth: int = 4
+    # min_replicas를 초과하는 레플리카의 Idle 타임아웃 (분)
+    scale_in_idle_minutes: int = 5
 
 
 @dataclass
@@ -49,10 +103,55 @@ class ContainerPoolConfig:
     max_concurrent_containers: int = 10
     idle_timeout_minutes: int = 30
     max_memory_percent: float = 80.0
+    memory_check_interval_seconds: int = 60
     network_name: str = "war-room-network"
     image_prefix: str = "mcp"
     base_memory_limit: str = "200m"
     base_cpu_quota: float = 0.5
+    eviction_policy: str = "greedy_dual_size"  # "lru", "lru_k", "greedy_dual_size"
+    auto_build_images: bool = True
+    base_image: str = "mcp/base:latest"
+    max_parallel_builds: int = 2
+    build_cache_dir: Optional[str] = None
+    # 이미지 캐시 디스크 예산 (초과 시 Cold 티어 이미지 정리)
+    image_cache_budget_mb: int = 5000
+    # Tier 1/2 사전 준비 시 레지스트리 pull 우선 (실패하면 빌드)
+    image_pull_from_registry: bool = False
+    # 모든 풀 컨테이너가 공유하는 npm 캐시 볼륨 (None이면 사용 안 함)
+    npm_cache_volume: Optional[str] = "war-room-npm-cache"
+    # war-room-network 위 로컬 캐싱 레지스트리 프록시 (Verdaccio)
+    npm_registry_proxy: bool = False
+    npm_registry_proxy_image: str = "verdaccio/verdaccio:5"
+    usage_trace_size: int = 10000
+    # MCP initialize + list_tools 성공 시점을 준비 완료로 판단
+    readiness_probe: bool = True
+    readiness_timeout_seconds: float = 120.0
+    # 레플리카별 MCP 세션 유지 (도구 호출 시 attach/핸드셰이크 생략)
+    session_pool: bool = True
+    tool_call_timeout_seconds: float = 60.0
+    # 동시 시작(이미지 준비 포함) 수 제한 및 우선순위 대기열
+    max_concurrent_starts: int = 2
+    admission_queue_size: int = 50
+    # 풀이 가득 차고 퇴출할 컨테이너도 없을 때 빈자리를 기다리는 최대 시간 (초과 시 거절)
+    capacity_wait_seconds: float = 30.0
+    # 풀 종료 시 전체 컨테이너 공통 유예 시간 (초과하면 강제 종료)
+    shutdown_grace_seconds: float = 10.0
+    # 여러 Docker 호스트 사용 시: 호스트 이름 → base_url (비어 있으면 docker.from_env())
+    docker_hosts: Dict[str, str] = field(default_factory=dict)
+    host_info_ttl_seconds: float = 60.0
+    # 서버별 사용량 p95 기반 자원 제한 자동 조정 (base_* 는 샘플이 쌓이기 전 기본값)
+    limits_autotune: bool = True
+    limits_profile_path: Optional[str] = None
+    limits_headroom: float = 1.3
+    limits_min_samples: int = 10
+    # 실행 중인 컨테이너에도 container.update로 즉시 적용
+    limits_live_update: bool = True
+    default_replica_policy: ReplicaPolicy = field(default_factory=ReplicaPolicy)
+    replica_policies: Dict[str, ReplicaPolicy] = field(default_factory=dict)
+
+    def replica_policy(self, mcp_server_name: str) -> ReplicaPolicy:
+        """서버별 레플리카 정책 조회"""
+        return self.replica_policies.get(mcp_server_name, self.default_replica_policy)
 
 
 class ContainerPoolOrchestrator:
@@ -64,38 +163,238 @@ class ContainerPoolOrchestrator:
     - Idle 타임아웃 기반 자동 정리
     - 리소스 모니터링 및 제한
     - 컨테이너 상태 추적
+    - 서버별 레플리카 세트 및 least-loaded 라우팅
+    - 라벨 기반 재시작 후 풀 복구 (reconcile)
     """
 
-    def __init__(self, config: Optional[ContainerPoolConfig] = None):
+    # 풀 컨테이너 라벨 (매니저 재시작 후 재연결용)
+    POOL_LABEL = "war-room.pool"
+    SERVER_LABEL = "war-room.server"
+    TIER_LABEL = "war-room.tier"
+    LAST_USED_LABEL = "war-room.last-used"
+
+    # 시작 비용 측정 전 기본값 (초)
+    DEFAULT_RESTART_COST_SECONDS = 5.0
+
+    def __init__(
+        self,
+        config: Optional[ContainerPoolConfig] = None,
+        docker_client: Optional[docker.DockerClient] = None,
+        fleet: Optional[DockerFleet] = None
+    ):
         """
         Args:
             config: 컨테이너 풀 설정
+            docker_client: Docker 클라이언트 (기본: docker.from_env())
+            fleet: 여러 Docker 호스트 (지정 시 docker_client 대신 사용)
         """
         self.config = config or ContainerPoolConfig()
-        self.docker_client = docker.from_env()
+        if fleet is None:
+            if self.config.docker_hosts and docker_client is None:
+                fleet = DockerFleet.from_endpoints(
+                    self.config.docker_hosts,
+                    info_ttl_seconds=self.config.host_info_ttl_seconds
+                )
+            else:
+                fleet = DockerFleet(
+                    {"local": docker_client or docker.from_env()},
+                    info_ttl_seconds=self.config.host_info_ttl_seconds
+                )
+        self.fleet = fleet
+        # 기본 호스트 (이미지 빌드, 이미지 캐시 관리)
+        self.docker_client = self.fleet.primary.client
+        # 컨테이너 ID → 호스트 자원 예약
+        self._placements: Dict[str, Placement] = {}
         self.containers: Dict[str, ContainerStatus] = {}
+        # 서버 이름 → 레플리카 컨테이너 ID 인덱스 (self.containers와 항상 동기화)
+        self._by_server: Dict[str, Set[str]] = {}
+        # 서버별 진행 중인 레플리카 시작 작업 (single-flight)
+        self._inflight_starts: Dict[str, asyncio.Task] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+        # 승인 후 실행 중인(아직 추적 전) 시작 작업 수 → 풀 용량 계산에 포함
+        self._launching = 0
+        self._capacity_freed = asyncio.Event()
+        # 취소된 시작 작업의 아직 끝나지 않은 containers.run 호출
+        self._abandoned_runs: Set[asyncio.Future] = set()
+
+        # 메모리 압박 시 퇴출 정책과 입력 (서버별 측정 시작 비용, 사용 트레이스)
+        self.eviction_policy = make_policy(self.config.eviction_policy)
+        self._restart_cost: Dict[str, float] = {}
+        self.usage_trace: deque = deque(maxlen=self.config.usage_trace_size)
+
+        # 단계별 시작 비용 측정 (MCP 준비 완료까지 대기 중인 컨테이너 → (측정값, 실행 완료 시점))
+        self._pending_start_costs: Dict[str, tuple] = {}
+        self._start_cost_listeners: List[Callable[[StartCostSample], None]] = []
+
+        # 시작 요청 승인 제어 (심각도/티어 우선순위, 출처별 공정 큐잉)
+        self.admission = AdmissionController(
+            max_concurrent_starts=self.config.max_concurrent_starts,
+            max_queue_size=self.config.admission_queue_size
+        )
+
+        # 서버별 자원 제한 자동 조정 (사용량 p95)
+        self.limits: Optional[LimitsAutotuner] = None
+        if self.config.limits_autotune:
+            self.limits = LimitsAutotuner(
+                self.config.limits_profile_path,
+                headroom=self.config.limits_headroom,
+                min_samples=self.config.limits_min_samples
+            )
+
+        # 패키지를 미리 설치한 서버별 이미지 빌드 큐
+        self.image_builder: Optional[ImageBuilder] = None
+        if self.config.auto_build_images:
+            self.image_builder = ImageBuilder(
+                self.docker_client,
+                base_image=self.config.base_image,
+                max_parallel_builds=self.config.max_parallel_builds,
+                cache_dir=self.config.build_cache_dir
+            )
+        # 레플리카별 MCP 세션 풀 (readiness 프로브 세션을 그대로 재사용)
+        self.sessions: Optional[MCPSessionPool] = None
+        if self.config.session_pool:
+            self.sessions = MCPSessionPool(
+                lambda container_id: self._open_attach_socket(container_id),
+                call_timeout_seconds=self.config.tool_call_timeout_seconds
+            )
+
+        # MCP 레벨 readiness 프로브 (time-to-ready 측정)
+        self.readiness: Optional[ReadinessProber] = None
+        if self.config.readiness_probe:
+            self.readiness = ReadinessProber(
+                self.docker_client,
+                probe_timeout_seconds=self.config.readiness_timeout_seconds,
+                open_socket=lambda container_id: self._open_attach_socket(container_id),
+                session_pool=self.sessions
+            )
+            self.readiness.add_listener(self._on_replica_ready)
+        self.last_teardown: Optional[TeardownReport] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._memory_task: Optional[asyncio.Task] = None
+
+        # auto_stop_at 기반 만료 스케줄러
+        self._expiry = ExpiryScheduler(
+            resolve_deadline=self._resolve_auto_stop,
+            on_expire=self._expire_container
+        )
+
+        # npm 캐시 적중률 (실행 중 컨테이너별 + 종료된 컨테이너 누적)
+        self._npm_cache_stats: Dict[str, NpmCacheStats] = {}
+        self._npm_cache_retired = NpmCacheStats()
+
+        # War Room 네트워크 생성 (호스트마다)
+        for host in self.fleet.hosts.values():
+            self._ensure_network(host.client)
+
+        # npm 레지스트리 프록시 (옵션, 호스트마다 같은 이름으로 실행 → 같은 URL)
+        self._npm_registry_url: Optional[str] = None
+        if self.config.npm_registry_proxy:
+            for host in self.fleet.hosts.values():
+                self._npm_registry_url = ensure_registry_proxy(
+                    host.client,
+                    self.config.network_name,
+                    image=self.config.npm_registry_proxy_image
+                )
 
-        # War Room 네트워크 생성
-        self._ensure_network()
+    def add_start_cost_listener(self, listener: Callable[[StartCostSample], None]):
+        """시작 비용 측정 완료 콜백 등록 (MCP 준비 완료 시, 프로브가 없으면 실행 직후)"""
+        self._start_cost_listeners.append(listener)
 
-    def _ensure_network(self):
+    def _emit_start_cost(self, sample: StartCostSample):
+        for listener in self._start_cost_listeners:
+            try:
+                listener(sample)
+            except Exception as e:
+                logger.error(f"시작 비용 리스너 오류: {e}")
+
+    def _ensure_network(self, client: docker.DockerClient):
         """War Room 전용 네트워크 생성"""
         try:
-            self.docker_client.networks.get(self.config.network_name)
+            client.networks.get(self.config.network_name)
             logger.info(f"네트워크 '{self.config.network_name}' 존재 확인")
         except docker.errors.NotFound:
-            self.docker_client.networks.create(
+            client.networks.create(
                 self.config.network_name,
                 driver="bridge"
             )
             logger.info(f"네트워크 '{self.config.network_name}' 생성 완료")
 
+    async def reconcile(self) -> List[ContainerStatus]:
+        """
+        매니저 재시작 후 실행 중인 풀 컨테이너 재연결
+
+        풀 라벨로 필터링한 목록 조회 한 번으로 기존 컨테이너를 찾아 상태를 복원.
+        라벨의 마지막 사용 시각은 실행 시각이므로, 재연결된 컨테이너에는
+        새 Idle 타임아웃을 부여
+
+        Returns:
+            재연결된 컨테이너 상태 목록
+        """
+        # 저수준 API: 컨테이너별 inspect 없이 호스트당 목록 조회 1회 (호스트 동시 조회)
+        hosts = list(self.fleet.hosts.values())
+        results = await asyncio.gather(*[
+            asyncio.to_thread(
+                host.client.api.containers,
+                filters={
+                    "label": f"{self.POOL_LABEL}={self.config.network_name}",
+                    "status": "running"
+                }
+            )
+            for host in hosts
+        ], return_exceptions=True)
+
+        now = datetime.now()
+        adopted = []
+
+        entries = []
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                logger.error(f"컨테이너 목록 조회 실패: {host.name} ({result})")
+                continue
+            entries.extend((host.name, entry) for entry in result)
+
+        for host_name, entry in entries:
+            container_id = entry["Id"]
+            labels = entry.get("Labels") or {}
+            server_name = labels.get(self.SERVER_LABEL)
+            if not server_name or container_id in self.containers:
+                continue
+
+            try:
+                last_used = datetime.fromisoformat(labels.get(self.LAST_USED_LABEL, ""))
+            except ValueError:
+                last_used = now
+
+            status = ContainerStatus(
+                container_id=container_id,
+                mcp_server_name=server_name,
+                status="idle",
+                started_at=last_used,
+                last_used_at=last_used,
+                auto_stop_at=now + timedelta(minutes=self.config.idle_timeout_minutes),
+                idle_timeout_minutes=self.config.idle_timeout_minutes,
+                tier=labels.get(self.TIER_LABEL) or None,
+                host=host_name
+            )
+            placement = Placement(host_name, *self._container_limits(server_name))
+            self.fleet.reserve(placement.host, placement.memory_mb, placement.cpus)
+            self._placements[container_id] = placement
+            self._track(status)
+            adopted.append(status)
+
+        if adopted:
+            logger.info(f"기존 풀 컨테이너 재연결: {len(adopted)}개")
+
+        return adopted
+
     async def start_container(
         self,
         mcp_server_name: str,
         image_tag: Optional[str] = None,
-        environment: Optional[Dict[str, str]] = None
+        environment: Optional[Dict[str, str]] = None,
+        tier: Optional[str] = None,
+        severity: str = "medium",
+        source: str = "default"
     ) -> ContainerStatus:
         """
         MCP 서버 컨테이너 시작
@@ -104,59 +403,324 @@ class ContainerPoolOrchestrator:
             mcp_server_name: MCP 서버 이름 (예: "docker-mcp")
             image_tag: Docker 이미지 태그 (기본: latest)
             environment: 환경 변수
+            tier: 서버 티어 (컨테이너 라벨에 기록)
+            severity: 장애 심각도 (시작 대기열 우선순위)
+            source: 요청 출처 (출처별 공정 큐잉)
+
+        Raises:
+            AdmissionRejected: 시작 대기열이 가득 찬 경우
 
         Returns:
             ContainerStatus: 시작된 컨테이너 상태
         """
-        # 이미 실행 중인지 확인
+        # 이미 실행 중인 레플리카가 있으면 가장 한가한 것 재사용
         existing = self._find_running_container(mcp_server_name)
         if existing:
             logger.info(f"기존 컨테이너 재사용: {mcp_server_name}")
-            existing.update_last_used()
+            self._touch(existing)
             return existing
 
-        # 동시 실행 제한 확인
-        if len(self.containers) >= self.config.max_concurrent_containers:
-            logger.warning("최대 컨테이너 수 도달, Idle 컨테이너 정리 중...")
-            await self._cleanup_idle_containers()
+        spec = LaunchSpec(image_tag, environment or {}, tier, severity, source)
+        status = await self._start_replica(mcp_server_name, spec)
+        self._ensure_min_replicas(mcp_server_name, spec)
+        return status
+
+    async def acquire(
+        self,
+        mcp_server_name: str,
+        image_tag: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
+        tier: Optional[str] = None,
+        severity: str = "medium",
+        source: str = "default"
+    ) -> ContainerStatus:
+        """
+        요청 처리용 레플리카 획득 (least-loaded 라우팅)
+
+        가장 한가한 레플리카의 처리 중 요청 수가 scale_out_queue_depth 이상이면
+        백그라운드로 레플리카를 추가하고, 현재 요청은 기존 레플리카로 보냄.
+        사용 후 반드시 release() 호출 (또는 lease() 사용)
+
+        Returns:
+            ContainerStatus: 요청이 배정된 레플리카
+        """
+        spec = LaunchSpec(image_tag, environment or {}, tier, severity, source)
+        replica = self._find_running_container(mcp_server_name)
+
+        if replica is None:
+            replica = await self._start_replica(mcp_server_name, spec)
+            self._ensure_min_replicas(mcp_server_name, spec)
+        else:
+            policy = self.config.replica_policy(mcp_server_name)
+            if (replica.inflight_requests >= policy.scale_out_queue_depth
+                    and self._can_scale_out(mcp_server_name)):
+                logger.info(
+                    f"레플리카 scale-out: {mcp_server_name} "
+                    f"(처리 중 {replica.inflight_requests}건)"
+                )
+                self._spawn_replica(mcp_server_name, spec)
+
+        replica.inflight_requests += 1
+        self._touch(replica)
+        return replica
+
+    def release(self, container_id: str):
+        """acquire()로 획득한 레플리카 반환"""
+        status = self.containers.get(container_id)
+        if status is None:
+            return
+
+        status.inflight_requests = max(0, status.inflight_requests - 1)
+        status.update_last_used()
+        if status.inflight_requests == 0 and status.status != "starting":
+            status.status = "idle"
+        self._expiry.schedule(status.container_id, status.auto_stop_at)
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        mcp_server_name: str,
+        image_tag: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
+        tier: Optional[str] = None,
+        severity: str = "medium",
+        source: str = "default"
+    ) -> AsyncIterator[ContainerStatus]:
+        """acquire/release 컨텍스트 매니저"""
+        replica = await self.acquire(
+            mcp_server_name, image_tag, environment, tier, severity, source
+        )
+        try:
+            yield replica
+        finally:
+            self.release(replica.container_id)
 
-        # 이미지 준비
-        image_name = self._get_image_name(mcp_server_name, image_tag)
-        await self._ensure_image(image_name, mcp_server_name)
+    async def _start_replica(
+        self,
+        mcp_server_name: str,
+        spec: LaunchSpec
+    ) -> ContainerStatus:
+        """
+        레플리카 1개 시작 (서버별 single-flight: 진행 중이면 그 결과를 함께 기다림)
+
+        시작 작업은 첫 호출자가 아니라 single-flight 항목이 소유하는 태스크에서 실행.
+        호출자가 취소돼도 다른 대기자와 진행 중인 시작에는 영향 없음
+        """
+        task = self._inflight_starts.get(mcp_server_name)
+        joined = task is not None
+        if joined:
+            logger.info(f"진행 중인 컨테이너 시작 대기: {mcp_server_name}")
+            # 백그라운드 레플리카 시작에 급한 요청이 합류하면 대기열 우선순위 상향
+            self.admission.promote(mcp_server_name, spec.severity, spec.tier)
+        else:
+            task = asyncio.create_task(self._run_start(mcp_server_name, spec))
+            self._inflight_starts[mcp_server_name] = task
+            task.add_done_callback(
+                lambda done, name=mcp_server_name: self._on_start_done(name, done)
+            )
+
+        # asyncio.wait는 호출자 자신이 취소될 때만 CancelledError를 내고 task는 취소하지 않음
+        # → 호출자 취소와 시작 작업 취소(풀 종료 등)가 겹쳐도 호출자 취소가 유지됨
+        await asyncio.wait({task})
+        if task.cancelled():
+            raise RuntimeError(f"컨테이너 시작 취소됨: {mcp_server_name}")
+        status = task.result()
+
+        if joined:
+            self._touch(status)
+        return status
+
+    async def _run_start(
+        self,
+        mcp_server_name: str,
+        spec: LaunchSpec
+    ) -> ContainerStatus:
+        """single-flight 시작 작업 본체"""
+        # 이미지 준비 + 실행은 승인된 슬롯 안에서만 (버스트 시 데몬 과부하 방지)
+        async with self.admission.slot(
+            spec.severity, spec.tier, spec.source, key=mcp_server_name
+        ) as waited:
+            if waited > 0:
+                logger.info(f"시작 대기 {waited:.1f}초: {mcp_server_name}")
+            await self._reserve_capacity()
+            try:
+                return await self._launch_container(mcp_server_name, spec)
+            finally:
+                self._launching -= 1
+
+    def _on_start_done(self, mcp_server_name: str, task: asyncio.Task):
+        """시작 작업 종료 시 single-flight 항목 정리 (대기자 재개 전에 실행됨)"""
+        if self._inflight_starts.get(mcp_server_name) is task:
+            del self._inflight_starts[mcp_server_name]
+        if not task.cancelled():
+            task.exception()  # 대기자가 모두 떠났어도 경고가 남지 않도록 조회 처리
+
+    def _spawn_replica(
+        self,
+        mcp_server_name: str,
+        spec: LaunchSpec
+    ):
+        """레플리카를 백그라운드로 추가 (이미 시작 중이면 무시, 대기열 최하위 우선순위)"""
+        if mcp_server_name in self._inflight_starts:
+            return
+        spec = replace(spec, severity="background", source="pool")
+
+        async def spawn():
+            try:
+                await self._start_replica(mcp_server_name, spec)
+            except Exception as e:
+                logger.error(f"레플리카 추가 실패: {mcp_server_name} ({e})")
+                return
+            # min_replicas까지 하나씩 계속 채움
+            self._ensure_min_replicas(mcp_server_name, spec)
+
+        self._run_in_background(spawn())
+
+    def _run_in_background(self, coro) -> asyncio.Task:
+        """종료 시 함께 정리되는 백그라운드 작업 실행"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _ensure_min_replicas(
+        self,
+        mcp_server_name: str,
+        spec: LaunchSpec
+    ):
+        """min_replicas 미만이면 백그라운드로 레플리카 추가"""
+        policy = self.config.replica_policy(mcp_server_name)
+        if (self.replica_count(mcp_server_name) < policy.min_replicas
+                and self._can_scale_out(mcp_server_name)):
+            self._spawn_replica(mcp_server_name, spec)
+
+    def _can_scale_out(self, mcp_server_name: str) -> bool:
+        """레플리카 추가 가능 여부 (서버별 max_replicas, 풀 전체 max_concurrent_containers)"""
+        policy = self.config.replica_policy(mcp_server_name)
+        pending = len(self._inflight_starts)
+        return (
+            self.replica_count(mcp_server_name) < policy.max_replicas
+            and len(self.containers) + pending < self.config.max_concurrent_containers
+        )
+
+    def replica_count(self, mcp_server_name: str) -> int:
+        """서버의 현재 레플리카 수"""
+        return len(self._by_server.get(mcp_server_name, ()))
+
+    async def _launch_container(
+        self,
+        mcp_server_name: str,
+        spec: LaunchSpec
+    ) -> ContainerStatus:
+        """새 컨테이너 실행 (start_container의 single-flight 내부에서만 호출)"""
+        launch_started = time.monotonic()
+
+        # 호스트 선택 (여유 자원 + 레플리카 분산)
+        await self.fleet.refresh()
+        memory_mb, cpus = self._container_limits(mcp_server_name)
+        placement = self.fleet.place(memory_mb, cpus, self._replica_hosts(mcp_server_name))
+        client = self.fleet.client(placement.host)
+
+        # 이미지 준비 (선택된 호스트에)
+        image_name = self._get_image_name(mcp_server_name, spec.image_tag)
+        image_started = time.monotonic()
+        try:
+            image_prepared = await self._ensure_image(
+                image_name, mcp_server_name, spec, placement.host
+            )
+        except BaseException:
+            self.fleet.release(placement)
+            raise
+        image_seconds = time.monotonic() - image_started
+
+        # min_replicas를 넘는 레플리카는 짧은 Idle 타임아웃으로 scale-in
+        policy = self.config.replica_policy(mcp_server_name)
+        idle_timeout = self.config.idle_timeout_minutes
+        if self.replica_count(mcp_server_name) >= policy.min_replicas:
+            idle_timeout = min(idle_timeout, policy.scale_in_idle_minutes)
 
         # 컨테이너 시작
-        container_name = f"{mcp_server_name}-{int(datetime.now().timestamp())}"
+        container_name = self._container_name(mcp_server_name)
+        launched_at = datetime.now()
+        labels = {
+            self.POOL_LABEL: self.config.network_name,
+            self.SERVER_LABEL: mcp_server_name,
+            self.TIER_LABEL: spec.tier or "",
+            # 라벨은 생성 후 변경 불가 → 실행 시각을 마지막 사용 시각으로 기록
+            self.LAST_USED_LABEL: launched_at.isoformat(),
+        }
 
+        # 레플리카로 추적되기 전에 실패하면(예외 종류 무관) 호스트 예약 반환
+        owns_placement = True
         try:
-            container = self.docker_client.containers.run(
+            run_started = time.monotonic()
+            run = asyncio.ensure_future(asyncio.to_thread(
+                client.containers.run,
                 image=image_name,
                 name=container_name,
                 network=self.config.network_name,
                 detach=True,
                 remove=False,  # 수동 관리
-                mem_limit=self.config.base_memory_limit,
-                cpu_quota=int(self.config.base_cpu_quota * 100000),
-                environment=environment or {},
+                mem_limit=f"{placement.memory_mb}m",
+                cpu_quota=int(placement.cpus * 100000),
+                environment={**self._npm_environment(), **spec.environment},
+                volumes=self._npm_volumes(),
+                labels=labels,
                 # 보안 옵션
                 read_only=False,  # MCP 서버는 write 필요할 수 있음
                 security_opt=["no-new-privileges"],
                 # stdin 유지 (MCP 서버는 stdio 사용)
                 stdin_open=True,
                 tty=False
-            )
+            ))
+            try:
+                container = await asyncio.shield(run)
+            except asyncio.CancelledError:
+                # run 스레드는 계속 진행 → 뜨는 즉시 제거 (추적되지 않는 고아 방지)
+                self._abandoned_runs.add(run)
+                run.add_done_callback(self._discard_abandoned_container)
+                raise
 
-            logger.info(f"컨테이너 시작 완료: {container_name} ({container.short_id})")
+            logger.info(
+                f"컨테이너 시작 완료: {container_name} ({container.short_id}, 호스트: {placement.host})"
+            )
+            # 컨테이너 생성과 시작은 containers.run 한 번의 호출이라 합쳐서 측정
+            run_finished = time.monotonic()
+            cost = StartCostSample(
+                server_name=mcp_server_name,
+                image_seconds=image_seconds,
+                run_seconds=run_finished - run_started,
+                ready_seconds=0.0,
+                image_prepared=bool(image_prepared)
+            )
 
-            # 상태 추적
+            # 상태 추적 (readiness 프로브가 있으면 핸드셰이크 성공 시 running)
             status = ContainerStatus(
                 container_id=container.id,
                 mcp_server_name=mcp_server_name,
-                status="running",
-                started_at=datetime.now(),
-                last_used_at=datetime.now(),
-                auto_stop_at=datetime.now() + timedelta(minutes=self.config.idle_timeout_minutes)
+                status="starting" if self.readiness else "running",
+                started_at=launched_at,
+                last_used_at=launched_at,
+                auto_stop_at=launched_at + timedelta(minutes=idle_timeout),
+                idle_timeout_minutes=idle_timeout,
+                tier=spec.tier,
+                host=placement.host
             )
-            self.containers[container.id] = status
+            self._placements[container.id] = placement
+            owns_placement = False
+            self._track(status)
+            if not self.readiness:
+                self._record_restart_cost(mcp_server_name, time.monotonic() - launch_started)
+                self._emit_start_cost(cost)
+            else:
+                # ready_seconds는 launch_started 기준 → 실행 완료까지의 시간을 빼서 MCP 준비 단계만
+                self._pending_start_costs[container.id] = (cost, run_finished - launch_started)
+            self._record_access(status)
+            if self.readiness:
+                probe = self.readiness.start_probe(container.id, mcp_server_name, launch_started)
+                probe.add_done_callback(
+                    lambda task, container_id=container.id: self._on_probe_done(container_id, task)
+                )
 
             return status
 
@@ -166,6 +730,122 @@ class ContainerPoolOrchestrator:
         except docker.errors.APIError as e:
             logger.error(f"컨테이너 시작 실패: {e}")
             raise
+        finally:
+            if owns_placement:
+                self.fleet.release(placement)
+
+    def _discard_abandoned_container(self, run: asyncio.Future):
+        """시작 작업이 취소된 뒤 실행이 끝난 컨테이너 제거"""
+        self._abandoned_runs.discard(run)
+        if run.cancelled() or run.exception() is not None:
+            return
+        container = run.result()
+        logger.info(f"취소된 시작 작업의 컨테이너 제거: {container.short_id}")
+        self._run_in_background(asyncio.to_thread(container.remove, force=True))
+
+    async def wait_ready(
+        self,
+        container_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[ReadinessResult]:
+        """
+        MCP 서버 준비 완료(initialize + list_tools 성공)까지 대기
+
+        Returns:
+            ReadinessResult (프로브 비활성화 또는 재연결된 컨테이너면 None)
+
+        Raises:
+            asyncio.TimeoutError: timeout 내에 준비되지 않음
+            ReadinessError: 핸드셰이크 실패 (컨테이너는 종료됨)
+        """
+        if self.readiness is None:
+            return None
+        return await self.readiness.wait_ready(container_id, timeout)
+
+    def _on_replica_ready(self, result: ReadinessResult):
+        """핸드셰이크 성공 → running 전환, 실제 time-to-ready를 재시작 비용으로 기록"""
+        status = self.containers.get(result.container_id)
+        if status is None:
+            return
+        if status.status == "starting":
+            status.status = "running"
+        self._record_restart_cost(result.server_name, result.ready_seconds)
+
+        pending = self._pending_start_costs.pop(result.container_id, None)
+        if pending:
+            cost, run_offset = pending
+            cost.ready_seconds = max(result.ready_seconds - run_offset, 0.0)
+            self._emit_start_cost(cost)
+
+    def _on_probe_done(self, container_id: str, task: asyncio.Task):
+        """핸드셰이크 실패한 컨테이너 종료 (다음 요청은 새 레플리카로)"""
+        if task.cancelled() or task.exception() is None:
+            return
+        if container_id not in self.containers:
+            return
+
+        logger.error(f"MCP readiness 실패, 컨테이너 종료: {task.exception()}")
+        self._run_in_background(self.stop_container(container_id, force=True))
+
+    async def call_tool(
+        self,
+        mcp_server_name: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        image_tag: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
+        tier: Optional[str] = None
+    ) -> mcp_types.CallToolResult:
+        """
+        MCP 도구 호출 (least-loaded 레플리카의 유지 중인 세션 사용)
+
+        레플리카가 없으면 시작하고, 핸드셰이크 중이면 완료를 기다림.
+        연결이 끊겨 있으면 재연결 후 1회 재시도
+        """
+        if self.sessions is None:
+            raise RuntimeError("MCP 세션 풀이 비활성화되어 있음 (session_pool=False)")
+
+        async with self.lease(mcp_server_name, image_tag, environment, tier) as replica:
+            return await self.sessions.call_tool(
+                replica.container_id, mcp_server_name, tool_name, arguments, timeout
+            )
+
+    async def list_tools(self, mcp_server_name: str) -> List[mcp_types.Tool]:
+        """서버 도구 목록 (캐시 우선, 없으면 레플리카에 연결해 조회)"""
+        if self.sessions is None:
+            raise RuntimeError("MCP 세션 풀이 비활성화되어 있음 (session_pool=False)")
+
+        cached = self.sessions.cached_tools(mcp_server_name)
+        if cached is not None:
+            return cached
+
+        async with self.lease(mcp_server_name) as replica:
+            pooled = await self.sessions.connect(replica.container_id, mcp_server_name)
+            return pooled.tools
+
+    def _open_attach_socket(self, container_id: str):
+        """컨테이너 stdio attach 소켓 (블로킹)"""
+        status = self.containers.get(container_id)
+        return open_attach_socket(self.fleet.client(status.host if status else None), container_id)
+
+    def _host_of(self, status: ContainerStatus) -> str:
+        return status.host or self.fleet.primary.name
+
+    def _replica_hosts(self, mcp_server_name: str) -> List[str]:
+        """서버 레플리카가 실행 중인 호스트 목록 (중복 포함)"""
+        return [
+            self._host_of(self.containers[container_id])
+            for container_id in self._by_server.get(mcp_server_name, ())
+        ]
+
+    def _container_limits(self, mcp_server_name: str) -> tuple:
+        """컨테이너 자원 제한 (메모리 MB, CPU 코어, 자동 조정 시 p95 기반)"""
+        memory_mb = parse_memory_mb(self.config.base_memory_limit)
+        cpus = self.config.base_cpu_quota
+        if self.limits:
+            return self.limits.recommend(mcp_server_name, memory_mb, cpus)
+        return memory_mb, cpus
 
     async def stop_container(self, container_id: str, force: bool = False):
         """
@@ -182,17 +862,22 @@ class ContainerPoolOrchestrator:
         status = self.containers[container_id]
 
         try:
-            container = self.docker_client.containers.get(container_id)
+            container = await asyncio.to_thread(
+                self.fleet.client(status.host).containers.get, container_id
+            )
 
             if force:
-                container.kill()
+                await asyncio.to_thread(container.kill)
                 logger.info(f"컨테이너 강제 종료: {status.mcp_server_name}")
             else:
-                container.stop(timeout=10)
+                await asyncio.to_thread(container.stop, timeout=10)
                 logger.info(f"컨테이너 정상 종료: {status.mcp_server_name}")
 
+            # 제거 전 npm 캐시 통계 수집
+            await asyncio.to_thread(self._collect_npm_cache_stats, container)
+
             # 컨테이너 제거
-            container.remove()
+            await asyncio.to_thread(container.remove)
 
         except docker.errors.NotFound:
             logger.warning(f"컨테이너가 이미 종료됨: {container_id}")
@@ -200,7 +885,33 @@ class ContainerPoolOrchestrator:
             logger.error(f"컨테이너 종료 실패: {e}")
         finally:
             # 상태에서 제거
-            del self.containers[container_id]
+            self._untrack(container_id)
+
+    async def stop_all(self, grace_seconds: Optional[float] = None) -> TeardownReport:
+        """
+        모든 컨테이너 일괄 종료
+
+        컨테이너마다 stop(timeout)을 순서대로 기다리지 않고 시그널 전송 → 공통
+        데드라인 대기 → 남은 컨테이너 강제 종료 → 동시 제거
+
+        Args:
+            grace_seconds: 공통 유예 시간 (기본: config.shutdown_grace_seconds)
+        """
+        statuses = list(self.containers.values())
+        report = await teardown_containers(
+            [
+                TeardownTarget(s.container_id, s.mcp_server_name, self.fleet.client(s.host))
+                for s in statuses
+            ],
+            grace_seconds=(
+                self.config.shutdown_grace_seconds if grace_seconds is None else grace_seconds
+            ),
+            before_remove=self._collect_npm_cache_stats
+        )
+        for status in statuses:
+            self._untrack(status.container_id)
+        self.last_teardown = report
+        return report
 
     async def get_container_status(self, container_id: str) -> Optional[ContainerStatus]:
         """컨테이너 상태 조회"""
@@ -217,14 +928,17 @@ class ContainerPoolOrchestrator:
     async def _sync_container_status(self, container_id: str):
         """Docker 상태와 동기화"""
         try:
-            container = self.docker_client.containers.get(container_id)
             status = self.containers[container_id]
+            container = self.fleet.client(status.host).containers.get(container_id)
 
             # 메모리 사용량 업데이트
             stats = container.stats(stream=False)
             memory_usage = stats['memory_stats'].get('usage', 0)
             status.memory_usage_mb = memory_usage // (1024 * 1024)
 
+            # npm 캐시 적중률 갱신
+            self._collect_npm_cache_stats(container)
+
             # Docker 상태 확인
             container.reload()
             if container.status != "running":
@@ -234,23 +948,35 @@ class ContainerPoolOrchestrator:
         except docker.errors.NotFound:
             # 컨테이너가 외부에서 삭제됨
             logger.warning(f"컨테이너가 삭제됨: {container_id}")
-            del self.containers[container_id]
+            self._untrack(container_id)
 
     async def _cleanup_idle_containers(self):
-        """Idle 상태의 컨테이너 정리"""
-        now = datetime.now()
-        to_stop = []
+        """Idle 타임아웃이 지난 컨테이너 정리 (만료 스케줄러 기반, 전체 스캔 없음)"""
+        for container_id in self._expiry.pop_due():
+            await self._expire_container(container_id)
+
+    def _resolve_auto_stop(self, container_id: str) -> Optional[datetime]:
+        """만료 스케줄러용 현재 데드라인 조회"""
+        status = self.containers.get(container_id)
+        return status.auto_stop_at if status else None
+
+    async def _expire_container(self, container_id: str):
+        """데드라인 도달 컨테이너 종료"""
+        status = self.containers.get(container_id)
+        if status is None or not status.should_stop():
+            return
 
-        for container_id, status in self.containers.items():
-            if status.should_stop():
-                to_stop.append(container_id)
-                logger.info(
-                    f"Idle 타임아웃으로 종료 예정: {status.mcp_server_name} "
-                    f"(마지막 사용: {(now - status.last_used_at).seconds // 60}분 전)"
-                )
+        # 처리 중인 요청이 있으면 종료하지 않고 재예약
+        if status.inflight_requests > 0:
+            self._touch(status)
+            return
 
-        for container_id in to_stop:
-            await self.stop_container(container_id)
+        idle_minutes = int((datetime.now() - status.last_used_at).total_seconds() // 60)
+        logger.info(
+            f"Idle 타임아웃으로 종료: {status.mcp_server_name} "
+            f"(마지막 사용: {idle_minutes}분 전)"
+        )
+        await self.stop_container(container_id)
 
     async def start_auto_cleanup(self):
         """자동 정리 태스크 시작 (백그라운드)"""
@@ -258,70 +984,285 @@ class ContainerPoolOrchestrator:
             logger.warning("자동 정리 태스크가 이미 실행 중")
             return
 
-        async def cleanup_loop():
+        async def memory_loop():
             while True:
                 try:
-                    await asyncio.sleep(60)  # 1분마다 체크
-                    await self._cleanup_idle_containers()
+                    await asyncio.sleep(self.config.memory_check_interval_seconds)
                     await self._check_memory_pressure()
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    logger.error(f"자동 정리 오류: {e}")
+                    logger.error(f"메모리 확인 오류: {e}")
 
-        self._cleanup_task = asyncio.create_task(cleanup_loop())
+        # Idle 만료는 다음 데드라인까지 정확히 sleep, 메모리 압박은 주기 확인
+        self._cleanup_task = asyncio.create_task(self._expiry.run())
+        self._memory_task = asyncio.create_task(memory_loop())
         logger.info("자동 정리 태스크 시작")
 
     async def stop_auto_cleanup(self):
         """자동 정리 태스크 중지"""
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
+        for task in (self._cleanup_task, self._memory_task):
+            if task is None:
+                continue
+            task.cancel()
             try:
-                await self._cleanup_task
+                await task
             except asyncio.CancelledError:
                 pass
+
+        if self._cleanup_task:
             self._cleanup_task = None
+            self._memory_task = None
             logger.info("자동 정리 태스크 중지")
 
     async def _check_memory_pressure(self):
-        """메모리 압박 확인 및 대응"""
-        # Docker 시스템 정보 조회
-        info = self.docker_client.info()
-        total_memory = info.get('MemTotal', 0)
+        """메모리 압박 확인 및 대응 (호스트별, 퇴출 정책 기반)"""
+        # 호스트 총 메모리 (info 캐시, TTL 지나면 갱신)
+        await self.fleet.refresh()
+
+        # 전체 컨테이너 메모리 사용량 계산
+        await self._refresh_memory_usage()
+
+        for host in list(self.fleet.hosts.values()):
+            await self._relieve_memory_pressure(host.name, host.mem_total_mb)
+
+        # 측정 사용량으로 자원 제한 조정
+        if self.limits:
+            if self.config.limits_live_update:
+                await self._apply_tuned_limits()
+            self.limits.save()
 
-        if total_memory == 0:
+    async def _relieve_memory_pressure(self, host_name: str, total_memory_mb: int):
+        """호스트 1개의 메모리 압박 대응"""
+        if total_memory_mb == 0:
             return
 
-        # 전체 컨테이너 메모리 사용량 계산
-        total_used = sum(status.memory_usage_mb for status in self.containers.values())
-        usage_percent = (total_used * 1024 * 1024 / total_memory) * 100
+        on_host = [s for s in self.containers.values() if self._host_of(s) == host_name]
+        total_used = sum(status.memory_usage_mb for status in on_host)
+        usage_percent = total_used / total_memory_mb * 100
+
+        if usage_percent <= self.config.max_memory_percent:
+            return
 
-        if usage_percent > self.config.max_memory_percent:
+        logger.warning(
+            f"메모리 압박 감지 ({host_name}): {usage_percent:.1f}% "
+            f"(임계값: {self.config.max_memory_percent}%)"
+        )
+
+        # 목표치(임계값 - 10%) 아래로 내려갈 때까지 확보
+        target_mb = total_memory_mb * (self.config.max_memory_percent - 10) / 100
+        candidates = [
+            self._eviction_candidate(status)
+            for status in on_host
+            if status.inflight_requests == 0 and status.status in ["running", "idle"]
+        ]
+        victims = self.eviction_policy.select_victims(candidates, total_used - target_mb)
+
+        for victim in victims:
+            logger.info(
+                f"메모리 확보를 위해 종료: {victim.server_name} "
+                f"({victim.memory_mb}MB, 정책: {self.eviction_policy.name})"
+            )
+            self.eviction_policy.on_evict(victim)
+            await self.stop_container(victim.key)
+
+        total_used = sum(
+            s.memory_usage_mb for s in self.containers.values()
+            if self._host_of(s) == host_name
+        )
+        if total_used <= target_mb:
+            logger.info(f"메모리 압박 해소됨 ({host_name})")
+        else:
             logger.warning(
-                f"메모리 압박 감지: {usage_percent:.1f}% "
-                f"(임계값: {self.config.max_memory_percent}%)"
+                f"메모리 압박 지속 ({host_name}): {total_used}MB (퇴출 가능한 컨테이너 부족)"
             )
 
-            # Idle 상태인 것부터 종료
-            idle_containers = [
-                (cid, status) for cid, status in self.containers.items()
-                if status.is_idle()
-            ]
+    async def _refresh_memory_usage(self):
+        """모든 컨테이너 메모리/CPU 사용량 동시 갱신"""
+        def read_usage(container_id: str, host: Optional[str]) -> Optional[tuple]:
+            try:
+                stats = self.fleet.client(host).containers.get(container_id).stats(stream=False)
+                memory_mb = stats['memory_stats'].get('usage', 0) // (1024 * 1024)
+                return memory_mb, cpu_cores_from_stats(stats)
+            except docker.errors.NotFound:
+                return None
+
+        statuses = list(self.containers.values())
+        usages = await asyncio.gather(*[
+            asyncio.to_thread(read_usage, status.container_id, status.host)
+            for status in statuses
+        ])
+
+        for status, usage in zip(statuses, usages):
+            if status.container_id not in self.containers:
+                continue
+            if usage is None:
+                logger.warning(f"컨테이너가 삭제됨: {status.container_id}")
+                self._untrack(status.container_id)
+                continue
+
+            status.memory_usage_mb, cpus = usage
+            if self.limits and status.status != "starting":
+                placement = self._placements.get(status.container_id)
+                self.limits.observe(
+                    status.mcp_server_name,
+                    status.memory_usage_mb,
+                    cpus,
+                    memory_limit_mb=placement.memory_mb if placement else 0,
+                    cpu_limit=placement.cpus if placement else 0.0
+                )
 
-            # Idle 시간 순으로 정렬 (오래된 것부터)
-            idle_containers.sort(key=lambda x: x[1].last_used_at)
+        # 배치 판단용 호스트별 측정 사용량
+        for host in self.fleet.hosts.values():
+            host.used_memory_mb = sum(
+                s.memory_usage_mb for s in self.containers.values()
+                if self._host_of(s) == host.name
+            )
 
-            for container_id, status in idle_containers:
-                logger.info(f"메모리 확보를 위해 종료: {status.mcp_server_name}")
-                await self.stop_container(container_id)
+    async def _apply_tuned_limits(self):
+        """추천 제한이 현재 제한과 10% 이상 다른 컨테이너에 container.update 적용"""
+        def update(container_id: str, host: Optional[str], memory_mb: int, cpus: float):
+            self.fleet.client(host).containers.get(container_id).update(
+                mem_limit=f"{memory_mb}m",
+                memswap_limit=f"{memory_mb * 2}m",
+                cpu_quota=int(cpus * 100000)
+            )
 
-                # 다시 확인
-                total_used = sum(s.memory_usage_mb for s in self.containers.values())
-                usage_percent = (total_used * 1024 * 1024 / total_memory) * 100
+        for status in list(self.containers.values()):
+            placement = self._placements.get(status.container_id)
+            if placement is None:
+                continue
+            memory_mb, cpus = self._container_limits(status.mcp_server_name)
+            # 현재 사용량보다 작게 줄이지 않음 (즉시 OOM 방지)
+            memory_mb = max(memory_mb, status.memory_usage_mb)
+            if (
+                abs(memory_mb - placement.memory_mb) < placement.memory_mb * 0.1
+                and abs(cpus - placement.cpus) < placement.cpus * 0.1
+            ):
+                continue
 
-                if usage_percent < (self.config.max_memory_percent - 10):
-                    logger.info("메모리 압박 해소됨")
-                    break
+            try:
+                await asyncio.to_thread(
+                    update, status.container_id, status.host, memory_mb, cpus
+                )
+            except docker.errors.APIError as e:
+                logger.warning(f"자원 제한 변경 실패: {status.mcp_server_name} ({e})")
+                continue
+            if self._placements.get(status.container_id) is not placement:
+                continue  # 변경 중 종료됨
+
+            logger.info(
+                f"자원 제한 조정: {status.mcp_server_name} "
+                f"{placement.memory_mb}MB/{placement.cpus} → {memory_mb}MB/{cpus} CPU"
+            )
+            self.fleet.release(placement)
+            self.fleet.reserve(placement.host, memory_mb, cpus)
+            self._placements[status.container_id] = Placement(placement.host, memory_mb, cpus)
+
+    async def _reserve_capacity(self):
+        """
+        풀 빈자리 1개 예약 (승인 슬롯을 잡은 상태에서 호출, 실행 후 _launching 감소)
+
+        가득 찼으면 Idle 정리 → 퇴출 → 빈자리 대기 순. 최대 컨테이너 수를 넘겨 실행하지 않음
+
+        Raises:
+            AdmissionRejected: capacity_wait_seconds 안에 빈자리가 나지 않은 경우
+        """
+        deadline = time.monotonic() + self.config.capacity_wait_seconds
+        cleaned = False
+
+        while len(self.containers) + self._launching >= self.config.max_concurrent_containers:
+            if not cleaned:
+                logger.warning("최대 컨테이너 수 도달, Idle 컨테이너 정리 중...")
+                await self._cleanup_idle_containers()
+                cleaned = True
+                continue
+            if await self._evict_for_capacity():
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AdmissionRejected(
+                    f"풀 용량 부족: 최대 {self.config.max_concurrent_containers}개 모두 사용 중"
+                )
+            self._capacity_freed.clear()
+            try:
+                await asyncio.wait_for(self._capacity_freed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+        self._launching += 1
+
+    async def _evict_for_capacity(self) -> bool:
+        """풀이 가득 찼을 때 처리 중 요청이 없는 컨테이너 1개를 퇴출 정책 순서로 종료"""
+        candidates = [
+            self._eviction_candidate(status)
+            for status in self.containers.values()
+            if status.inflight_requests == 0 and status.status in ["running", "idle"]
+        ]
+        if not candidates:
+            return False
+
+        victim = min(candidates, key=self.eviction_policy.priority)
+        logger.info(
+            f"풀 용량 확보를 위해 종료: {victim.server_name} (정책: {self.eviction_policy.name})"
+        )
+        self.eviction_policy.on_evict(victim)
+        await self.stop_container(victim.key)
+        return True
+
+    def _eviction_candidate(self, status: ContainerStatus) -> EvictionCandidate:
+        """퇴출 정책 입력 생성"""
+        return EvictionCandidate(
+            key=status.container_id,
+            server_name=status.mcp_server_name,
+            memory_mb=status.memory_usage_mb,
+            restart_cost_seconds=self._restart_cost.get(
+                status.mcp_server_name, self.DEFAULT_RESTART_COST_SECONDS
+            ),
+            tier=status.tier,
+            last_used_at=status.last_used_at
+        )
+
+    def _record_restart_cost(self, mcp_server_name: str, seconds: float):
+        """측정된 시작 비용 기록 (EWMA)"""
+        previous = self._restart_cost.get(mcp_server_name)
+        self._restart_cost[mcp_server_name] = (
+            seconds if previous is None else 0.7 * previous + 0.3 * seconds
+        )
+
+    def _npm_environment(self) -> Dict[str, str]:
+        """공용 npm 캐시/레지스트리 프록시 환경 변수"""
+        if not self.config.npm_cache_volume and not self._npm_registry_url:
+            return {}
+        return npm_environment(self._npm_registry_url)
+
+    def _npm_volumes(self) -> Dict[str, Dict[str, str]]:
+        """공용 npm 캐시 볼륨 마운트"""
+        if not self.config.npm_cache_volume:
+            return {}
+        return {self.config.npm_cache_volume: {"bind": NPM_CACHE_PATH, "mode": "rw"}}
+
+    def _collect_npm_cache_stats(self, container: Container):
+        """컨테이너 stderr의 npm fetch 로그로 캐시 적중률 갱신"""
+        try:
+            logs = container.logs(stdout=False, stderr=True)
+        except docker.errors.APIError:
+            return
+        if isinstance(logs, bytes):
+            logs = logs.decode(errors="replace")
+        self._npm_cache_stats[container.id] = parse_npm_fetch_log(logs)
+
+    def get_npm_cache_stats(self) -> NpmCacheStats:
+        """npm 캐시 적중률 (풀 전체 누적)"""
+        total = self._npm_cache_retired
+        for stats in self._npm_cache_stats.values():
+            total = total + stats
+        return total
+
+    def export_usage_trace(self, path: str):
+        """퇴출 정책 시뮬레이션용 사용 트레이스 저장 (JSON Lines)"""
+        save_trace(self.usage_trace, path)
 
     def _get_image_name(self, mcp_server_name: str, tag: Optional[str] = None) -> str:
         """이미지 이름 생성"""
@@ -338,39 +1279,101 @@ class ContainerPoolOrchestrator:
 
         return image_name
 
-    async def _ensure_image(self, image_name: str, mcp_server_name: str):
+    async def _ensure_image(
+        self,
+        image_name: str,
+        mcp_server_name: str,
+        spec: Optional[LaunchSpec] = None,
+        host: Optional[str] = None
+    ) -> bool:
         """
-        이미지 존재 확인 및 다운로드
+        이미지 존재 확인 및 빌드
+
+        이미지가 없으면 MCP_PACKAGE 환경 변수의 패키지를 미리 설치한 이미지를 빌드
+        (진행 중인 빌드가 있으면 합류). 빌드는 기본 호스트에서 하고,
+        다른 호스트에는 기본 호스트 이미지를 복사
 
-        이미지가 없으면 빌드 또는 풀
-        실제로는 Tier에 따라 다른 전략 사용
+        Returns:
+            이미지를 새로 준비(빌드/복사)했으면 True, 이미 있었으면 False
         """
         try:
-            self.docker_client.images.get(image_name)
+            await asyncio.to_thread(self.fleet.client(host).images.get, image_name)
             logger.info(f"이미지 존재 확인: {image_name}")
+            return False
         except docker.errors.ImageNotFound:
-            logger.info(f"이미지가 없음, 빌드 필요: {image_name}")
-            # 실제로는 MCP 서버 패키지를 기반으로 이미지 빌드
-            # 지금은 간단히 기본 이미지 태그만 시도
+            pass
+
+        if host and host != self.fleet.primary.name:
+            await self._ensure_image(image_name, mcp_server_name, spec)
+            await self.fleet.distribute_image(image_name, host)
+            return True
+
+        package = spec.environment.get("MCP_PACKAGE") if spec else None
+        if self.image_builder is None or not package:
             raise docker.errors.ImageNotFound(
                 f"이미지를 찾을 수 없습니다: {image_name}\n"
                 f"MCP 서버 '{mcp_server_name}'의 이미지를 빌드해주세요."
             )
 
-    async def shutdown(self):
-        """오케스트레이터 종료 및 정리"""
+        logger.info(f"이미지가 없음, 빌드 시작: {image_name}")
+        await self.image_builder.build(
+            mcp_server_name,
+            package,
+            spec.environment.get("MCP_VERSION", "latest"),
+            image_name
+        )
+        return True
+
+    def schedule_image_build(
+        self,
+        mcp_server_name: str,
+        package: str,
+        version: str
+    ) -> Optional[asyncio.Task]:
+        """서버 이미지 백그라운드 빌드 예약 (빌더가 꺼져 있으면 None)"""
+        if self.image_builder is None:
+            return None
+        image_name = self._get_image_name(mcp_server_name)
+        return self.image_builder.schedule(mcp_server_name, package, version, image_name)
+
+    async def shutdown(self, detach: bool = False):
+        """
+        오케스트레이터 종료 및 정리
+
+        Args:
+            detach: True면 컨테이너를 종료하지 않고 남겨둠 (다음 매니저가 reconcile로 재연결)
+        """
         logger.info("컨테이너 풀 종료 중...")
 
         # 자동 정리 중지
         await self.stop_auto_cleanup()
 
-        # 모든 컨테이너 종료
-        container_ids = list(self.containers.keys())
-        for container_id in container_ids:
-            await self.stop_container(container_id)
+        # 진행 중인 시작 작업과 레플리카 추가 작업 정리
+        starts = list(self._inflight_starts.values())
+        for task in starts + list(self._background_tasks):
+            task.cancel()
+        await asyncio.gather(*starts, *self._background_tasks, return_exceptions=True)
+        # 취소된 시작 작업의 컨테이너가 뜨면 제거될 때까지 대기
+        await asyncio.gather(*self._abandoned_runs, return_exceptions=True)
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self.image_builder:
+            await self.image_builder.shutdown()
+        if self.readiness:
+            await self.readiness.shutdown()
+        if self.sessions:
+            await self.sessions.shutdown()
+
+        # 모든 컨테이너 동시 종료 (공통 유예 데드라인)
+        if detach:
+            logger.info(f"컨테이너 {len(self.containers)}개 유지 (재시작 후 재연결)")
+        else:
+            await self.stop_all()
+
+        if self.limits:
+            self.limits.save()
 
         # Docker 클라이언트 종료
-        self.docker_client.close()
+        self.fleet.close()
 
         logger.info("컨테이너 풀 종료 완료")
 
@@ -387,10 +1390,23 @@ class ContainerPoolOrchestrator:
             "total_memory_mb": sum(
                 s.memory_usage_mb for s in self.containers.values()
             ),
+            "replica_sets": {
+                name: len(ids) for name, ids in self._by_server.items()
+            },
+            "npm_cache": self.get_npm_cache_stats().to_dict(),
+            "time_to_ready": self.readiness.get_stats() if self.readiness else {},
+            "mcp_sessions": self.sessions.session_count() if self.sessions else 0,
+            "hosts": self.fleet.get_stats(),
+            "admission": self.admission.get_stats(),
+            "resource_limits": self.limits.get_stats() if self.limits else {},
+            "last_teardown": self.last_teardown.to_dict() if self.last_teardown else None,
             "containers": [
                 {
                     "name": s.mcp_server_name,
                     "status": s.status,
+                    "tier": s.tier,
+                    "host": self._host_of(s),
+                    "inflight_requests": s.inflight_requests,
                     "memory_mb": s.memory_usage_mb,
                     "uptime_minutes": int((datetime.now() - s.started_at).seconds / 60),
                     "idle_minutes": int((datetime.now() - s.last_used_at).seconds / 60)
@@ -400,8 +1416,70 @@ class ContainerPoolOrchestrator:
         }
 
     def _find_running_container(self, mcp_server_name: str) -> Optional[ContainerStatus]:
-        """실행 중인 컨테이너 찾기"""
-        for status in self.containers.values():
-            if status.mcp_server_name == mcp_server_name and status.status in ["running", "idle"]:
-                return status
-        return None
+        """
+        가장 한가한 레플리카 찾기 (이름 인덱스 조회, O(레플리카 수))
+
+        준비 완료된 레플리카를 우선하고, 없으면 핸드셰이크 중(starting)인 레플리카 반환
+        """
+        replicas = [
+            self.containers[container_id]
+            for container_id in self._by_server.get(mcp_server_name, ())
+        ]
+        running = [s for s in replicas if s.status in ["running", "idle", "starting"]]
+        if not running:
+            return None
+        return min(running, key=lambda s: (s.status == "starting", s.inflight_requests))
+
+    def _container_name(self, mcp_server_name: str) -> str:
+        """Docker 컨테이너 이름 생성 (레플리카별로 고유)"""
+        # 예: "@modelcontextprotocol/server-docker" -> "modelcontextprotocol-server-docker-<ts>-<id>"
+        clean_name = re.sub(r"[^a-zA-Z0-9_.-]+", "-", mcp_server_name).strip("-.")
+        return f"{clean_name}-{int(datetime.now().timestamp())}-{uuid.uuid4().hex[:6]}"
+
+    def _track(self, status: ContainerStatus):
+        """컨테이너 상태 등록 (풀, 이름 인덱스, 만료 스케줄러 동기화)"""
+        self.containers[status.container_id] = status
+        self._by_server.setdefault(status.mcp_server_name, set()).add(status.container_id)
+        self._expiry.schedule(status.container_id, status.auto_stop_at)
+
+    def _untrack(self, container_id: str):
+        """컨테이너 상태 제거 (풀, 이름 인덱스, 만료 스케줄러 동기화)"""
+        status = self.containers.pop(container_id, None)
+        if status:
+            replicas = self._by_server.get(status.mcp_server_name)
+            if replicas is not None:
+                replicas.discard(container_id)
+                if not replicas:
+                    del self._by_server[status.mcp_server_name]
+        self._expiry.cancel(container_id)
+        self._pending_start_costs.pop(container_id, None)
+        self.eviction_policy.on_remove(container_id)
+        self._capacity_freed.set()
+        placement = self._placements.pop(container_id, None)
+        if placement:
+            self.fleet.release(placement)
+        if self.readiness:
+            self.readiness.forget(container_id)
+        if self.sessions:
+            self._run_in_background(self.sessions.close(container_id))
+        retired = self._npm_cache_stats.pop(container_id, None)
+        if retired:
+            self._npm_cache_retired = self._npm_cache_retired + retired
+
+    def _touch(self, status: ContainerStatus):
+        """재사용 시 마지막 사용 시간 갱신 및 만료 재예약"""
+        status.update_last_used()
+        self._expiry.schedule(status.container_id, status.auto_stop_at)
+        self._record_access(status)
+
+    def _record_access(self, status: ContainerStatus):
+        """퇴출 정책과 사용 트레이스에 사용 기록"""
+        candidate = self._eviction_candidate(status)
+        self.eviction_policy.on_access(candidate)
+        self.usage_trace.append(TraceEvent(
+            timestamp=status.last_used_at,
+            server_name=candidate.server_name,
+            memory_mb=candidate.memory_mb,
+            restart_cost_seconds=candidate.restart_cost_seconds,
+            tier=candidate.tier
+        ))
@@ -0,0 +1,231 @@
+"""
+Docker Fleet
+여러 Docker 엔드포인트를 하나의 컨테이너 풀로 관리 (호스트 선택, 이미지 배포)
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import docker
+
+logger = logging.getLogger(__name__)
+
+
+_MEMORY_UNITS = {"b": 1 / (1024 * 1024), "k": 1 / 1024, "m": 1, "g": 1024}
+
+
+def parse_memory_mb(limit: str) -> int:
+    """Docker 메모리 제한 문자열 → MB (예: "200m", "1g")"""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([bkmg]?)b?", str(limit).strip().lower())
+    if not match:
+        raise ValueError(f"메모리 제한 형식 오류: {limit}")
+    value, unit = match.groups()
+    return int(float(value) * _MEMORY_UNITS[unit or "b"])
+
+
+@dataclass
+class DockerHost:
+    """Docker 엔드포인트 1개와 배치용 자원 정보"""
+    name: str
+    client: docker.DockerClient
+    mem_total_mb: int = 0
+    ncpu: int = 0
+    healthy: bool = True
+    info_fetched_at: Optional[float] = None
+
+    # 이 풀이 배치한 컨테이너 제한 합계 / 측정 사용량
+    reserved_memory_mb: int = 0
+    reserved_cpus: float = 0.0
+    used_memory_mb: int = 0
+    containers: int = 0
+
+    @property
+    def free_memory_mb(self) -> int:
+        return self.mem_total_mb - max(self.reserved_memory_mb, self.used_memory_mb)
+
+    @property
+    def free_cpus(self) -> float:
+        return self.ncpu - self.reserved_cpus
+
+    def to_dict(self) -> Dict:
+        return {
+            "healthy": self.healthy,
+            "containers": self.containers,
+            "mem_total_mb": self.mem_total_mb,
+            "free_memory_mb": self.free_memory_mb,
+            "used_memory_mb": self.used_memory_mb,
+            "ncpu": self.ncpu,
+            "free_cpus": round(self.free_cpus, 2),
+        }
+
+
+@dataclass
+class Placement:
+    """배치 예약 (컨테이너 종료 시 release)"""
+    host: str
+    memory_mb: int
+    cpus: float
+
+
+class DockerFleet:
+    """
+    Docker 호스트 집합
+
+    주요 기능:
+    - 호스트별 info(MemTotal, NCPU) 캐시 및 동시 갱신
+    - 여유 메모리/CPU 기반 배치 + 같은 서버 레플리카 분산
+    - 빌드 호스트 이미지를 다른 호스트로 배포 (save → load)
+    """
+
+    def __init__(
+        self,
+        clients: Dict[str, docker.DockerClient],
+        info_ttl_seconds: float = 60.0
+    ):
+        """
+        Args:
+            clients: 호스트 이름 → Docker 클라이언트 (첫 번째가 기본 호스트)
+            info_ttl_seconds: info 캐시 유효 시간
+        """
+        if not clients:
+            raise ValueError("Docker 호스트가 최소 1개 필요합니다")
+        self.hosts: Dict[str, DockerHost] = {
+            name: DockerHost(name=name, client=client)
+            for name, client in clients.items()
+        }
+        self.primary = next(iter(self.hosts.values()))
+        self.info_ttl_seconds = info_ttl_seconds
+        self._image_copies: Dict[tuple, asyncio.Task] = {}
+
+    @classmethod
+    def from_endpoints(cls, endpoints: Dict[str, str], **kwargs) -> "DockerFleet":
+        """호스트 이름 → base_url (예: "tcp://10.0.0.5:2376", "unix:///var/run/docker.sock")"""
+        return cls(
+            {name: docker.DockerClient(base_url=url) for name, url in endpoints.items()},
+            **kwargs
+        )
+
+    def client(self, host_name: Optional[str]) -> docker.DockerClient:
+        """호스트 클라이언트 (모르는 이름이면 기본 호스트)"""
+        host = self.hosts.get(host_name) if host_name else None
+        return (host or self.primary).client
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    async def refresh(self, force: bool = False):
+        """오래된 호스트 info 동시 갱신 (실패한 호스트는 배치에서 제외)"""
+        now = time.monotonic()
+        stale = [
+            host for host in self.hosts.values()
+            if force or host.info_fetched_at is None
+            or now - host.info_fetched_at > self.info_ttl_seconds
+        ]
+        if not stale:
+            return
+
+        results = await asyncio.gather(
+            *[asyncio.to_thread(host.client.info) for host in stale],
+            return_exceptions=True
+        )
+        for host, info in zip(stale, results):
+            host.info_fetched_at = now
+            if isinstance(info, Exception):
+                if host.healthy:
+                    logger.error(f"Docker 호스트 응답 없음: {host.name} ({info})")
+                host.healthy = False
+                continue
+            if not host.healthy:
+                logger.info(f"Docker 호스트 복구: {host.name}")
+            host.healthy = True
+            host.mem_total_mb = int(info.get("MemTotal", 0) // (1024 * 1024))
+            host.ncpu = int(info.get("NCPU", 0))
+
+    def place(
+        self,
+        memory_mb: int,
+        cpus: float,
+        replica_hosts: List[str]
+    ) -> Placement:
+        """
+        새 컨테이너 배치 호스트 선택 및 자원 예약
+
+        같은 서버 레플리카가 적은 호스트 → 여유 메모리 → 여유 CPU 순.
+        자원이 충분한 호스트가 없으면 정상 호스트 중에서 같은 기준으로 선택
+
+        Args:
+            memory_mb: 컨테이너 메모리 제한
+            cpus: 컨테이너 CPU 제한 (코어)
+            replica_hosts: 같은 서버 기존 레플리카가 있는 호스트 이름 목록
+        """
+        healthy = [h for h in self.hosts.values() if h.healthy] or list(self.hosts.values())
+        fits = [
+            h for h in healthy
+            if h.free_memory_mb >= memory_mb and (not h.ncpu or h.free_cpus >= cpus)
+        ]
+
+        def score(host: DockerHost):
+            return (replica_hosts.count(host.name), -host.free_memory_mb, -host.free_cpus)
+
+        host = min(fits or healthy, key=score)
+        if not fits:
+            logger.warning(f"여유 자원이 충분한 호스트 없음, {host.name}에 배치")
+
+        self.reserve(host.name, memory_mb, cpus)
+        return Placement(host=host.name, memory_mb=memory_mb, cpus=cpus)
+
+    def reserve(self, host_name: str, memory_mb: int, cpus: float):
+        host = self.hosts.get(host_name)
+        if host:
+            host.reserved_memory_mb += memory_mb
+            host.reserved_cpus += cpus
+            host.containers += 1
+
+    def release(self, placement: Placement):
+        host = self.hosts.get(placement.host)
+        if host:
+            host.reserved_memory_mb = max(0, host.reserved_memory_mb - placement.memory_mb)
+            host.reserved_cpus = max(0.0, host.reserved_cpus - placement.cpus)
+            host.containers = max(0, host.containers - 1)
+
+    async def distribute_image(self, image_name: str, host_name: str):
+        """
+        기본 호스트의 이미지를 다른 호스트로 복사 (docker save | docker load)
+
+        같은 호스트로의 동시 복사 요청은 하나로 합쳐짐
+        """
+        key = (image_name, host_name)
+        task = self._image_copies.get(key)
+        if task is None:
+            task = asyncio.create_task(self._copy_image(image_name, host_name))
+            self._image_copies[key] = task
+            task.add_done_callback(lambda _: self._image_copies.pop(key, None))
+        await asyncio.shield(task)
+
+    async def _copy_image(self, image_name: str, host_name: str):
+        started = time.monotonic()
+        source = self.primary.client
+        target = self.client(host_name)
+
+        def copy():
+            target.api.load_image(source.api.get_image(image_name))
+
+        await asyncio.to_thread(copy)
+        logger.info(
+            f"이미지 배포: {image_name} → {host_name} "
+            f"({time.monotonic() - started:.1f}초)"
+        )
+
+    def get_stats(self) -> Dict:
+        return {name: host.to_dict() for name, host in self.hosts.items()}
+
+    def close(self):
+        for host in self.hosts.values():
+            try:
+                host.client.close()
+            except Exception as e:
+                logger.warning(f"Docker 클라이언트 종료 실패: {host.name} ({e})")
@@ -0,0 +1,154 @@
+"""
+Docker Attach stdio Transport
+컨테이너 stdio(attach 소켓)를 MCP ClientSession 스트림으로 연결
+"""
+
+import asyncio
+import logging
+import socket
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Tuple
+
+import anyio
+import docker
+from mcp import types
+from mcp.shared.message import SessionMessage
+
+logger = logging.getLogger(__name__)
+
+
+# attach 스트림 프레임 헤더 (tty=False): [stream(1), 0, 0, 0, size(4, big-endian)]
+FRAME_HEADER = struct.Struct(">BxxxI")
+STDOUT = 1
+STDERR = 2
+
+RECV_SIZE = 65536
+
+
+class AttachStreamDemuxer:
+    """
+    attach 소켓 바이트를 (stream, payload) 프레임으로 분리
+
+    recv() 경계와 프레임 경계가 맞지 않으므로 남은 바이트를 버퍼링
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Tuple[int, bytes]]:
+        self._buffer.extend(data)
+        frames = []
+
+        while len(self._buffer) >= FRAME_HEADER.size:
+            stream, size = FRAME_HEADER.unpack_from(self._buffer)
+            end = FRAME_HEADER.size + size
+            if len(self._buffer) < end:
+                break
+            frames.append((stream, bytes(self._buffer[FRAME_HEADER.size:end])))
+            del self._buffer[:end]
+
+        return frames
+
+
+def open_attach_socket(docker_client: docker.DockerClient, container_id: str):
+    """
+    컨테이너 stdin/stdout attach 소켓 열기 (블로킹)
+
+    컨테이너는 stdin_open=True, tty=False로 실행되어 있어야 함
+    """
+    sock = docker_client.api.attach_socket(
+        container_id,
+        params={"stdin": 1, "stdout": 1, "stderr": 1, "stream": 1}
+    )
+    # UNIX 소켓은 SocketIO로 감싸져 있음 → recv/sendall 가능한 원본 소켓 사용
+    return getattr(sock, "_sock", sock)
+
+
+def close_attach_socket(sock):
+    """attach 소켓 닫기 (대기 중인 recv를 깨우기 위해 shutdown 먼저)"""
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except (OSError, AttributeError):
+        pass
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
+@asynccontextmanager
+async def attached_stdio_client(sock) -> AsyncIterator[Tuple]:
+    """
+    attach 소켓 위 MCP stdio 클라이언트 트랜스포트
+
+    mcp.client.stdio.stdio_client와 같은 (read_stream, write_stream)을 제공하므로
+    ClientSession에 그대로 연결 가능. stdout은 JSON-RPC 메시지(줄 단위),
+    stderr는 디버그 로그로 기록
+
+    Args:
+        sock: recv/sendall을 지원하는 소켓 (open_attach_socket 결과)
+    """
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    # recv는 세션이 살아 있는 동안 스레드를 계속 점유하므로 기본 executor와 분리
+    # (세션 풀이 커지면 기본 executor가 고갈되어 다른 to_thread 호출이 멈춤)
+    loop = asyncio.get_running_loop()
+    reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-attach")
+
+    async def stdout_reader():
+        demuxer = AttachStreamDemuxer()
+        buffer = b""
+
+        try:
+            async with read_stream_writer:
+                while True:
+                    try:
+                        data = await loop.run_in_executor(reader, sock.recv, RECV_SIZE)
+                    except OSError:
+                        break
+                    if not data:
+                        break
+
+                    for stream, payload in demuxer.feed(data):
+                        if stream == STDERR:
+                            logger.debug(f"MCP stderr: {payload.decode(errors='replace').rstrip()}")
+                            continue
+
+                        lines = (buffer + payload).split(b"\n")
+                        buffer = lines.pop()
+                        for line in lines:
+                            if not line.strip():
+                                continue
+                            try:
+                                message = types.JSONRPCMessage.model_validate_json(line)
+                            except Exception as exc:
+                                logger.warning(f"JSON-RPC 메시지 파싱 실패: {line[:200]!r}")
+                                await read_stream_writer.send(exc)
+                                continue
+                            await read_stream_writer.send(SessionMessage(message))
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def stdin_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    await asyncio.to_thread(sock.sendall, (json + "\n").encode())
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stdout_reader)
+        tg.start_soon(stdin_writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            # 컨테이너 stdin은 닫지 않음 (stdin_once=False) → 이후 다시 attach 가능
+            close_attach_socket(sock)
+            tg.cancel_scope.cancel()
+            await read_stream.aclose()
+            await write_stream.aclose()
+            reader.shutdown(wait=False)
@@ -0,0 +1,296 @@
+"""
+Eviction Policies
+메모리 압박 시 컨테이너 풀 퇴출 정책 및 사용 트레이스 시뮬레이터
+"""
+
+import json
+import math
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# 티어별 재시작 비용 가중치 (Hot 서버일수록 다시 띄우는 비용이 크다고 봄)
+TIER_COST_WEIGHTS = {
+    "tier1_hot": 4.0,
+    "tier2_warm": 2.0,
+    "tier3_cold": 1.0,
+}
+
+
+@dataclass
+class EvictionCandidate:
+    """퇴출 후보 (컨테이너 1개)"""
+    key: str
+    server_name: str
+    memory_mb: int
+    restart_cost_seconds: float
+    tier: Optional[str]
+    last_used_at: datetime
+
+    @property
+    def tier_weight(self) -> float:
+        return TIER_COST_WEIGHTS.get(self.tier or "", 1.0)
+
+
+class EvictionPolicy:
+    """
+    퇴출 정책 베이스
+
+    priority()가 낮은 후보부터 퇴출. 상태가 있는 정책은
+    on_access/on_evict/on_remove로 갱신
+    """
+
+    name = "base"
+
+    def priority(self, candidate: EvictionCandidate) -> float:
+        raise NotImplementedError
+
+    def on_access(self, candidate: EvictionCandidate):
+        """후보 사용 기록"""
+
+    def on_evict(self, candidate: EvictionCandidate):
+        """후보 퇴출 기록"""
+        self.on_remove(candidate.key)
+
+    def on_remove(self, key: str):
+        """후보 제거 (퇴출 외 종료 포함)"""
+
+    def select_victims(
+        self,
+        candidates: Iterable[EvictionCandidate],
+        memory_to_free_mb: float
+    ) -> List[EvictionCandidate]:
+        """
+        memory_to_free_mb 이상 확보될 때까지 우선순위 낮은 순으로 퇴출 대상 선택
+
+        Returns:
+            퇴출 순서대로 정렬된 후보 목록
+        """
+        victims = []
+        freed = 0
+
+        for candidate in sorted(candidates, key=self.priority):
+            if freed >= memory_to_free_mb:
+                break
+            victims.append(candidate)
+            freed += candidate.memory_mb
+
+        return victims
+
+
+class LRUPolicy(EvictionPolicy):
+    """가장 오래 사용되지 않은 것부터 퇴출"""
+
+    name = "lru"
+
+    def priority(self, candidate: EvictionCandidate) -> float:
+        return candidate.last_used_at.timestamp()
+
+
+class LRUKPolicy(EvictionPolicy):
+    """
+    LRU-K: K번째 최근 사용 시각이 가장 오래된 것부터 퇴출
+
+    한 번만 쓰이고 끝난 서버(K회 미만 사용)를 자주 쓰이는 서버보다 먼저 퇴출
+    """
+
+    name = "lru_k"
+
+    def __init__(self, k: int = 2):
+        self.k = k
+        self._history: Dict[str, List[float]] = {}
+
+    def priority(self, candidate: EvictionCandidate) -> float:
+        history = self._history.get(candidate.key, [])
+        if len(history) < self.k:
+            # K회 미만 사용: 가장 먼저 퇴출, 그 안에서는 LRU
+            return -math.inf if not history else history[-1] - 1e12
+        return history[-self.k]
+
+    def on_access(self, candidate: EvictionCandidate):
+        history = self._history.setdefault(candidate.key, [])
+        history.append(candidate.last_used_at.timestamp())
+        del history[:-self.k]
+
+    def on_remove(self, key: str):
+        self._history.pop(key, None)
+
+
+class GreedyDualSizePolicy(EvictionPolicy):
+    """
+    GreedyDual-Size: H = L + (재시작 비용 × 티어 가중치) / 메모리
+
+    메모리를 많이 쓰면서 다시 띄우기 싼 컨테이너부터 퇴출.
+    퇴출 시 L을 퇴출된 H로 올려 오래 안 쓰인 항목이 자연히 밀려나도록 함 (aging)
+    """
+
+    name = "greedy_dual_size"
+
+    def __init__(self):
+        self._inflation = 0.0
+        self._h: Dict[str, float] = {}
+
+    def _value(self, candidate: EvictionCandidate) -> float:
+        cost = max(candidate.restart_cost_seconds, 0.1) * candidate.tier_weight
+        return cost / max(candidate.memory_mb, 1)
+
+    def priority(self, candidate: EvictionCandidate) -> float:
+        h = self._h.get(candidate.key)
+        if h is None:
+            h = self._inflation + self._value(candidate)
+        return h
+
+    def on_access(self, candidate: EvictionCandidate):
+        self._h[candidate.key] = self._inflation + self._value(candidate)
+
+    def on_evict(self, candidate: EvictionCandidate):
+        self._inflation = max(self._inflation, self.priority(candidate))
+        self.on_remove(candidate.key)
+
+    def on_remove(self, key: str):
+        self._h.pop(key, None)
+
+
+EVICTION_POLICIES = {
+    LRUPolicy.name: LRUPolicy,
+    LRUKPolicy.name: LRUKPolicy,
+    GreedyDualSizePolicy.name: GreedyDualSizePolicy,
+}
+
+
+def make_policy(name: str) -> EvictionPolicy:
+    """이름으로 퇴출 정책 생성"""
+    try:
+        return EVICTION_POLICIES[name]()
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 퇴출 정책: {name} (지원: {', '.join(EVICTION_POLICIES)})"
+        )
+
+
+# ========================================
+# 사용 트레이스 시뮬레이터
+# ========================================
+
+@dataclass
+class TraceEvent:
+    """사용 트레이스 1건 (서버 1회 사용)"""
+    timestamp: datetime
+    server_name: str
+    memory_mb: int
+    restart_cost_seconds: float
+    tier: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "timestamp": self.timestamp.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TraceEvent":
+        return cls(**{**data, "timestamp": datetime.fromisoformat(data["timestamp"])})
+
+
+@dataclass
+class SimulationResult:
+    """정책 시뮬레이션 결과"""
+    policy: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    restart_seconds: float = 0.0
+    peak_memory_mb: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def load_trace(path: str) -> List[TraceEvent]:
+    """JSON Lines 트레이스 파일 로드"""
+    with open(path, 'r') as f:
+        return [TraceEvent.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def save_trace(events: Iterable[TraceEvent], path: str):
+    """JSON Lines 트레이스 파일 저장"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        for event in events:
+            f.write(json.dumps(event.to_dict()) + "\n")
+
+
+def simulate(
+    trace: Iterable[TraceEvent],
+    policy: EvictionPolicy,
+    capacity_mb: int
+) -> SimulationResult:
+    """
+    트레이스 재생: 서버당 컨테이너 1개 풀에서 capacity_mb를 넘으면 정책대로 퇴출
+
+    Returns:
+        적중/미스 횟수와 누적 재시작 비용
+    """
+    result = SimulationResult(policy=policy.name)
+    resident: Dict[str, EvictionCandidate] = {}
+    used_mb = 0
+
+    for event in trace:
+        candidate = EvictionCandidate(
+            key=event.server_name,
+            server_name=event.server_name,
+            memory_mb=event.memory_mb,
+            restart_cost_seconds=event.restart_cost_seconds,
+            tier=event.tier,
+            last_used_at=event.timestamp
+        )
+
+        if event.server_name in resident:
+            result.hits += 1
+        else:
+            result.misses += 1
+            result.restart_seconds += event.restart_cost_seconds
+            used_mb += event.memory_mb
+
+            overflow = used_mb - capacity_mb
+            if overflow > 0:
+                others = [c for key, c in resident.items() if key != event.server_name]
+                for victim in policy.select_victims(others, overflow):
+                    policy.on_evict(victim)
+                    del resident[victim.key]
+                    used_mb -= victim.memory_mb
+                    result.evictions += 1
+
+        resident[event.server_name] = candidate
+        policy.on_access(candidate)
+        result.peak_memory_mb = max(result.peak_memory_mb, used_mb)
+
+    return result
+
+
+def compare_policies(
+    trace: List[TraceEvent],
+    capacity_mb: int,
+    policy_names: Optional[List[str]] = None
+) -> List[SimulationResult]:
+    """여러 정책으로 같은 트레이스를 재생해 비교"""
+    return [
+        simulate(trace, make_policy(name), capacity_mb)
+        for name in (policy_names or list(EVICTION_POLICIES))
+    ]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="퇴출 정책 트레이스 시뮬레이션")
+    parser.add_argument("trace", help="JSON Lines 사용 트레이스 파일")
+    parser.add_argument("--capacity-mb", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'정책':20s} {'적중률':>8s} {'미스':>6s} {'퇴출':>6s} {'재시작(초)':>10s}")
+    for r in compare_policies(load_trace(args.trace), args.capacity_mb):
+        print(
+            f"{r.policy:20s} {r.hit_rate:8.1%} {r.misses:6d} "
+            f"{r.evictions:6d} {r.restart_seconds:10.1f}"
+        )
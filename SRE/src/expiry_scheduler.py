@@ -0,0 +1,139 @@
+"""
+Expiry Scheduler
+auto_stop_at 데드라인 기반 min-heap 타이머 (Idle 컨테이너 만료 처리)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryScheduler:
+    """
+    데드라인 min-heap 기반 만료 스케줄러
+
+    주요 기능:
+    - schedule/cancel O(log n), 다음 데드라인까지 정확히 sleep
+    - 데드라인 연장은 lazy 처리: 엔트리가 pop될 때 실제 데드라인을
+      resolve_deadline으로 다시 확인하고, 늦춰졌으면 재삽입
+    - 취소된 엔트리가 쌓이면 힙 재구성 (메모리 O(live))
+    """
+
+    # 취소된(stale) 엔트리 비율이 이 값을 넘으면 힙 재구성
+    COMPACT_RATIO = 2
+
+    def __init__(
+        self,
+        resolve_deadline: Callable[[str], Optional[datetime]],
+        on_expire: Callable[[str], Awaitable[None]]
+    ):
+        """
+        Args:
+            resolve_deadline: 키의 현재 데드라인 조회 (None이면 추적 종료)
+            on_expire: 데드라인 도달 시 호출되는 코루틴
+        """
+        self._resolve_deadline = resolve_deadline
+        self._on_expire = on_expire
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._scheduled: Dict[str, datetime] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def schedule(self, key: str, deadline: datetime):
+        """
+        데드라인 등록
+
+        이미 더 이른 데드라인이 등록되어 있으면 아무것도 하지 않음
+        (pop 시점에 resolve_deadline으로 연장 여부를 확인)
+        """
+        current = self._scheduled.get(key)
+        if current is not None and current <= deadline:
+            return
+
+        self._scheduled[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+
+        # 새 데드라인이 가장 이르면 대기 중인 루프를 깨움
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+
+    def cancel(self, key: str):
+        """데드라인 취소 (힙 엔트리는 lazy 삭제)"""
+        if self._scheduled.pop(key, None) is None:
+            return
+
+        if len(self._heap) > self.COMPACT_RATIO * max(len(self._scheduled), 1):
+            self._compact()
+
+    def next_deadline(self) -> Optional[datetime]:
+        """가장 이른 유효 데드라인"""
+        while self._heap:
+            deadline, _, key = self._heap[0]
+            if self._scheduled.get(key) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        데드라인이 지난 키 목록 반환 (O(k log n))
+
+        데드라인이 연장된 키는 새 데드라인으로 재등록되고 반환되지 않음
+        """
+        now = now or datetime.now()
+        due = []
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(self._heap)
+            if self._scheduled.get(key) != deadline:
+                continue  # 취소되었거나 재등록된 엔트리
+            del self._scheduled[key]
+
+            actual = self._resolve_deadline(key)
+            if actual is None:
+                continue
+            if actual > now:
+                self.schedule(key, actual)
+                continue
+
+            due.append(key)
+
+        return due
+
+    async def run(self):
+        """만료 루프: 다음 데드라인까지 sleep 후 만료 처리"""
+        while True:
+            for key in self.pop_due():
+                try:
+                    await self._on_expire(key)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"만료 처리 오류 ({key}): {e}")
+
+            self._wakeup.clear()
+            deadline = self.next_deadline()
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, (deadline - datetime.now()).total_seconds())
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _compact(self):
+        """취소된 엔트리 제거 후 힙 재구성"""
+        self._heap = [
+            entry for entry in self._heap
+            if self._scheduled.get(entry[2]) == entry[0]
+        ]
+        heapq.heapify(self._heap)
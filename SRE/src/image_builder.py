@@ -0,0 +1,223 @@
+"""
+MCP Image Builder
+npm 패키지를 미리 설치한 서버별 이미지 (mcp/<server>) 빌드 큐
+"""
+
+import asyncio
+import io
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import docker
+
+logger = logging.getLogger(__name__)
+
+
+# BuildKit: npm 캐시를 캐시 마운트로 공유 → 빌드 간 tarball 재다운로드 없음
+BUILDKIT_DOCKERFILE = """# syntax=docker/dockerfile:1
+FROM {base_image}
+ENV MCP_PACKAGE={package} MCP_PREINSTALLED=1
+RUN --mount=type=cache,target=/root/.npm,sharing=locked \\
+    npm install --omit=dev --no-audit --no-fund {package}@{version}
+"""
+
+# Docker CLI가 없을 때 (SDK 레거시 빌더) 사용
+LEGACY_DOCKERFILE = """FROM {base_image}
+ENV MCP_PACKAGE={package} MCP_PREINSTALLED=1
+RUN npm install --omit=dev --no-audit --no-fund {package}@{version} \\
+    && npm cache clean --force
+"""
+
+# Dockerfile에 그대로 들어가는 값 → npm 이름 / 버전(semver, dist-tag) 문자만 허용
+# (Catalog 검색 결과에서 온 값이라 "1.0 && curl ... | sh" 같은 셸 주입 차단)
+NPM_PACKAGE_PATTERN = re.compile(r"(?:@[a-z0-9][a-z0-9._~-]*/)?[a-z0-9][a-z0-9._~-]*")
+NPM_VERSION_PATTERN = re.compile(r"[0-9A-Za-z][0-9A-Za-z.+-]*")
+NPM_NAME_MAX_LENGTH = 214
+
+
+@dataclass
+class ImageBuildResult:
+    """이미지 빌드 결과"""
+    server_name: str
+    image_name: str
+    size_mb: int
+    duration_seconds: float
+
+
+class ImageBuildError(Exception):
+    """이미지 빌드 실패"""
+
+
+def render_dockerfile(template: str, base_image: str, package: str, version: str) -> str:
+    """
+    패키지/버전을 검증한 뒤 Dockerfile 생성
+
+    Raises:
+        ImageBuildError: npm 패키지 이름 또는 버전 형식이 아닌 값
+    """
+    if len(package) > NPM_NAME_MAX_LENGTH or not NPM_PACKAGE_PATTERN.fullmatch(package):
+        raise ImageBuildError(f"잘못된 npm 패키지 이름: {package!r}")
+    if not NPM_VERSION_PATTERN.fullmatch(version):
+        raise ImageBuildError(f"잘못된 npm 버전: {version!r}")
+    return template.format(base_image=base_image, package=package, version=version)
+
+
+class ImageBuilder:
+    """
+    서버별 MCP 이미지 빌드 큐
+
+    주요 기능:
+    - 패키지를 미리 설치한 이미지 빌드 (컨테이너 시작 시 npm install 제거)
+    - 동시 빌드 수 제한 + 이미지별 single-flight
+    - BuildKit 캐시 마운트 / 로컬 레이어 캐시 공유
+    - 빌드 완료 리스너 (실제 이미지 크기 전달)
+    """
+
+    def __init__(
+        self,
+        docker_client: docker.DockerClient,
+        base_image: str = "mcp/base:latest",
+        max_parallel_builds: int = 2,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            docker_client: Docker 클라이언트 (이미지 크기 조회, CLI 없을 때 빌드)
+            base_image: 베이스 이미지 (docker/Dockerfile.mcp-base)
+            max_parallel_builds: 동시 빌드 수
+            cache_dir: BuildKit 로컬 레이어 캐시 디렉토리 (빌더 간 공유용, 옵션)
+        """
+        self.docker_client = docker_client
+        self.base_image = base_image
+        self.cache_dir = cache_dir
+        self._semaphore = asyncio.Semaphore(max_parallel_builds)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._listeners: List[Callable[[ImageBuildResult], None]] = []
+        self._docker_cli = shutil.which("docker")
+
+    def add_listener(self, listener: Callable[[ImageBuildResult], None]):
+        """빌드 완료 리스너 등록 (예: TierManager.mark_image_cached)"""
+        self._listeners.append(listener)
+
+    def is_building(self, image_name: str) -> bool:
+        return image_name in self._inflight
+
+    def schedule(
+        self,
+        server_name: str,
+        package: str,
+        version: str,
+        image_name: str
+    ) -> asyncio.Task:
+        """
+        백그라운드 빌드 예약 (같은 이미지 빌드가 진행 중이면 그 태스크 반환)
+        """
+        task = self._inflight.get(image_name)
+        if task is None:
+            task = asyncio.create_task(
+                self._build(server_name, package, version, image_name)
+            )
+            self._inflight[image_name] = task
+            task.add_done_callback(lambda t: self._on_done(image_name, t))
+        return task
+
+    def _on_done(self, image_name: str, task: asyncio.Task):
+        """빌드 태스크 정리 (대기자가 없는 백그라운드 빌드의 실패도 로그로 남김)"""
+        self._inflight.pop(image_name, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"이미지 빌드 실패: {image_name} ({task.exception()})")
+
+    async def build(
+        self,
+        server_name: str,
+        package: str,
+        version: str,
+        image_name: str
+    ) -> ImageBuildResult:
+        """빌드 후 결과 대기 (진행 중인 빌드가 있으면 합류)"""
+        return await asyncio.shield(self.schedule(server_name, package, version, image_name))
+
+    async def _build(
+        self,
+        server_name: str,
+        package: str,
+        version: str,
+        image_name: str
+    ) -> ImageBuildResult:
+        async with self._semaphore:
+            logger.info(f"이미지 빌드 시작: {image_name} ({package}@{version})")
+            started = time.monotonic()
+
+            if self._docker_cli:
+                await self._build_with_buildkit(package, version, image_name)
+            else:
+                await asyncio.to_thread(self._build_with_sdk, package, version, image_name)
+
+            image = await asyncio.to_thread(self.docker_client.images.get, image_name)
+            result = ImageBuildResult(
+                server_name=server_name,
+                image_name=image_name,
+                size_mb=int(image.attrs.get("Size", 0) // (1024 * 1024)),
+                duration_seconds=time.monotonic() - started
+            )
+
+        logger.info(
+            f"이미지 빌드 완료: {image_name} "
+            f"({result.size_mb}MB, {result.duration_seconds:.1f}초)"
+        )
+        for listener in self._listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                logger.error(f"빌드 리스너 오류: {e}")
+
+        return result
+
+    async def _build_with_buildkit(self, package: str, version: str, image_name: str):
+        """docker CLI + BuildKit 빌드 (캐시 마운트, 로컬 레이어 캐시)"""
+        dockerfile = render_dockerfile(BUILDKIT_DOCKERFILE, self.base_image, package, version)
+        args = [self._docker_cli, "build", "--tag", image_name, "--file", "-"]
+        if self.cache_dir:
+            args += [
+                "--cache-from", f"type=local,src={self.cache_dir}",
+                "--cache-to", f"type=local,dest={self.cache_dir},mode=max",
+            ]
+
+        with tempfile.TemporaryDirectory() as context_dir:
+            process = await asyncio.create_subprocess_exec(
+                *args, context_dir,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env={**os.environ, "DOCKER_BUILDKIT": "1"}
+            )
+            output, _ = await process.communicate(dockerfile.encode())
+
+        if process.returncode != 0:
+            tail = output.decode(errors="replace")[-2000:]
+            raise ImageBuildError(f"이미지 빌드 실패: {image_name}\n{tail}")
+
+    def _build_with_sdk(self, package: str, version: str, image_name: str):
+        """Docker SDK 레거시 빌더 (CLI가 없는 환경)"""
+        dockerfile = render_dockerfile(LEGACY_DOCKERFILE, self.base_image, package, version)
+        try:
+            self.docker_client.images.build(
+                fileobj=io.BytesIO(dockerfile.encode()),
+                tag=image_name,
+                rm=True
+            )
+        except (docker.errors.BuildError, docker.errors.APIError) as e:
+            raise ImageBuildError(f"이미지 빌드 실패: {image_name}\n{e}") from e
+
+    async def shutdown(self):
+        """진행 중인 빌드 취소"""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,207 @@
+"""
+Image Cache Manager
+디스크 예산 기반 MCP 이미지 캐시 관리 (티어 기반 GC, 사전 준비, Docker 상태 동기화)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import docker
+
+from .image_builder import ImageBuilder
+from .tier_manager import ServerTier, TierManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImageCacheReport:
+    """이미지 캐시 관리 결과"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    pruned: List[str] = field(default_factory=list)
+    prewarmed: List[str] = field(default_factory=list)
+    docker_total_mb: int = 0
+
+
+class ImageCacheManager:
+    """
+    MCP 이미지 캐시 관리자
+
+    주요 기능:
+    - Docker가 실제 보유한 이미지와 TierManager 캐시 정보 동기화
+    - 디스크 예산 초과 시 Cold 티어 이미지부터 정리 (오래되고 큰 것 우선)
+    - Tier 1/2로 승격된 서버 이미지 백그라운드 사전 pull/빌드 (병렬)
+    """
+
+    # 예산 초과 시 정리 대상 티어 (Hot/Warm은 항상 캐싱)
+    PRUNABLE_TIERS = (ServerTier.TIER_3_COLD,)
+
+    def __init__(
+        self,
+        docker_client: docker.DockerClient,
+        tier_manager: TierManager,
+        image_name_for: Callable[[str], str],
+        image_prefix: str = "mcp",
+        budget_mb: int = 5000,
+        max_parallel_pulls: int = 3,
+        pull_from_registry: bool = False,
+        image_builder: Optional[ImageBuilder] = None
+    ):
+        """
+        Args:
+            docker_client: Docker 클라이언트
+            tier_manager: 티어 관리자 (캐시 정보 기록)
+            image_name_for: 서버 이름 → 이미지 이름 변환
+            image_prefix: 관리 대상 이미지 prefix
+            budget_mb: 이미지 캐시 디스크 예산
+            max_parallel_pulls: 동시 pull/빌드 수
+            pull_from_registry: 레지스트리에서 pull 시도 (실패 시 빌드)
+            image_builder: 이미지가 없을 때 사용할 빌더
+        """
+        self.docker_client = docker_client
+        self.tier_manager = tier_manager
+        self.image_name_for = image_name_for
+        self.image_prefix = image_prefix
+        self.budget_mb = budget_mb
+        self.pull_from_registry = pull_from_registry
+        self.image_builder = image_builder
+        self._semaphore = asyncio.Semaphore(max_parallel_pulls)
+
+    async def reconcile(self) -> ImageCacheReport:
+        """
+        Docker 이미지 목록과 TierManager 캐시 정보 동기화
+
+        이미지 목록 조회 1회로 실제 보유 이미지 크기를 반영하고,
+        외부에서 삭제된 이미지는 캐시 해제로 기록
+        """
+        images = await asyncio.to_thread(
+            self.docker_client.images.list,
+            filters={"reference": f"{self.image_prefix}/*"}
+        )
+
+        present: Dict[str, int] = {}
+        for image in images:
+            size_mb = int(image.attrs.get("Size", 0) // (1024 * 1024))
+            for tag in image.tags:
+                present[tag] = size_mb
+
+        report = ImageCacheReport(docker_total_mb=sum(present.values()))
+
+        for server in list(self.tier_manager.servers.values()):
+            image_name = server.image_name or self.image_name_for(server.name)
+            size_mb = present.get(image_name)
+
+            if size_mb is not None:
+                if not server.image_cached or server.image_size_mb != size_mb:
+                    self.tier_manager.mark_image_cached(server.name, image_name, size_mb)
+                    report.added.append(server.name)
+            elif server.image_cached:
+                self.tier_manager.mark_image_evicted(server.name)
+                report.removed.append(server.name)
+
+        return report
+
+    async def enforce_budget(self) -> List[str]:
+        """
+        예산 초과 시 Cold 티어 이미지 정리
+
+        마지막 사용일이 오래된 것부터, 같은 날이면 큰 것부터 삭제.
+        실행 중인 컨테이너가 쓰는 이미지는 건너뜀
+
+        Returns:
+            정리된 서버 이름 목록
+        """
+        cached = [s for s in self.tier_manager.servers.values() if s.image_cached]
+        total_mb = sum(s.image_size_mb for s in cached)
+        if total_mb <= self.budget_mb:
+            return []
+
+        candidates = sorted(
+            (s for s in cached if s.tier in self.PRUNABLE_TIERS),
+            key=lambda s: ((s.last_used_at or datetime.min).date(), -s.image_size_mb)
+        )
+
+        pruned = []
+        for server in candidates:
+            if total_mb <= self.budget_mb:
+                break
+
+            image_name = server.image_name or self.image_name_for(server.name)
+            try:
+                await asyncio.to_thread(self.docker_client.images.remove, image_name)
+            except docker.errors.ImageNotFound:
+                pass
+            except docker.errors.APIError as e:
+                logger.info(f"이미지 정리 건너뜀 (사용 중): {image_name} ({e})")
+                continue
+
+            total_mb -= server.image_size_mb
+            self.tier_manager.mark_image_evicted(server.name)
+            pruned.append(server.name)
+            logger.info(f"이미지 정리: {image_name} ({server.image_size_mb}MB)")
+
+        if total_mb > self.budget_mb:
+            logger.warning(
+                f"이미지 캐시 예산 초과 지속: {total_mb}MB / {self.budget_mb}MB"
+            )
+
+        return pruned
+
+    async def prewarm(self) -> List[str]:
+        """
+        Tier 1/2인데 이미지가 없는 서버의 이미지를 병렬로 사전 준비
+
+        Returns:
+            준비된 서버 이름 목록
+        """
+        targets = [
+            server for tier in (ServerTier.TIER_1_HOT, ServerTier.TIER_2_WARM)
+            for server in self.tier_manager.get_servers_by_tier(tier)
+            if not server.image_cached
+        ]
+
+        results = await asyncio.gather(
+            *[self._prepare(server.name, server.package, server.version) for server in targets],
+            return_exceptions=True
+        )
+
+        prepared = []
+        for server, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"이미지 사전 준비 실패: {server.name} ({result})")
+            elif result:
+                prepared.append(server.name)
+        return prepared
+
+    async def _prepare(self, server_name: str, package: str, version: str) -> bool:
+        """이미지 1개 준비: 레지스트리 pull, 실패하면 빌드"""
+        image_name = self.image_name_for(server_name)
+
+        async with self._semaphore:
+            if self.pull_from_registry:
+                try:
+                    image = await asyncio.to_thread(self.docker_client.images.pull, image_name)
+                    size_mb = int(image.attrs.get("Size", 0) // (1024 * 1024))
+                    self.tier_manager.mark_image_cached(server_name, image_name, size_mb)
+                    logger.info(f"이미지 사전 pull: {image_name}")
+                    return True
+                except docker.errors.APIError as e:
+                    logger.info(f"이미지 pull 실패, 빌드로 대체: {image_name} ({e})")
+
+        if self.image_builder is None:
+            return False
+
+        # 빌드 완료 시 빌더 리스너가 mark_image_cached 기록
+        await self.image_builder.build(server_name, package, version, image_name)
+        return True
+
+    async def run_once(self) -> ImageCacheReport:
+        """동기화 → 예산 정리 → 사전 준비 (백그라운드 최적화 1회)"""
+        report = await self.reconcile()
+        report.pruned = await self.enforce_budget()
+        report.prewarmed = await self.prewarm()
+        return report
@@ -0,0 +1,263 @@
+"""
+Incident Correlator
+에러 로그 지문(정규화 토큰 + MinHash/LSH)으로 같은 장애를 하나로 묶음
+"""
+
+import asyncio
+import hashlib
+import itertools
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from .expiry_scheduler import ExpiryScheduler
+
+logger = logging.getLogger(__name__)
+
+
+# 호스트/요청마다 달라지는 값 → 자리표시자 (순서 중요: 긴 패턴 먼저)
+NORMALIZE_RULES = [
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:z|[+-]\d{2}:?\d{2})?"), " <ts> "),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"), " <uuid> "),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), " <ip> "),
+    (re.compile(r"\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b"), " <hex> "),
+    (re.compile(r"\b[\w.-]+-[0-9a-z]{5,10}-[0-9a-z]{5}\b"), " <pod> "),
+    (re.compile(r"\d+"), " <n> "),
+]
+TOKEN_PATTERN = re.compile(r"<\w+>|[a-z_][a-z0-9_.]*")
+
+# MinHash 해시 계열: h_i(x) = (a_i * x + b_i) mod p
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_tokens(error_log: str) -> List[str]:
+    """소문자화 + 가변 값(시각, ID, IP, 숫자) 치환 후 토큰 목록"""
+    text = error_log.lower()
+    for pattern, placeholder in NORMALIZE_RULES:
+        text = pattern.sub(placeholder, text)
+    return TOKEN_PATTERN.findall(text)
+
+
+def shingles(tokens: List[str], size: int = 2) -> Set[str]:
+    """연속 토큰 size개 묶음 집합 (짧은 로그는 토큰 자체)"""
+    if len(tokens) < size:
+        return set(tokens)
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _stable_hash(value: str) -> int:
+    """프로세스와 무관하게 같은 64비트 해시 (PYTHONHASHSEED 영향 없음)"""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """num_perm개 해시 함수의 MinHash 서명 (일치 비율 ≈ Jaccard 유사도)"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        params = hashlib.blake2b(f"minhash-{seed}".encode(), digest_size=64).digest()
+        self.coefficients = []
+        for i in range(num_perm):
+            block = hashlib.blake2b(params + i.to_bytes(4, "big"), digest_size=16).digest()
+            a = int.from_bytes(block[:8], "big") % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(block[8:], "big") % _MERSENNE_PRIME
+            self.coefficients.append((a, b))
+
+    def signature(self, features: Set[str]) -> Tuple[int, ...]:
+        hashes = [_stable_hash(feature) for feature in features] or [0]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self.coefficients
+        )
+
+
+def estimate_similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+
+@dataclass
+class CorrelatedIncident:
+    """하나로 묶인 장애 (첫 발생이 처리 파이프라인을 실행)"""
+    incident_id: str
+    fingerprint: str
+    signature: Tuple[int, ...]
+    first_seen: datetime
+    last_seen: datetime
+    sample_log: str
+    occurrences: int = 1
+    sources: Dict[str, int] = field(default_factory=dict)
+    # 이 장애로 묶인 지문 (종료 시 지문 색인에서 이것만 삭제)
+    fingerprints: Set[str] = field(default_factory=set)
+    # 첫 발생의 처리 결과 (이벤트 루프 밖에서 상관 분석하면 None)
+    future: Optional[asyncio.Future] = None
+
+
+class IncidentCorrelator:
+    """
+    장애 상관 분석기
+
+    주요 기능:
+    - 정규화 토큰 지문: 호스트/시각/ID만 다른 로그는 같은 지문 (dict 조회 O(1))
+    - 지문이 다르면 MinHash 서명 + LSH 밴드로 유사 장애 후보만 비교
+    - 마지막 발생 후 window 동안 활성 유지, 새 발생은 횟수로 누적
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 900.0,
+        similarity_threshold: float = 0.6,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 2
+    ):
+        """
+        Args:
+            window_seconds: 마지막 발생 후 같은 장애로 묶는 시간
+            similarity_threshold: 유사 장애로 볼 MinHash 추정 Jaccard 유사도
+            num_perm: MinHash 해시 함수 수 (bands로 나누어 떨어져야 함)
+            bands: LSH 밴드 수 (밴드당 num_perm / bands 행)
+            shingle_size: 토큰 n-gram 크기
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어 떨어져야 합니다")
+        self.window = timedelta(seconds=window_seconds)
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm)
+
+        self.incidents: Dict[str, CorrelatedIncident] = {}
+        self._by_fingerprint: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        self._expiry = ExpiryScheduler(
+            resolve_deadline=self._deadline,
+            on_expire=self._expire
+        )
+        self._ids = itertools.count(1)
+
+        self.total_occurrences = 0
+        self.deduplicated = 0
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _deadline(self, incident_id: str) -> Optional[datetime]:
+        incident = self.incidents.get(incident_id)
+        return incident.last_seen + self.window if incident else None
+
+    async def _expire(self, incident_id: str):
+        self.close(incident_id)
+
+    def correlate(
+        self,
+        error_log: str,
+        source: str = "default",
+        now: Optional[datetime] = None
+    ) -> Tuple[CorrelatedIncident, bool]:
+        """
+        장애 1건을 활성 장애에 묶거나 새 장애로 등록
+
+        Returns:
+            (장애, 새 장애 여부) - 새 장애일 때만 처리 파이프라인 실행
+        """
+        now = now or datetime.now()
+        for incident_id in self._expiry.pop_due(now):
+            self.close(incident_id)
+        self.total_occurrences += 1
+
+        tokens = normalize_tokens(error_log)
+        fingerprint = hashlib.blake2b(" ".join(tokens).encode(), digest_size=12).hexdigest()
+
+        # 1) 정규화 후 완전히 같은 로그
+        incident = self.incidents.get(self._by_fingerprint.get(fingerprint, ""))
+        signature = None
+        if incident is None:
+            # 2) LSH 후보 중 유사도 기준 이상인 가장 비슷한 장애
+            signature = self.hasher.signature(shingles(tokens, self.shingle_size))
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates |= self._buckets.get(key, set())
+            best = 0.0
+            for candidate_id in candidates:
+                similarity = estimate_similarity(signature, self.incidents[candidate_id].signature)
+                if similarity >= self.similarity_threshold and similarity > best:
+                    incident, best = self.incidents[candidate_id], similarity
+
+        if incident is not None:
+            incident.occurrences += 1
+            incident.last_seen = now
+            incident.sources[source] = incident.sources.get(source, 0) + 1
+            if fingerprint not in self._by_fingerprint:
+                self._by_fingerprint[fingerprint] = incident.incident_id
+                incident.fingerprints.add(fingerprint)
+            self.deduplicated += 1
+            return incident, False
+
+        incident = CorrelatedIncident(
+            incident_id=f"inc-{next(self._ids):06d}",
+            fingerprint=fingerprint,
+            signature=signature,
+            first_seen=now,
+            last_seen=now,
+            sample_log=error_log,
+            sources={source: 1},
+            fingerprints={fingerprint},
+            future=self._create_future()
+        )
+        self.incidents[incident.incident_id] = incident
+        self._by_fingerprint[fingerprint] = incident.incident_id
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, set()).add(incident.incident_id)
+        self._expiry.schedule(incident.incident_id, now + self.window)
+        logger.info(f"새 장애 등록: {incident.incident_id}")
+        return incident, True
+
+    @staticmethod
+    def _create_future() -> Optional[asyncio.Future]:
+        try:
+            return asyncio.get_running_loop().create_future()
+        except RuntimeError:
+            return None
+
+    def close(self, incident_id: str):
+        """장애 종료 (창 만료 또는 처리 실패 → 다음 발생은 새 장애로 처리)"""
+        incident = self.incidents.pop(incident_id, None)
+        if incident is None:
+            return
+        self._expiry.cancel(incident_id)
+        for fingerprint in incident.fingerprints:
+            if self._by_fingerprint.get(fingerprint) == incident_id:
+                del self._by_fingerprint[fingerprint]
+        for key in self._band_keys(incident.signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(incident_id)
+                if not bucket:
+                    del self._buckets[key]
+        logger.info(
+            f"장애 종료: {incident_id} ({incident.occurrences}회 발생, "
+            f"출처 {len(incident.sources)}곳)"
+        )
+
+    def get_stats(self) -> Dict:
+        return {
+            "active_incidents": len(self.incidents),
+            "total_occurrences": self.total_occurrences,
+            "deduplicated": self.deduplicated,
+            "top_incidents": [
+                {
+                    "incident_id": incident.incident_id,
+                    "occurrences": incident.occurrences,
+                    "sources": len(incident.sources),
+                    "first_seen": incident.first_seen.isoformat(),
+                }
+                for incident in sorted(
+                    self.incidents.values(), key=lambda i: -i.occurrences
+                )[:5]
+            ],
+        }
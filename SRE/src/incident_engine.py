@@ -0,0 +1,213 @@
+"""
+Incident Engine
+장애 처리 대기열 + 고정 크기 워커 풀 (장애별 시간 제한, 대기열 포화 시 거절, 단계별 소요 시간)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+from .latency_stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentQueueFull(Exception):
+    """장애 대기열이 가득 차서 접수 거절"""
+
+
+@contextmanager
+def timed_stage(timings: Dict[str, float], name: str) -> Iterator[None]:
+    """with 블록 소요 시간을 timings[name]에 기록 (초)"""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        timings[name] = round(time.monotonic() - started, 4)
+
+
+@dataclass
+class IncidentJob:
+    """대기 중인 장애 1건"""
+    error_log: str
+    kwargs: Dict
+    enqueued_at: float
+    future: asyncio.Future
+
+
+class IncidentEngine:
+    """
+    장애 동시 처리 엔진
+
+    주요 기능:
+    - 대기열(최대 max_queue_size) + workers개 코루틴이 동시에 처리
+    - 대기열이 가득 차면 즉시 거절(IncidentQueueFull) 또는 빈자리까지 대기
+    - 장애별 시간 제한 (초과 시 처리 취소, 실패 결과 반환)
+    - 단계별 소요 시간 (대기열 대기 + 핸들러가 보고한 timings) p50/p95
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Awaitable[Dict]],
+        workers: int = 8,
+        max_queue_size: int = 100,
+        timeout_seconds: Optional[float] = 300.0,
+        stage_sample_size: int = 1000
+    ):
+        """
+        Args:
+            handler: 장애 1건 처리 코루틴 (error_log, **kwargs) → 결과 dict ("timings" 포함 가능)
+            workers: 동시에 처리할 장애 수
+            max_queue_size: 대기열 최대 길이
+            timeout_seconds: 장애 1건 처리 시간 제한 (대기열 대기 시간 제외, None이면 무제한)
+            stage_sample_size: 단계별 소요 시간 지표용 최근 샘플 수
+        """
+        self.handler = handler
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._stage_sample_size = stage_sample_size
+        self._stages: Dict[str, deque] = {}
+        self._active = 0
+
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def start(self):
+        """워커 시작 (이미 실행 중이면 무시)"""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"incident-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self, drain: bool = True):
+        """
+        워커 종료
+
+        Args:
+            drain: True면 대기열에 남은 장애를 모두 처리한 뒤 종료
+        """
+        if drain and self._workers:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        # 처리되지 못한 장애는 취소로 종료
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if not job.future.done():
+                job.future.cancel()
+            self._queue.task_done()
+
+    async def submit(self, error_log: str, wait: bool = False, **kwargs) -> asyncio.Future:
+        """
+        장애 접수 (처리 결과 Future 반환)
+
+        Args:
+            wait: 대기열이 가득 찼을 때 빈자리까지 기다림 (False면 즉시 거절)
+            kwargs: handler에 그대로 전달 (severity, source, auto_approve 등)
+
+        Raises:
+            IncidentQueueFull: 대기열이 가득 차고 wait=False인 경우
+        """
+        job = IncidentJob(
+            error_log=error_log,
+            kwargs=kwargs,
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future()
+        )
+        if wait:
+            await self._queue.put(job)
+        else:
+            try:
+                self._queue.put_nowait(job)
+            except asyncio.QueueFull:
+                self.rejected += 1
+                raise IncidentQueueFull(
+                    f"장애 대기열 포화: {self._queue.qsize()}/{self._queue.maxsize}"
+                )
+        self.submitted += 1
+        return job.future
+
+    async def process(self, error_log: str, wait: bool = True, **kwargs) -> Dict:
+        """장애 접수 후 결과까지 대기"""
+        return await (await self.submit(error_log, wait=wait, **kwargs))
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                if not job.future.done():
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: IncidentJob):
+        self._active += 1
+        queued = time.monotonic() - job.enqueued_at
+        try:
+            result = await asyncio.wait_for(
+                self.handler(job.error_log, **job.kwargs), self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logger.error(f"장애 처리 시간 초과 ({self.timeout_seconds}초)")
+            result = {
+                "success": False,
+                "message": f"장애 처리 시간 초과 ({self.timeout_seconds}초)",
+                "timed_out": True,
+            }
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"장애 처리 오류: {e}")
+            if not job.future.done():
+                job.future.set_exception(e)
+            return
+        finally:
+            self._active -= 1
+
+        if result.get("success"):
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+        timings = {"queue": round(queued, 4), **result.get("timings", {})}
+        result["timings"] = timings
+        for stage, seconds in timings.items():
+            self._stages.setdefault(stage, deque(maxlen=self._stage_sample_size)).append(seconds)
+        if not job.future.done():
+            job.future.set_result(result)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def get_stats(self) -> Dict:
+        return {
+            "workers": len(self._workers),
+            "active": self._active,
+            "queue_depth": self._queue.qsize(),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "stages": {
+                stage: {
+                    "p50_seconds": round(percentile(samples, 50), 3),
+                    "p95_seconds": round(percentile(samples, 95), 3),
+                }
+                for stage, samples in self._stages.items()
+            },
+        }
@@ -5,13 +5,19 @@ Integrated War Room 2.0 - Production Ready
 
 import asyncio
 import logging
-from typing import Optional, Dict
+from dataclasses import replace
 from pathlib import Path
+from typing import Dict, Optional
 
-from .container_orchestrator import ContainerPoolOrchestrator, ContainerPoolConfig
-from .tier_manager import TierManager, ServerTier
+from .container_orchestrator import ContainerPoolConfig, ContainerPoolOrchestrator
+from .image_builder import ImageBuildResult
+from .image_cache import ImageCacheManager
+from .incident_correlator import IncidentCorrelator
+from .incident_engine import IncidentEngine, timed_stage
 from .mcp_catalog import MCPCatalogSync, MCPServerCandidate
 from .problem_analyzer import ProblemAnalyzer
+from .tier_manager import ServerTier, TierManager
+from .usage_forecast import PrewarmAction, UsageForecaster
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,135 +40,391 @@ class IntegratedWarRoom:
     def __init__(
         self,
         config_dir: str = ".war-room",
-        container_config: Optional[ContainerPoolConfig] = None
+        container_config: Optional[ContainerPoolConfig] = None,
+        tier_backend: str = "json",
+        forecast_prewarm: bool = True,
+        incident_workers: int = 8,
+        incident_queue_size: int = 100,
+        incident_timeout_seconds: float = 300.0,
+        correlate_incidents: bool = True,
+        correlation_window_seconds: float = 900.0
     ):
         """
         Args:
             config_dir: 설정 파일 디렉토리
             container_config: 컨테이너 풀 설정
+            tier_backend: 티어 상태 저장소 ("json" 또는 여러 프로세스가 공유하는 "sqlite")
+            forecast_prewarm: 요일×시간 사용 패턴으로 예상 수요 직전에 사전 시작/pull
+            incident_workers: 동시에 처리할 장애 수 (submit_incident 경로)
+            incident_queue_size: 장애 대기열 최대 길이 (초과 시 거절)
+            incident_timeout_seconds: 장애 1건 처리 시간 제한
+            correlate_incidents: 같은/유사한 에러 로그를 하나의 장애로 묶고 첫 발생만 처리
+            correlation_window_seconds: 마지막 발생 후 같은 장애로 묶는 시간
         """
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        # 컴포넌트 초기화
+        # 컴포넌트 초기화 (자원 프로필은 티어 설정과 같은 디렉토리에 저장)
+        container_config = container_config or ContainerPoolConfig()
+        if container_config.limits_profile_path is None:
+            container_config = replace(
+                container_config,
+                limits_profile_path=str(self.config_dir / "resource-profiles.json")
+            )
         self.orchestrator = ContainerPoolOrchestrator(container_config)
         self.tier_manager = TierManager(
-            str(self.config_dir / "tier-config.json")
+            str(self.config_dir / (
+                "tier-state.db" if tier_backend == "sqlite" else "tier-config.json"
+            )),
+            backend=tier_backend
         )
         self.catalog = MCPCatalogSync()
         self.analyzer = ProblemAnalyzer()
 
+        pool_config = self.orchestrator.config
+        self.image_cache = ImageCacheManager(
+            self.orchestrator.docker_client,
+            self.tier_manager,
+            image_name_for=self.orchestrator._get_image_name,
+            image_prefix=pool_config.image_prefix,
+            budget_mb=pool_config.image_cache_budget_mb,
+            max_parallel_pulls=pool_config.max_parallel_builds,
+            pull_from_registry=pool_config.image_pull_from_registry,
+            image_builder=self.orchestrator.image_builder
+        )
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._tier_writer_task: Optional[asyncio.Task] = None
+
+        # 사용 예측 (저장된 프로필이 없으면 티어 관리자의 사용 이력으로 초기 학습)
+        self.forecast_prewarm = forecast_prewarm
+        self.forecaster = UsageForecaster(profile_path=str(self.config_dir / "usage-forecast.json"))
+        if not self.forecaster.profiles:
+            self.forecaster.fit(self.tier_manager.usage_history())
+        self._forecast_task: Optional[asyncio.Task] = None
+
+        # 장애 동시 처리 (대기열 + 워커 풀), 승인 프롬프트는 한 번에 하나씩
+        self.incidents = IncidentEngine(
+            self.handle_incident,
+            workers=incident_workers,
+            max_queue_size=incident_queue_size,
+            timeout_seconds=incident_timeout_seconds
+        )
+        self._approval_lock = asyncio.Lock()
+
+        # 장애 상관 분석 (폭주 시 같은 장애가 수백 번 들어와도 파이프라인은 1회)
+        self.correlator = IncidentCorrelator(
+            window_seconds=correlation_window_seconds
+        ) if correlate_incidents else None
+
+        # 이미지 빌드 완료 시 실제 크기로 캐시 기록
+        if self.orchestrator.image_builder:
+            self.orchestrator.image_builder.add_listener(self._on_image_built)
+
+        # 단계별 시작 비용 → 티어 계산 (느린 서버는 적게 써도 Warm 유지)
+        self.orchestrator.add_start_cost_listener(self.tier_manager.record_start_cost)
+
         logger.info("War Room 2.0 초기화 완료")
 
     async def handle_incident(
         self,
         error_log: str,
-        auto_approve: bool = False
+        auto_approve: bool = False,
+        severity: str = "medium",
+        source: str = "default"
     ) -> Dict:
         """
         장애 자동 처리
 
+        블로킹 단계(Catalog HTTP 검색, 승인 입력)는 스레드로 넘겨서 여러 장애가 동시에 진행됨.
+        결과의 "timings"에 단계별 소요 시간(초) 기록
+
         Args:
             error_log: 에러 로그
             auto_approve: 자동 승인 여부
+            severity: 장애 심각도 ("critical", "high", "medium", "low") - 시작 대기열 우선순위
+            source: 장애 출처 (알림 채널/서비스 등) - 출처별 공정 큐잉
 
         Returns:
-            처리 결과
+            처리 결과 (묶인 장애면 "deduplicated", "incident_id", "occurrences" 포함)
         """
+        if self.correlator is None:
+            return await self._resolve_incident(error_log, auto_approve, severity, source)
+
+        incident, is_new = self.correlator.correlate(error_log, source=source)
+        if not is_new:
+            logger.info(
+                f"🔗 기존 장애에 병합: {incident.incident_id} "
+                f"({incident.occurrences}회째, 출처 {len(incident.sources)}곳)"
+            )
+            # 첫 발생의 실제 결과를 기다림 (이 호출이 취소되어도 첫 발생 처리는 계속)
+            first = await asyncio.shield(incident.future)
+            return {
+                **first,
+                "deduplicated": True,
+                "incident_id": incident.incident_id,
+                "occurrences": incident.occurrences,
+                "timings": {}
+            }
+
+        try:
+            result = await self._resolve_incident(error_log, auto_approve, severity, source)
+        except BaseException as e:
+            self.correlator.close(incident.incident_id)
+            if not incident.future.done():
+                incident.future.set_result({
+                    "success": False,
+                    "message": f"첫 발생 처리 실패: {e!r}"
+                })
+            raise
+        if not result.get("success"):
+            # 실패한 장애는 묶지 않음 → 다음 발생이 다시 처리 시도
+            self.correlator.close(incident.incident_id)
+        incident.future.set_result(result)
+        return {
+            **result,
+            "incident_id": incident.incident_id,
+            "occurrences": incident.occurrences
+        }
+
+    async def _resolve_incident(
+        self,
+        error_log: str,
+        auto_approve: bool,
+        severity: str,
+        source: str
+    ) -> Dict:
+        """분석 → Catalog 검색 → 승인 → 컨테이너 시작 파이프라인"""
+        timings: Dict[str, float] = {}
         logger.info("=" * 60)
         logger.info("🚨 장애 감지 및 분석 시작")
         logger.info("=" * 60)
 
         # 1단계: 문제 분석
         logger.info("\n🔍 1단계: 문제 분석 중...")
-        keywords = self.analyzer.analyze_problem(error_log)
+        with timed_stage(timings, "analyze"):
+            keywords = self.analyzer.analyze_problem(error_log)
 
         if not keywords:
             return {
                 "success": False,
                 "message": "문제 분석 실패: 키워드를 찾을 수 없습니다",
-                "error_log": error_log
+                "error_log": error_log,
+                "timings": timings
             }
 
         logger.info(f"📌 키워드 추출: {keywords}")
 
-        # 2단계: MCP Catalog 검색
-        logger.info("\n🔎 2단계: MCP Catalog 검색 중...")
-        candidates = self.catalog.search_servers(keywords, limit=3)
+        # 2단계: 해석 캐시 확인, 없으면 MCP Catalog 검색 (동기 HTTP → 스레드)
+        resolution = self.tier_manager.resolutions.get(keywords)
+        server_info = self.tier_manager.servers.get(resolution.server_name) if resolution else None
+        cached = server_info is not None
+        if cached:
+            server_name, version = server_info.name, resolution.version
+            logger.info(f"⚡ 해석 캐시 적중: {server_name} (Catalog 검색 생략)")
+        else:
+            logger.info("\n🔎 2단계: MCP Catalog 검색 중...")
+            with timed_stage(timings, "catalog"):
+                candidates = await asyncio.to_thread(self.catalog.search_servers, keywords, 3)
 
-        if not candidates:
-            return {
-                "success": False,
-                "message": "적합한 MCP 서버를 찾을 수 없습니다",
-                "keywords": keywords
-            }
+            if not candidates:
+                return {
+                    "success": False,
+                    "message": "적합한 MCP 서버를 찾을 수 없습니다",
+                    "keywords": keywords,
+                    "timings": timings
+                }
 
-        # 3단계: 최적 후보 선택
-        best_candidate = candidates[0]
-        logger.info(
-            f"✨ 최적 후보 발견: {best_candidate.name} "
-            f"(점수: {best_candidate.score:.0f}/100)"
-        )
+            # 3단계: 최적 후보 선택 (다음 같은 장애를 위해 해석 캐시에 기록)
+            best_candidate = candidates[0]
+            server_name, version = best_candidate.name, best_candidate.version
+            logger.info(
+                f"✨ 최적 후보 발견: {best_candidate.name} "
+                f"(점수: {best_candidate.score:.0f}/100)"
+            )
+            self.tier_manager.resolutions.put(keywords, candidates)
 
         # 4단계: 티어 확인 또는 등록
-        server_info = self.tier_manager.servers.get(best_candidate.name)
         if not server_info:
-            logger.info(f"🆕 새 서버 등록: {best_candidate.name}")
+            server_info = self.tier_manager.servers.get(server_name)
+        if not server_info:
+            logger.info(f"🆕 새 서버 등록: {server_name}")
             server_info = self.tier_manager.register_server(
-                name=best_candidate.name,
-                package=best_candidate.name,
-                version=best_candidate.version
+                name=server_name,
+                package=server_name,
+                version=version
             )
 
         logger.info(f"📊 현재 티어: {server_info.tier.display_name}")
-        logger.info(f"⏱️ 예상 시작 시간: ~{server_info.tier.expected_start_time}초")
+        logger.info(f"⏱️ 예상 시작 시간: ~{server_info.expected_start_time}초")
 
-        # 5단계: 승인 확인
+        # 5단계: 승인 확인 (입력은 스레드에서, 동시에 하나의 프롬프트만)
         if not auto_approve:
-            approval = input(f"\n{best_candidate.name} 컨테이너를 시작하시겠습니까? (yes/no): ").strip().lower()
-            if approval not in ['yes', 'y']:
+            with timed_stage(timings, "approval"):
+                async with self._approval_lock:
+                    answer = await asyncio.to_thread(
+                        input, f"\n{server_name} 컨테이너를 시작하시겠습니까? (yes/no): "
+                    )
+            if answer.strip().lower() not in ['yes', 'y']:
                 return {
                     "success": False,
                     "message": "사용자가 거부했습니다",
-                    "candidate": best_candidate.name
+                    "candidate": server_name,
+                    "timings": timings
                 }
 
         # 6단계: 컨테이너 시작
         logger.info(f"\n⚙️ 3단계: MCP 서버 컨테이너 시작 중...")
 
         try:
-            container_status = await self.orchestrator.start_container(
-                mcp_server_name=best_candidate.name,
-                environment={
-                    "MCP_PACKAGE": best_candidate.name,
-                    "MCP_VERSION": best_candidate.version
-                }
-            )
+            with timed_stage(timings, "start"):
+                container_status = await self.orchestrator.start_container(
+                    mcp_server_name=server_name,
+                    environment={
+                        "MCP_PACKAGE": server_name,
+                        "MCP_VERSION": version
+                    },
+                    tier=server_info.tier.value,
+                    severity=severity,
+                    source=source
+                )
 
             # 사용 기록
-            self.tier_manager.record_usage(best_candidate.name)
+            self.tier_manager.record_usage(server_name)
+            self.forecaster.observe(server_name)
+            self._maybe_build_image(server_name)
 
             logger.info(f"✅ 컨테이너 시작 완료: {container_status.container_id[:12]}")
+
+            # MCP 핸드셰이크 완료까지 대기 (첫 도구 호출이 설치 시간을 떠안지 않도록)
+            with timed_stage(timings, "ready"):
+                ready = await self.orchestrator.wait_ready(
+                    container_status.container_id,
+                    timeout=self.orchestrator.config.readiness_timeout_seconds
+                )
+            if ready:
+                logger.info(
+                    f"🟢 MCP 준비 완료: {ready.ready_seconds:.1f}초, "
+                    f"도구 {len(ready.tools)}개"
+                )
             logger.info(f"📦 상태: {container_status.status}")
 
             return {
                 "success": True,
-                "message": f"MCP 서버 시작 완료: {best_candidate.name}",
-                "server_name": best_candidate.name,
+                "message": f"MCP 서버 시작 완료: {server_name}",
+                "server_name": server_name,
                 "container_id": container_status.container_id,
                 "tier": server_info.tier.value,
-                "keywords": keywords
+                "tools": ready.tools if ready else [],
+                "keywords": keywords,
+                "resolution": "cache" if cached else "catalog",
+                "timings": timings
             }
 
         except Exception as e:
             logger.error(f"❌ 컨테이너 시작 실패: {e}")
+            # 잘못된 해석일 수 있으므로 다음 같은 장애는 다시 검색
+            self.tier_manager.resolutions.invalidate(keywords)
             return {
                 "success": False,
                 "message": f"컨테이너 시작 실패: {str(e)}",
-                "server_name": best_candidate.name,
-                "error": str(e)
+                "server_name": server_name,
+                "error": str(e),
+                "timings": timings
             }
 
+    async def refresh_resolutions(self, max_age_seconds: float = 3600.0) -> int:
+        """
+        오래된 해석 캐시를 Catalog 검색으로 재검증 (검색 결과가 바뀐 항목은 교체)
+
+        Returns:
+            바뀐 항목 수
+        """
+        changed = 0
+        for keywords in self.tier_manager.resolutions.stale(max_age_seconds):
+            candidates = await asyncio.to_thread(self.catalog.search_servers, keywords, 3)
+            if not candidates:
+                continue  # 검색 실패와 결과 없음을 구분할 수 없으므로 기존 해석 유지
+            if not self.tier_manager.resolutions.revalidate(keywords, candidates):
+                changed += 1
+        return changed
+
+    async def submit_incident(
+        self,
+        error_log: str,
+        wait: bool = False,
+        **kwargs
+    ) -> asyncio.Future:
+        """
+        장애 대기열에 접수 (워커 풀이 동시에 처리, 결과 Future 반환)
+
+        Raises:
+            IncidentQueueFull: 대기열이 가득 차고 wait=False인 경우
+        """
+        return await self.incidents.submit(error_log, wait=wait, **kwargs)
+
+    def _maybe_build_image(self, server_name: str):
+        """캐싱 대상이 되었지만 이미지가 없는 서버의 이미지 빌드 예약"""
+        server = self.tier_manager.servers.get(server_name)
+        if server is None or server.image_cached:
+            return
+        if not self.tier_manager.should_cache_image(server_name):
+            return
+
+        if self.orchestrator.schedule_image_build(server.name, server.package, server.version):
+            logger.info(f"🏗️ 이미지 사전 빌드 예약: {server_name}")
+
+    def _on_image_built(self, result: ImageBuildResult):
+        """이미지 빌드 완료 → 티어 관리자에 캐시 기록"""
+        self.tier_manager.mark_image_cached(
+            result.server_name, result.image_name, result.size_mb
+        )
+
+    def _start_prewarm(self):
+        """Tier 1/2 이미지 백그라운드 사전 준비 (이미 진행 중이면 건너뜀)"""
+        if self._prewarm_task and not self._prewarm_task.done():
+            return
+        self._prewarm_task = asyncio.create_task(self.image_cache.prewarm())
+
+    async def _forecast_loop(self, interval_seconds: float = 60.0):
+        """정각 lead_minutes 전마다 예상 수요 서버 사전 시작/이미지 준비"""
+        while True:
+            for action in self.forecaster.forecast():
+                await self._apply_prewarm(action)
+            await asyncio.sleep(interval_seconds)
+
+    async def _apply_prewarm(self, action: PrewarmAction):
+        """사전 준비 1건 적용 (사용 기록은 남기지 않음 - 예측이 스스로를 강화하지 않도록)"""
+        server = self.tier_manager.servers.get(action.server_name)
+        if server is None:
+            return
+
+        if action.action == "pull":
+            if not server.image_cached and self.orchestrator.schedule_image_build(
+                server.name, server.package, server.version
+            ):
+                logger.info(
+                    f"🔮 예상 수요 이미지 준비: {server.name} "
+                    f"({action.at:%a %H}시, 확률 {action.probability:.0%})"
+                )
+            return
+
+        if self.orchestrator.replica_count(server.name):
+            return
+        try:
+            await self.orchestrator.start_container(
+                mcp_server_name=server.name,
+                environment={"MCP_PACKAGE": server.package, "MCP_VERSION": server.version},
+                tier=server.tier.value,
+                severity="low",
+                source="forecast"
+            )
+            logger.info(
+                f"🔮 예상 수요 사전 시작: {server.name} "
+                f"({action.at:%a %H}시, 확률 {action.probability:.0%})"
+            )
+        except Exception as e:
+            logger.warning(f"사전 시작 실패: {server.name} ({e})")
+
     async def show_status(self):
         """현재 시스템 상태 표시"""
         print("\n" + "=" * 70)
@@ -177,6 +439,25 @@ class IntegratedWarRoom:
         print(f"  • 실행 중: {container_stats['running_containers']}개")
         print(f"  • Idle 상태: {container_stats['idle_containers']}개")
         print(f"  • 총 메모리: {container_stats['total_memory_mb']}MB")
+        npm_cache = container_stats['npm_cache']
+        print(f"  • npm 캐시 적중률: {npm_cache['hit_rate']:.0%} "
+              f"(hit {npm_cache['hits']}, miss {npm_cache['misses']})")
+        admission = container_stats['admission']
+        print(f"  • 시작 대기열: {admission['queue_depth']}건 "
+              f"(대기 p95 {admission['wait_p95_seconds']:.1f}초, 거절 {admission['rejected']}건)")
+        incidents = self.incidents.get_stats()
+        print(f"  • 장애 처리: 진행 {incidents['active']}건, 대기 {incidents['queue_depth']}건 "
+              f"(성공 {incidents['succeeded']}, 실패 {incidents['failed']}, "
+              f"시간 초과 {incidents['timed_out']}, 거절 {incidents['rejected']})")
+        for stage, timing in incidents['stages'].items():
+            print(f"      {stage}: p50 {timing['p50_seconds']:.2f}초, p95 {timing['p95_seconds']:.2f}초")
+        resolutions = self.tier_manager.resolutions.get_stats()
+        print(f"  • 해석 캐시: {resolutions['entries']}개 "
+              f"(적중률 {resolutions['hit_rate']:.0%}, 무효화 {resolutions['invalidations']}회)")
+        if self.correlator:
+            correlation = self.correlator.get_stats()
+            print(f"  • 장애 상관 분석: 활성 {correlation['active_incidents']}건, "
+                  f"병합 {correlation['deduplicated']}/{correlation['total_occurrences']}건")
 
         if containers:
             print(f"\n  상세:")
@@ -186,7 +467,7 @@ class IntegratedWarRoom:
                 print(f"      가동: {c['uptime_minutes']}분, Idle: {c['idle_minutes']}분")
 
         # 티어 관리 상태
-        tier_stats = self.tier_manager.get_stats()
+        tier_stats = await self.tier_manager.get_shared_stats()
 
         print(f"\n📈 티어 관리:")
         print(f"  • 등록된 서버: {tier_stats['total_servers']}개")
@@ -205,7 +486,7 @@ class IntegratedWarRoom:
             print(f"      사용: {most_used['usage']}회 (주간: {most_used['weekly_usage']}회)")
 
         # 캐시 정보
-        cache_stats = self.tier_manager.get_cache_summary()
+        cache_stats = await self.tier_manager.get_shared_cache_summary()
         print(f"\n💾 이미지 캐시:")
         print(f"  • 캐시된 이미지: {cache_stats['cached_count']}개")
         print(f"  • 총 크기: {cache_stats['total_size_mb']}MB")
@@ -228,6 +509,7 @@ class IntegratedWarRoom:
             logger.info(f"    ✅ {len(changes)}개 서버 티어 조정:")
             for name, change in changes.items():
                 logger.info(f"      - {name}: {change}")
+                self._maybe_build_image(name)
         else:
             logger.info("    ℹ️ 티어 변경 사항 없음")
 
@@ -235,23 +517,79 @@ class IntegratedWarRoom:
         logger.info("  3️⃣ 리소스 확인 중...")
         await self.orchestrator._check_memory_pressure()
 
+        # 4. 이미지 캐시 동기화 및 예산 정리
+        logger.info("  4️⃣ 이미지 캐시 정리 중...")
+        report = await self.image_cache.reconcile()
+        pruned = await self.image_cache.enforce_budget()
+        if report.removed or pruned:
+            logger.info(
+                f"    ✅ 캐시 해제 {len(report.removed)}개, 정리 {len(pruned)}개"
+            )
+        # 5. 해석 캐시 재검증 (Catalog 변경 반영)
+        logger.info("  5️⃣ 해석 캐시 재검증 중...")
+        refreshed = await self.refresh_resolutions()
+        if refreshed:
+            logger.info(f"    ✅ 해석 캐시 {refreshed}개 갱신")
+
+        self._start_prewarm()
+        self.forecaster.save()
+
         logger.info("✅ 시스템 최적화 완료")
 
     async def start(self):
         """War Room 시스템 시작"""
         logger.info("🚀 War Room 2.0 시작")
 
+        # 재시작 전부터 실행 중이던 풀 컨테이너 재연결 (warm pool 복구)
+        adopted = await self.orchestrator.reconcile()
+        if adopted:
+            logger.info(f"♻️ 기존 컨테이너 {len(adopted)}개 재연결")
+
+        # 이미지 캐시 정보를 Docker 실제 상태와 맞추고 Tier 1/2 사전 준비
+        await self.image_cache.reconcile()
+        self._start_prewarm()
+
         # 자동 정리 태스크 시작
         await self.orchestrator.start_auto_cleanup()
 
+        # 티어 통계는 메모리에서만 갱신하고 백그라운드에서 모아 저장
+        self._tier_writer_task = asyncio.create_task(self.tier_manager.write_behind())
+
+        if self.forecast_prewarm:
+            self._forecast_task = asyncio.create_task(self._forecast_loop())
+
+        # 장애 처리 워커 풀
+        self.incidents.start()
+
         logger.info("✅ War Room 2.0 실행 중")
 
-    async def shutdown(self):
-        """War Room 시스템 종료"""
+    async def shutdown(self, detach_pool: bool = False):
+        """
+        War Room 시스템 종료
+
+        Args:
+            detach_pool: True면 풀 컨테이너를 남겨두고 종료 (재배포 시 warm pool 유지)
+        """
         logger.info("🛑 War Room 2.0 종료 중...")
 
-        # 오케스트레이터 종료 (모든 컨테이너 정리)
-        await self.orchestrator.shutdown()
+        # 접수된 장애 처리 마무리
+        await self.incidents.stop(drain=True)
+
+        for task in (self._prewarm_task, self._forecast_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        # 오케스트레이터 종료 (detach_pool이 아니면 모든 컨테이너 정리)
+        await self.orchestrator.shutdown(detach=detach_pool)
+
+        # 남은 티어 통계 저장
+        if self._tier_writer_task and not self._tier_writer_task.done():
+            self._tier_writer_task.cancel()
+            await asyncio.gather(self._tier_writer_task, return_exceptions=True)
+        self.tier_manager.flush()
+        self.tier_manager.close()
+        self.forecaster.save()
 
         # Catalog 클라이언트 종료
         self.catalog.close()
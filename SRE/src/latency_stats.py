@@ -0,0 +1,16 @@
+"""
+Latency Stats
+지연 시간/사용량 샘플 백분위수 계산 (여러 컴포넌트 공용)
+"""
+
+import math
+from typing import Iterable
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """nearest-rank 백분위수 (값이 없으면 0)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
@@ -0,0 +1,123 @@
+"""
+NPM Cache Support
+MCP 컨테이너 공용 npm 캐시 볼륨, 로컬 레지스트리 프록시, 캐시 적중률 집계
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict
+
+import docker
+
+logger = logging.getLogger(__name__)
+
+
+# npm(loglevel=http)의 fetch 로그: "npm http fetch GET 200 <url> 12ms (cache hit)"
+NPM_FETCH_PATTERN = re.compile(
+    r"npm http fetch \w+ \d+ \S+ [\d.]+m?s \(cache (hit|miss|revalidated|stale|updated)\)"
+)
+
+# 컨테이너 내부 npm 캐시 경로 (cacache: content-addressed, 동시 쓰기 안전)
+NPM_CACHE_PATH = "/root/.npm"
+
+
+@dataclass
+class NpmCacheStats:
+    """npm 패키지 fetch 캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses + self.revalidated
+
+    @property
+    def hit_rate(self) -> float:
+        """WAN 왕복 없이 처리된 비율 (revalidated는 레지스트리 왕복이 있으므로 제외)"""
+        return self.hits / self.total if self.total else 0.0
+
+    def __add__(self, other: "NpmCacheStats") -> "NpmCacheStats":
+        return NpmCacheStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            revalidated=self.revalidated + other.revalidated
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+def parse_npm_fetch_log(text: str) -> NpmCacheStats:
+    """컨테이너 stderr 로그에서 npm fetch 캐시 결과 집계"""
+    stats = NpmCacheStats()
+    for match in NPM_FETCH_PATTERN.finditer(text):
+        outcome = match.group(1)
+        if outcome in ("hit", "stale"):
+            stats.hits += 1
+        elif outcome in ("revalidated", "updated"):
+            stats.revalidated += 1
+        else:
+            stats.misses += 1
+    return stats
+
+
+def npm_environment(registry_url: str = None) -> Dict[str, str]:
+    """공용 캐시를 쓰도록 하는 npm 환경 변수"""
+    env = {
+        "NPM_CONFIG_CACHE": NPM_CACHE_PATH,
+        # 캐시에 있으면 레지스트리 재검증 없이 사용
+        "NPM_CONFIG_PREFER_OFFLINE": "true",
+        # fetch 로그(cache hit/miss)를 남겨 적중률 집계
+        "NPM_CONFIG_LOGLEVEL": "http",
+    }
+    if registry_url:
+        env["NPM_CONFIG_REGISTRY"] = registry_url
+    return env
+
+
+def ensure_registry_proxy(
+    docker_client: docker.DockerClient,
+    network_name: str,
+    image: str = "verdaccio/verdaccio:5",
+    container_name: str = "war-room-npm-proxy",
+    storage_volume: str = "war-room-npm-registry"
+) -> str:
+    """
+    로컬 캐싱 레지스트리 프록시(Verdaccio) 컨테이너 보장
+
+    war-room-network에 붙어 npmjs를 업링크로 캐싱하므로, 한 번 받은 패키지는
+    이후 어떤 서버가 시작되어도 WAN 왕복 없이 해석됨
+
+    Returns:
+        컨테이너에서 사용할 레지스트리 URL
+    """
+    registry_url = f"http://{container_name}:4873/"
+
+    try:
+        container = docker_client.containers.get(container_name)
+        if container.status != "running":
+            container.start()
+        logger.info(f"npm 레지스트리 프록시 확인: {container_name}")
+        return registry_url
+    except docker.errors.NotFound:
+        pass
+
+    docker_client.containers.run(
+        image=image,
+        name=container_name,
+        hostname=container_name,
+        network=network_name,
+        detach=True,
+        restart_policy={"Name": "unless-stopped"},
+        volumes={storage_volume: {"bind": "/verdaccio/storage", "mode": "rw"}},
+        labels={"war-room.role": "npm-proxy"}
+    )
+    logger.info(f"npm 레지스트리 프록시 시작: {container_name}")
+    return registry_url
@@ -0,0 +1,232 @@
+"""
+MCP Readiness Prober
+컨테이너 stdio로 MCP initialize 핸드셰이크 + list_tools를 수행해 실제 준비 완료 시점 측정
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import docker
+from mcp import ClientSession
+
+from .docker_stdio import attached_stdio_client, open_attach_socket
+from .session_pool import MCPSessionPool
+
+logger = logging.getLogger(__name__)
+
+
+# time-to-ready 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+
+
+class TimeToReadyHistogram:
+    """서버별 time-to-ready 분포 (고정 버킷 + 최근 샘플 백분위수)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, sample_size: int = 200):
+        self.buckets = tuple(buckets)
+        # 마지막 칸은 +Inf
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self._samples: deque = deque(maxlen=sample_size)
+
+    def observe(self, seconds: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 샘플 기준 백분위수 (q: 0~100)"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict:
+        labels = [f"le_{b}" for b in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "mean_seconds": round(self.total_seconds / self.count, 2) if self.count else None,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "buckets": dict(zip(labels, self.bucket_counts)),
+        }
+
+
+@dataclass
+class ReadinessResult:
+    """MCP 준비 완료 결과"""
+    container_id: str
+    server_name: str
+    ready_seconds: float
+    tools: List[str]
+
+
+class ReadinessError(Exception):
+    """MCP 핸드셰이크 실패 또는 시간 초과"""
+
+
+class ReadinessProber:
+    """
+    MCP 레벨 readiness 프로브
+
+    주요 기능:
+    - 컨테이너 stdio attach → initialize 핸드셰이크 → list_tools
+    - 서버별 time-to-ready 히스토그램
+    - wait_ready(container_id, timeout) 대기 API
+    - 준비 완료 리스너 (예: 오케스트레이터의 단계별 시작 비용 측정)
+    """
+
+    def __init__(
+        self,
+        docker_client: docker.DockerClient,
+        probe_timeout_seconds: float = 120.0,
+        open_socket: Optional[Callable[[str], object]] = None,
+        session_pool: Optional[MCPSessionPool] = None
+    ):
+        """
+        Args:
+            docker_client: Docker 클라이언트
+            probe_timeout_seconds: 핸드셰이크 최대 대기 시간 (npm 설치 포함)
+            open_socket: 컨테이너 ID → attach 소켓 (기본: Docker attach API)
+            session_pool: 지정 시 프로브 세션을 닫지 않고 풀에 남겨 도구 호출에 재사용
+        """
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.session_pool = session_pool
+        self._open_socket = open_socket or (
+            lambda container_id: open_attach_socket(docker_client, container_id)
+        )
+        self.histograms: Dict[str, TimeToReadyHistogram] = {}
+        self._probes: Dict[str, asyncio.Task] = {}
+        self._listeners: List[Callable[[ReadinessResult], None]] = []
+
+    def add_listener(self, listener: Callable[[ReadinessResult], None]):
+        """준비 완료 리스너 등록"""
+        self._listeners.append(listener)
+
+    def start_probe(
+        self,
+        container_id: str,
+        server_name: str,
+        started_at: Optional[float] = None
+    ) -> asyncio.Task:
+        """
+        백그라운드 프로브 시작 (이미 진행 중이면 그 태스크 반환)
+
+        Args:
+            started_at: 측정 시작 시각 (time.monotonic, 기본: 지금)
+        """
+        task = self._probes.get(container_id)
+        if task is None:
+            task = asyncio.create_task(self._probe(
+                container_id, server_name,
+                started_at if started_at is not None else time.monotonic()
+            ))
+            self._probes[container_id] = task
+        return task
+
+    def is_ready(self, container_id: str) -> bool:
+        task = self._probes.get(container_id)
+        return (
+            task is not None and task.done()
+            and not task.cancelled() and task.exception() is None
+        )
+
+    async def wait_ready(
+        self,
+        container_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[ReadinessResult]:
+        """
+        MCP 준비 완료까지 대기
+
+        Returns:
+            ReadinessResult (프로브 대상이 아니면 None)
+
+        Raises:
+            asyncio.TimeoutError: timeout 내에 준비되지 않음 (프로브는 계속 진행)
+            ReadinessError: 핸드셰이크 실패
+        """
+        task = self._probes.get(container_id)
+        if task is None:
+            return None
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+    def forget(self, container_id: str):
+        """컨테이너 종료 시 프로브 정리"""
+        task = self._probes.pop(container_id, None)
+        if task and not task.done():
+            task.cancel()
+
+    def expected_start_time(self, server_name: str) -> Optional[float]:
+        """측정된 time-to-ready (p90, 측정값 없으면 None)"""
+        histogram = self.histograms.get(server_name)
+        return histogram.percentile(90) if histogram else None
+
+    def get_stats(self) -> Dict:
+        return {name: h.to_dict() for name, h in self.histograms.items()}
+
+    async def _probe(
+        self,
+        container_id: str,
+        server_name: str,
+        started_at: float
+    ) -> ReadinessResult:
+        try:
+            tools = await asyncio.wait_for(
+                self._handshake(container_id, server_name), self.probe_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            raise ReadinessError(
+                f"MCP 준비 시간 초과: {server_name} ({self.probe_timeout_seconds:.0f}초)"
+            )
+        except Exception as e:
+            raise ReadinessError(f"MCP 핸드셰이크 실패: {server_name} ({e})") from e
+
+        result = ReadinessResult(
+            container_id=container_id,
+            server_name=server_name,
+            ready_seconds=time.monotonic() - started_at,
+            tools=tools
+        )
+        self.histograms.setdefault(server_name, TimeToReadyHistogram()).observe(result.ready_seconds)
+        logger.info(
+            f"MCP 준비 완료: {server_name} "
+            f"({result.ready_seconds:.1f}초, 도구 {len(tools)}개)"
+        )
+
+        for listener in self._listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                logger.error(f"readiness 리스너 오류: {e}")
+
+        return result
+
+    async def _handshake(self, container_id: str, server_name: str) -> List[str]:
+        """initialize + list_tools (서버가 stdin을 읽기 시작할 때까지 요청은 파이프에 대기)"""
+        if self.session_pool:
+            pooled = await self.session_pool.connect(container_id, server_name)
+            return [tool.name for tool in pooled.tools]
+
+        sock = await asyncio.to_thread(self._open_socket, container_id)
+        async with attached_stdio_client(sock) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                result = await session.list_tools()
+        return [tool.name for tool in result.tools]
+
+    async def shutdown(self):
+        """진행 중인 프로브 취소"""
+        tasks = list(self._probes.values())
+        self._probes.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
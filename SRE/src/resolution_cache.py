@@ -0,0 +1,167 @@
+"""
+Resolution Cache
+키워드 집합 → 선택된 MCP 서버 학습 캐시 (반복 장애는 Catalog 검색 생략)
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def resolution_key(keywords: Iterable[str]) -> str:
+    """키워드 순서/중복/대소문자와 무관한 캐시 키"""
+    return ",".join(sorted({keyword.strip().lower() for keyword in keywords}))
+
+
+def catalog_snapshot(candidates: Iterable) -> str:
+    """검색 결과 후보(name@version) 순서까지 반영한 Catalog 스냅샷 ID"""
+    digest = hashlib.sha1(
+        "\n".join(f"{c.name}@{c.version}" for c in candidates).encode()
+    )
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class Resolution:
+    """키워드 집합에 대해 선택된 서버"""
+    server_name: str
+    version: str
+    # 선택 당시 Catalog 검색 결과 스냅샷
+    snapshot: str
+    resolved_at: float
+    hits: int = 0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Resolution":
+        return cls(**data)
+
+
+class ResolutionCache:
+    """
+    장애 키워드 → 서버 해석 캐시
+
+    주요 기능:
+    - 같은 키워드 집합이면 Catalog 검색 없이 이전에 선택한 서버 반환
+    - 재검증 시 검색 결과 스냅샷이 바뀌었으면 새 결과로 교체
+    - 해석 실패(컨테이너 시작 실패 등) 시 무효화 → 다음 장애는 다시 검색
+    - 최근 사용 순 max_entries개 유지, 변경 시 on_change로 저장 요청 (티어 상태와 함께 저장)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        on_change: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            on_change: 항목 추가/교체/재검증/무효화 시 호출 (영속화)
+        """
+        self.max_entries = max_entries
+        self.on_change = on_change
+        self._entries: "OrderedDict[str, Resolution]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def get(self, keywords: Iterable[str]) -> Optional[Resolution]:
+        """캐시된 해석 (없으면 None)"""
+        key = resolution_key(keywords)
+        resolution = self._entries.get(key)
+        if resolution is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        resolution.hits += 1
+        self.hits += 1
+        return resolution
+
+    def put(self, keywords: Iterable[str], candidates: List) -> Resolution:
+        """검색 결과의 최상위 후보를 키워드 집합의 해석으로 기록"""
+        key = resolution_key(keywords)
+        best = candidates[0]
+        resolution = Resolution(
+            server_name=best.name,
+            version=best.version,
+            snapshot=catalog_snapshot(candidates),
+            resolved_at=time.time()
+        )
+        self._entries[key] = resolution
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._changed()
+        return resolution
+
+    def revalidate(self, keywords: Iterable[str], candidates: List) -> bool:
+        """
+        새 검색 결과(비어 있지 않음)로 재검증
+
+        Returns:
+            스냅샷이 그대로면 True, 바뀌었으면 새 결과로 교체하고 False
+        """
+        key = resolution_key(keywords)
+        resolution = self._entries.get(key)
+        if resolution is not None and resolution.snapshot == catalog_snapshot(candidates):
+            # 검증 시각도 저장 (재시작 후 방금 검증한 항목을 다시 검색하지 않도록)
+            resolution.resolved_at = time.time()
+            self._changed()
+            return True
+
+        self.invalidations += 1
+        if resolution is not None:
+            logger.info(f"Catalog 변경으로 해석 캐시 갱신: [{key}] {resolution.server_name}")
+        self.put(keywords, candidates)
+        return False
+
+    def invalidate(self, keywords: Iterable[str]):
+        """해석 실패한 키워드 집합 무효화"""
+        resolution = self._entries.pop(resolution_key(keywords), None)
+        if resolution is None:
+            return
+        self.invalidations += 1
+        logger.info(f"해석 캐시 무효화: {resolution.server_name}")
+        self._changed()
+
+    def stale(self, max_age_seconds: float, now: Optional[float] = None) -> List[List[str]]:
+        """마지막 검증 후 max_age_seconds가 지난 키워드 집합 목록"""
+        now = now or time.time()
+        return [
+            key.split(",") for key, resolution in self._entries.items()
+            if now - resolution.resolved_at >= max_age_seconds
+        ]
+
+    def to_dict(self) -> Dict[str, Dict]:
+        return {key: resolution.to_dict() for key, resolution in self._entries.items()}
+
+    def load(self, data: Optional[Dict[str, Dict]]):
+        """저장된 항목 복원 (on_change 호출 없음)"""
+        self._entries = OrderedDict(
+            (key, Resolution.from_dict(entry)) for key, entry in (data or {}).items()
+        )
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,225 @@
+"""
+Resource Limits Autotuner
+서버별 메모리/CPU 사용량 p95로 컨테이너 자원 제한 자동 조정
+"""
+
+import json
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .latency_stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+def cpu_cores_from_stats(stats: Dict) -> float:
+    """docker stats(stream=False) 결과 → 사용 CPU 코어 수"""
+    cpu = stats.get("cpu_stats") or {}
+    precpu = stats.get("precpu_stats") or {}
+    cpu_delta = (
+        cpu.get("cpu_usage", {}).get("total_usage", 0)
+        - precpu.get("cpu_usage", {}).get("total_usage", 0)
+    )
+    system_delta = cpu.get("system_cpu_usage", 0) - precpu.get("system_cpu_usage", 0)
+    if cpu_delta <= 0 or system_delta <= 0:
+        return 0.0
+    online_cpus = cpu.get("online_cpus") or len(
+        cpu.get("cpu_usage", {}).get("percpu_usage") or []
+    ) or 1
+    return cpu_delta / system_delta * online_cpus
+
+
+@dataclass
+class ResourceProfile:
+    """서버 1개의 최근 자원 사용 샘플과 마지막 적용 제한"""
+    server_name: str
+    memory_samples: deque = field(default_factory=deque)
+    cpu_samples: deque = field(default_factory=deque)
+    # 샘플 수집 당시 적용 중이던 제한 (포화 판단용)
+    memory_limit_mb: int = 0
+    cpu_limit: float = 0.0
+    updated_at: Optional[datetime] = None
+
+    @property
+    def p95_memory_mb(self) -> float:
+        return percentile(self.memory_samples, 95)
+
+    @property
+    def p95_cpus(self) -> float:
+        return percentile(self.cpu_samples, 95)
+
+    def to_dict(self) -> Dict:
+        return {
+            "server_name": self.server_name,
+            "memory_samples": list(self.memory_samples),
+            "cpu_samples": [round(c, 4) for c in self.cpu_samples],
+            "memory_limit_mb": self.memory_limit_mb,
+            "cpu_limit": self.cpu_limit,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class LimitsAutotuner:
+    """
+    서버별 자원 제한 자동 조정
+
+    주요 기능:
+    - 메모리 확인 주기마다 수집한 사용량으로 서버별 p95 산출
+    - p95 × 여유율로 제한 추천 (샘플 부족하면 기본값)
+    - 제한에 붙어 있는(포화) 서버는 단계적으로 상향
+    - 프로필 JSON 저장/로드 (TierManager 설정과 같은 디렉토리)
+    """
+
+    # 사용량이 제한의 이 비율 이상이면 포화로 보고 상향
+    SATURATION_RATIO = 0.9
+    GROWTH_FACTOR = 1.5
+
+    def __init__(
+        self,
+        profile_path: Optional[str] = None,
+        headroom: float = 1.3,
+        min_samples: int = 10,
+        window: int = 288,
+        min_memory_mb: int = 64,
+        max_memory_mb: int = 2048,
+        min_cpus: float = 0.1,
+        max_cpus: float = 2.0
+    ):
+        """
+        Args:
+            profile_path: 프로필 저장 경로 (None이면 메모리에만 유지)
+            headroom: p95 대비 여유율
+            min_samples: 추천에 필요한 최소 샘플 수
+            window: 서버별 유지할 최근 샘플 수
+            min_memory_mb / max_memory_mb: 메모리 제한 범위
+            min_cpus / max_cpus: CPU 제한 범위 (코어)
+        """
+        self.profile_path = Path(profile_path) if profile_path else None
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self.window = window
+        self.min_memory_mb = min_memory_mb
+        self.max_memory_mb = max_memory_mb
+        self.min_cpus = min_cpus
+        self.max_cpus = max_cpus
+        self.profiles: Dict[str, ResourceProfile] = {}
+        self._dirty = False
+        self.load()
+
+    def _profile(self, server_name: str) -> ResourceProfile:
+        profile = self.profiles.get(server_name)
+        if profile is None:
+            profile = ResourceProfile(
+                server_name=server_name,
+                memory_samples=deque(maxlen=self.window),
+                cpu_samples=deque(maxlen=self.window)
+            )
+            self.profiles[server_name] = profile
+        return profile
+
+    def observe(
+        self,
+        server_name: str,
+        memory_mb: int,
+        cpus: float,
+        memory_limit_mb: int = 0,
+        cpu_limit: float = 0.0
+    ):
+        """컨테이너 1개의 사용량 샘플 기록"""
+        profile = self._profile(server_name)
+        profile.memory_samples.append(memory_mb)
+        profile.cpu_samples.append(cpus)
+        if memory_limit_mb:
+            profile.memory_limit_mb = memory_limit_mb
+        if cpu_limit:
+            profile.cpu_limit = cpu_limit
+        profile.updated_at = datetime.now()
+        self._dirty = True
+
+    def recommend(
+        self,
+        server_name: str,
+        default_memory_mb: int,
+        default_cpus: float
+    ) -> Tuple[int, float]:
+        """
+        다음 시작 시 적용할 제한 (메모리 MB, CPU 코어)
+
+        샘플이 min_samples 미만이면 기본값 그대로
+        """
+        profile = self.profiles.get(server_name)
+        if profile is None or len(profile.memory_samples) < self.min_samples:
+            return default_memory_mb, default_cpus
+
+        memory_mb = profile.p95_memory_mb * self.headroom
+        if profile.memory_limit_mb and profile.p95_memory_mb >= profile.memory_limit_mb * self.SATURATION_RATIO:
+            memory_mb = max(memory_mb, profile.memory_limit_mb * self.GROWTH_FACTOR)
+
+        cpus = profile.p95_cpus * self.headroom
+        if profile.cpu_limit and profile.p95_cpus >= profile.cpu_limit * self.SATURATION_RATIO:
+            cpus = max(cpus, profile.cpu_limit * self.GROWTH_FACTOR)
+
+        # 메모리는 16MB 단위로 올림
+        memory_mb = int(math.ceil(memory_mb / 16) * 16)
+        return (
+            min(max(memory_mb, self.min_memory_mb), self.max_memory_mb),
+            round(min(max(cpus, self.min_cpus), self.max_cpus), 2)
+        )
+
+    def load(self):
+        """프로필 파일 로드"""
+        if not self.profile_path or not self.profile_path.exists():
+            return
+
+        try:
+            with open(self.profile_path, 'r') as f:
+                data = json.load(f)
+
+            for item in data.get("profiles", []):
+                profile = self._profile(item["server_name"])
+                profile.memory_samples.extend(item.get("memory_samples", []))
+                profile.cpu_samples.extend(item.get("cpu_samples", []))
+                profile.memory_limit_mb = item.get("memory_limit_mb", 0)
+                profile.cpu_limit = item.get("cpu_limit", 0.0)
+                if item.get("updated_at"):
+                    profile.updated_at = datetime.fromisoformat(item["updated_at"])
+
+            logger.info(f"자원 프로필 로드 완료: {len(self.profiles)}개 서버")
+
+        except Exception as e:
+            logger.error(f"자원 프로필 로드 실패: {e}")
+
+    def save(self):
+        """변경된 프로필 저장"""
+        if not self.profile_path or not self._dirty:
+            return
+
+        try:
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.profile_path, 'w') as f:
+                json.dump(
+                    {"profiles": [p.to_dict() for p in self.profiles.values()]},
+                    f,
+                    indent=2
+                )
+            self._dirty = False
+
+        except Exception as e:
+            logger.error(f"자원 프로필 저장 실패: {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            name: {
+                "samples": len(profile.memory_samples),
+                "p95_memory_mb": profile.p95_memory_mb,
+                "p95_cpus": round(profile.p95_cpus, 3),
+                "memory_limit_mb": profile.memory_limit_mb,
+                "cpu_limit": profile.cpu_limit,
+            }
+            for name, profile in self.profiles.items()
+        }
@@ -0,0 +1,196 @@
+"""
+MCP Session Pool
+레플리카별로 초기화된 MCP ClientSession을 유지해 도구 호출 시 attach/핸드셰이크 비용 제거
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import anyio
+from mcp import ClientSession, McpError, types
+from mcp.types import CONNECTION_CLOSED
+
+from .docker_stdio import attached_stdio_client
+
+logger = logging.getLogger(__name__)
+
+
+# 연결이 끊긴 것으로 판단하는 예외 (재연결 후 1회 재시도)
+CONNECTION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+
+class PooledSession:
+    """
+    컨테이너 1개에 대한 초기화된 MCP 세션
+
+    ClientSession은 전용 태스크 안에서 열고 닫음 (anyio cancel scope 규칙).
+    다른 태스크는 session으로 요청만 보내며, 동시 요청은 JSON-RPC ID로 다중화됨
+    """
+
+    def __init__(self, container_id: str, server_name: str):
+        self.container_id = container_id
+        self.server_name = server_name
+        self.session: Optional[ClientSession] = None
+        self.tools: List[types.Tool] = []
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self._task is not None and not self._task.done()
+            and self._ready.done() and not self._ready.cancelled()
+            and self._ready.exception() is None
+        )
+
+    def start(self, sock):
+        self._task = asyncio.create_task(self._hold(sock))
+
+    async def wait_ready(self):
+        await asyncio.shield(self._ready)
+
+    async def _hold(self, sock):
+        try:
+            async with attached_stdio_client(sock) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self.tools = (await session.list_tools()).tools
+                    self.session = session
+                    self._ready.set_result(self)
+                    await self._closing.wait()
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+                self._ready.exception()  # 대기자가 없어도 경고가 남지 않도록 조회 처리
+            else:
+                logger.warning(f"MCP 세션 종료: {self.server_name} ({e})")
+        finally:
+            self.session = None
+            if not self._ready.done():
+                self._ready.cancel()
+
+    async def close(self):
+        """세션 종료 (정상 종료를 잠시 기다린 뒤 취소)"""
+        self._closing.set()
+        if self._task is None or self._task.done():
+            return
+        _, pending = await asyncio.wait({self._task}, timeout=2.0)
+        for task in pending:
+            task.cancel()
+
+
+class MCPSessionPool:
+    """
+    컨테이너 레플리카별 MCP 세션 풀
+
+    주요 기능:
+    - 레플리카당 ClientSession 1개 유지 (single-flight 연결)
+    - 동시 도구 호출 다중화 (요청 ID 기반)
+    - 서버별 list_tools 결과 캐시
+    - 연결 끊김 시 재연결 후 재시도
+    """
+
+    def __init__(
+        self,
+        open_socket: Callable[[str], object],
+        call_timeout_seconds: Optional[float] = 60.0
+    ):
+        """
+        Args:
+            open_socket: 컨테이너 ID → attach 소켓 (블로킹)
+            call_timeout_seconds: 도구 호출 기본 타임아웃
+        """
+        self._open_socket = open_socket
+        self.call_timeout_seconds = call_timeout_seconds
+        self._sessions: Dict[str, PooledSession] = {}
+        self.tools_cache: Dict[str, List[types.Tool]] = {}
+
+    async def connect(self, container_id: str, server_name: str) -> PooledSession:
+        """
+        세션 획득 (없거나 끊겼으면 attach + initialize + list_tools)
+
+        같은 컨테이너 동시 연결 요청은 하나의 연결로 합쳐짐
+        """
+        pooled = self._sessions.get(container_id)
+        if pooled is None or (pooled._ready.done() and not pooled.alive):
+            if pooled is not None:
+                logger.info(f"MCP 세션 재연결: {server_name} ({container_id[:12]})")
+                await pooled.close()
+            pooled = PooledSession(container_id, server_name)
+            self._sessions[container_id] = pooled
+            try:
+                sock = await asyncio.to_thread(self._open_socket, container_id)
+            except Exception as e:
+                self._sessions.pop(container_id, None)
+                pooled._ready.set_exception(e)
+                pooled._ready.exception()
+                raise
+            pooled.start(sock)
+
+        try:
+            await pooled.wait_ready()
+        except BaseException:
+            if self._sessions.get(container_id) is pooled:
+                del self._sessions[container_id]
+            raise
+
+        self.tools_cache[server_name] = pooled.tools
+        return pooled
+
+    async def call_tool(
+        self,
+        container_id: str,
+        server_name: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> types.CallToolResult:
+        """
+        도구 호출 (연결이 끊겨 있으면 재연결 후 1회 재시도)
+
+        Raises:
+            McpError: 서버 오류 또는 타임아웃
+        """
+        timeout = timeout if timeout is not None else self.call_timeout_seconds
+        read_timeout = timedelta(seconds=timeout) if timeout else None
+
+        for attempt in range(2):
+            pooled = await self.connect(container_id, server_name)
+            session = pooled.session
+            try:
+                if session is None:
+                    raise anyio.ClosedResourceError()
+                return await session.call_tool(
+                    tool_name, arguments, read_timeout_seconds=read_timeout
+                )
+            except McpError as e:
+                if e.error.code != CONNECTION_CLOSED or attempt:
+                    raise
+            except CONNECTION_ERRORS:
+                if attempt:
+                    raise
+
+            logger.warning(f"MCP 연결 끊김, 재연결 후 재시도: {server_name} ({tool_name})")
+            await self.close(container_id)
+
+    def cached_tools(self, server_name: str) -> Optional[List[types.Tool]]:
+        """캐시된 list_tools 결과 (연결 이력이 없으면 None)"""
+        return self.tools_cache.get(server_name)
+
+    async def close(self, container_id: str):
+        """컨테이너 세션 종료 (컨테이너 종료 시)"""
+        pooled = self._sessions.pop(container_id, None)
+        if pooled:
+            await pooled.close()
+
+    def session_count(self) -> int:
+        return sum(1 for s in self._sessions.values() if s.alive)
+
+    async def shutdown(self):
+        """모든 세션 종료"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*[s.close() for s in sessions], return_exceptions=True)
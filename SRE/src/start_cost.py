@@ -0,0 +1,81 @@
+"""
+Start Cost Model
+서버별 콜드 스타트 비용 측정 (이미지 준비 / 컨테이너 실행 / MCP 준비 단계별 EWMA)
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+# 측정값 가중치 (EWMA)
+EWMA_ALPHA = 0.3
+
+# 티어 계산 시 사용 수에 곱하는 시작 비용 배율 = 시작 시간 / 기준 시간 (범위 제한)
+# 60초 걸리는 서버는 주 1회만 써도 4회처럼, 2초짜리는 4회 써야 1회처럼 취급
+REFERENCE_START_SECONDS = 10.0
+MIN_COST_FACTOR = 0.25
+MAX_COST_FACTOR = 4.0
+
+
+@dataclass
+class StartCostSample:
+    """컨테이너 1회 시작의 단계별 측정값 (초)"""
+    server_name: str
+    # 이미지 확인/빌드/호스트 간 복사
+    image_seconds: float
+    # 컨테이너 생성 + 시작 (containers.run)
+    run_seconds: float
+    # 프로세스 시작 → MCP initialize + list_tools 성공
+    ready_seconds: float
+    # 이미지가 없어서 준비(빌드/복사)했는지
+    image_prepared: bool = False
+
+    @property
+    def total_seconds(self) -> float:
+        return self.image_seconds + self.run_seconds + self.ready_seconds
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    return value if previous is None else (1 - EWMA_ALPHA) * previous + EWMA_ALPHA * value
+
+
+@dataclass
+class StartCost:
+    """
+    서버 1개의 시작 비용 추정
+
+    이미지 준비 시간은 실제로 준비한 경우만 반영 (이미지가 있을 때의 확인 시간으로 희석되지 않도록)
+    """
+    image_seconds: Optional[float] = None
+    run_seconds: Optional[float] = None
+    ready_seconds: Optional[float] = None
+    samples: int = 0
+
+    def observe(self, sample: StartCostSample):
+        if sample.image_prepared:
+            self.image_seconds = _ewma(self.image_seconds, sample.image_seconds)
+        self.run_seconds = _ewma(self.run_seconds, sample.run_seconds)
+        self.ready_seconds = _ewma(self.ready_seconds, sample.ready_seconds)
+        self.samples += 1
+
+    def expected_seconds(self, image_cached: bool) -> Optional[float]:
+        """다음 콜드 스타트 예상 시간 (측정값 없으면 None)"""
+        if not self.samples:
+            return None
+        seconds = (self.run_seconds or 0.0) + (self.ready_seconds or 0.0)
+        if not image_cached:
+            seconds += self.image_seconds or 0.0
+        return seconds
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "StartCost":
+        return cls(**(data or {}))
+
+
+def cost_factor(start_seconds: Optional[float]) -> float:
+    """시작 비용 배율 (측정값 없으면 1: 사용 빈도만으로 판단)"""
+    if start_seconds is None:
+        return 1.0
+    return min(max(start_seconds / REFERENCE_START_SECONDS, MIN_COST_FACTOR), MAX_COST_FACTOR)
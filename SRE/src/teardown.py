@@ -0,0 +1,180 @@
+"""
+Bulk Teardown
+여러 컨테이너를 하나의 유예 데드라인 안에서 동시에 종료/제거
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import docker
+from docker.models.containers import Container
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TeardownTarget:
+    """종료 대상 컨테이너 1개"""
+    container_id: str
+    server_name: str
+    client: docker.DockerClient
+
+
+@dataclass
+class TeardownReport:
+    """일괄 종료 결과 및 단계별 소요 시간"""
+    total: int = 0
+    graceful: int = 0   # 유예 시간 안에 스스로 종료
+    killed: int = 0     # 데드라인 후 강제 종료
+    missing: int = 0    # 이미 없던 컨테이너
+    failed: List[str] = field(default_factory=list)
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.phase_seconds.values())
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "graceful": self.graceful,
+            "killed": self.killed,
+            "missing": self.missing,
+            "failed": list(self.failed),
+            "phase_seconds": {k: round(v, 3) for k, v in self.phase_seconds.items()},
+            "total_seconds": round(self.total_seconds, 3),
+        }
+
+
+async def teardown_containers(
+    targets: List[TeardownTarget],
+    grace_seconds: float = 10.0,
+    max_workers: int = 32,
+    before_remove: Optional[Callable[[Container], None]] = None
+) -> TeardownReport:
+    """
+    컨테이너 일괄 종료
+
+    1. signal: 모든 컨테이너에 StopSignal(기본 SIGTERM) 동시 전송
+    2. grace: 공통 데드라인까지 종료 대기 (컨테이너별 timeout을 합산하지 않음)
+    3. kill: 데드라인까지 남은 컨테이너 SIGKILL
+    4. remove: 동시 제거 (before_remove 콜백 후)
+
+    Args:
+        targets: 종료 대상
+        grace_seconds: 전체 공통 유예 시간
+        max_workers: Docker API 호출 스레드 수 (wait가 스레드를 점유하므로 기본 풀과 분리)
+        before_remove: 제거 직전 호출 (로그 수집 등, 블로킹 함수)
+    """
+    report = TeardownReport(total=len(targets))
+    if not targets:
+        return report
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(targets))),
+        thread_name_prefix="teardown"
+    )
+
+    def run(func, *args, **kwargs):
+        return loop.run_in_executor(executor, lambda: func(*args, **kwargs))
+
+    async def timed(phase: str, coros):
+        started = time.monotonic()
+        results = await asyncio.gather(*coros)
+        report.phase_seconds[phase] = time.monotonic() - started
+        return results
+
+    try:
+        # 1. 종료 시그널
+        def signal(target: TeardownTarget) -> tuple:
+            try:
+                container = target.client.containers.get(target.container_id)
+                stop_signal = (container.attrs.get("Config") or {}).get("StopSignal") or "SIGTERM"
+                container.kill(signal=stop_signal)
+                return container, None
+            except docker.errors.NotFound:
+                return None, "missing"
+            except docker.errors.APIError as e:
+                # 이미 종료된 컨테이너(409)도 제거는 진행
+                logger.debug(f"종료 시그널 실패: {target.server_name} ({e})")
+                try:
+                    return target.client.containers.get(target.container_id), None
+                except docker.errors.NotFound:
+                    return None, "missing"
+                except docker.errors.APIError:
+                    return None, "failed"
+
+        signaled = await timed("signal", [run(signal, t) for t in targets])
+        alive = []
+        for target, (container, outcome) in zip(targets, signaled):
+            if container is not None:
+                alive.append((target, container))
+            elif outcome == "missing":
+                report.missing += 1
+            else:
+                report.failed.append(target.container_id)
+
+        # 2. 공통 데드라인까지 대기
+        deadline = time.monotonic() + grace_seconds
+
+        def wait_exit(container: Container) -> bool:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                container.wait(timeout=remaining)
+                return True
+            except docker.errors.NotFound:
+                return True
+            except Exception:
+                return False  # 시간 초과 (requests ReadTimeout/ConnectionError)
+
+        exited = await timed("grace", [run(wait_exit, c) for _, c in alive])
+        stragglers = [(t, c) for (t, c), done in zip(alive, exited) if not done]
+        report.graceful = len(alive) - len(stragglers)
+
+        # 3. 남은 컨테이너 강제 종료
+        def kill(target: TeardownTarget, container: Container):
+            try:
+                container.kill()
+            except docker.errors.NotFound:
+                pass
+            except docker.errors.APIError as e:
+                logger.debug(f"강제 종료 실패: {target.server_name} ({e})")
+
+        await timed("kill", [run(kill, t, c) for t, c in stragglers])
+        report.killed = len(stragglers)
+
+        # 4. 동시 제거
+        def remove(target: TeardownTarget, container: Container) -> bool:
+            if before_remove:
+                try:
+                    before_remove(container)
+                except Exception as e:
+                    logger.debug(f"제거 전 처리 실패: {target.server_name} ({e})")
+            try:
+                container.remove(force=True)
+            except docker.errors.NotFound:
+                pass
+            except docker.errors.APIError as e:
+                logger.error(f"컨테이너 제거 실패: {target.server_name} ({e})")
+                return False
+            return True
+
+        removed = await timed("remove", [run(remove, t, c) for t, c in alive])
+        report.failed.extend(t.container_id for (t, _), ok in zip(alive, removed) if not ok)
+
+    finally:
+        executor.shutdown(wait=False)
+
+    logger.info(
+        f"컨테이너 {report.total}개 일괄 종료: 정상 {report.graceful}, "
+        f"강제 {report.killed}, 없음 {report.missing}, 실패 {len(report.failed)} "
+        f"({report.total_seconds:.1f}초)"
+    )
+    return report
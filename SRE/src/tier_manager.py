@@ -3,13 +3,31 @@ Tier-based Server Manager
 사용 패턴에 따른 MCP 서버 계층화 관리
 """
 
+import asyncio
+import atexit
 import json
-from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .resolution_cache import ResolutionCache
+from .start_cost import StartCost, StartCostSample, cost_factor
+from .tier_store import SQLiteTierStore
+from .usage_journal import UsageJournal
+from .usage_window import HourlyUsageWindow
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 동작
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +53,7 @@ class ServerTier(Enum):
 
     @property
     def expected_start_time(self) -> int:
-        """예상 시작 시간 (초)"""
+        """예상 시작 시간 기본값 (초, 측정값이 없을 때 사용)"""
         times = {
             self.TIER_1_HOT: 3,
             self.TIER_2_WARM: 5,
@@ -44,6 +62,18 @@ class ServerTier(Enum):
         return times[self]
 
 
+# 최근 7일 수요(사용 수 × 시작 비용 배율) 기준 승격/강등 임계값
+# 강등 기준을 승격 기준보다 낮게 둬서 경계 근처 서버의 티어가 왔다 갔다 하지 않도록 함
+PROMOTE_THRESHOLDS = {
+    ServerTier.TIER_1_HOT: 10,   # Warm → Hot: 10회 이상
+    ServerTier.TIER_2_WARM: 3,   # Cold → Warm: 3회 이상
+}
+DEMOTE_THRESHOLDS = {
+    ServerTier.TIER_1_HOT: 3,    # Hot → Warm: 3회 미만
+    ServerTier.TIER_2_WARM: 1,   # Warm → Cold: 1회 미만
+}
+
+
 @dataclass
 class ServerInfo:
     """서버 정보 및 통계"""
@@ -52,9 +82,9 @@ class ServerInfo:
     version: str
     tier: ServerTier
 
-    # 통계
+    # 통계 (최근 7일 사용 수는 시간 단위 rolling window)
     total_usage_count: int = 0
-    weekly_usage_count: int = 0
+    usage_window: HourlyUsageWindow = field(default_factory=HourlyUsageWindow)
     last_used_at: Optional[datetime] = None
     first_seen_at: Optional[datetime] = None
 
@@ -63,33 +93,72 @@ class ServerInfo:
     image_cached: bool = False
     image_size_mb: int = 0
 
+    # 단계별 시작 비용 (이미지 준비 / 컨테이너 실행 / MCP 준비, EWMA)
+    start_cost: StartCost = field(default_factory=StartCost)
+
     # 메타데이터
     last_tier_adjustment: Optional[datetime] = None
 
+    @property
+    def expected_start_time(self) -> float:
+        """예상 시작 시간 (초): 단계별 측정값, 없으면 티어 기본값"""
+        seconds = self.start_cost.expected_seconds(self.image_cached)
+        if seconds is not None:
+            return round(seconds, 1)
+        return self.tier.expected_start_time
+
+    @property
+    def cold_start_seconds(self) -> Optional[float]:
+        """캐시/풀 없이 시작할 때 측정된 비용 (측정값 없으면 None)"""
+        return self.start_cost.expected_seconds(image_cached=False)
+
+    @property
+    def demand_score(self) -> float:
+        """
+        티어 계산용 수요 = 최근 7일 사용 수 × 시작 비용 배율
+
+        빠른 서버의 할인은 Hot 승격만 늦춤: 실제 사용 수가 Warm 기준 이상이면
+        수요도 Warm 기준 아래로 내려가지 않음
+        """
+        usage = self.weekly_usage_count
+        floor = min(usage, PROMOTE_THRESHOLDS[ServerTier.TIER_2_WARM])
+        return max(usage * cost_factor(self.cold_start_seconds), floor)
+
+    @property
+    def weekly_usage_count(self) -> int:
+        """최근 7일(168시간) 사용 수"""
+        return self.usage_window.count()
+
     def should_promote(self) -> bool:
         """Tier 승격 필요 여부"""
-        if self.tier == ServerTier.TIER_3_COLD and self.weekly_usage_count >= 3:
-            return True
-        if self.tier == ServerTier.TIER_2_WARM and self.weekly_usage_count >= 10:
-            return True
+        if self.tier == ServerTier.TIER_3_COLD:
+            return self.demand_score >= PROMOTE_THRESHOLDS[ServerTier.TIER_2_WARM]
+        if self.tier == ServerTier.TIER_2_WARM:
+            return self.demand_score >= PROMOTE_THRESHOLDS[ServerTier.TIER_1_HOT]
         return False
 
     def should_demote(self) -> bool:
         """Tier 강등 필요 여부"""
-        if self.tier == ServerTier.TIER_1_HOT and self.weekly_usage_count < 3:
-            return True
-        if self.tier == ServerTier.TIER_2_WARM and self.weekly_usage_count < 1:
-            return True
-        return False
+        threshold = DEMOTE_THRESHOLDS.get(self.tier)
+        return threshold is not None and self.demand_score < threshold
 
-    def record_usage(self):
-        """사용 기록"""
+    def record_usage(self, at: Optional[datetime] = None):
+        """사용 기록 (at: 사용 시각, 저널 재생 시 지정)"""
+        at = at or datetime.now()
         self.total_usage_count += 1
-        self.weekly_usage_count += 1
-        self.last_used_at = datetime.now()
+        self.usage_window.add(at.timestamp())
+        self.last_used_at = at
 
         if self.first_seen_at is None:
-            self.first_seen_at = datetime.now()
+            self.first_seen_at = at
+
+
+@dataclass
+class TierIndex:
+    """티어 1개의 소속 서버 (등록 순서 유지) 및 캐시 집계"""
+    servers: Dict[str, None] = field(default_factory=dict)
+    cached_count: int = 0
+    cached_size_mb: int = 0
 
 
 class TierManager:
@@ -101,39 +170,129 @@ class TierManager:
     - 티어별 이미지 캐싱 전략
     - 주간 사용 통계 리셋
     - 티어 최적화
+    - write-behind 저장 (변경분을 모아 주기적으로 원자적 교체)
+    - 사용/등록 이벤트 append-only 저널 (스냅샷 저장 시 compaction, 시작 시 재생)
+    - 저장소: JSON 파일(기본, 파일 잠금) 또는 SQLite(WAL, 여러 프로세스 공유)
+    - 장애 키워드 → 서버 해석 캐시도 티어 상태와 함께 저장
     """
 
-    def __init__(self, config_path: str = ".war-room/tier-config.json"):
+    def __init__(
+        self,
+        config_path: str = ".war-room/tier-config.json",
+        flush_interval_seconds: float = 5.0,
+        flush_threshold: int = 100,
+        journal: bool = True,
+        compact_records: int = 10000,
+        compact_interval_seconds: float = 300.0,
+        backend: str = "json",
+        min_tier_dwell_hours: float = 6.0
+    ):
         """
         Args:
             config_path: 티어 설정 파일 경로
+            flush_interval_seconds: 변경분 저장 주기
+            flush_threshold: 이 수 이상의 서버가 변경되면 주기를 기다리지 않고 저장
+            journal: 사용 이벤트 저널 사용 여부 (설정 파일 옆 .journal)
+            compact_records: 저널 레코드가 이 수 이상 쌓이면 스냅샷 저장 후 compaction
+            compact_interval_seconds: 저널에만 기록된 변경분의 최대 스냅샷 지연
+            backend: "json" (단일 프로세스) 또는 "sqlite" (config_path를 DB 파일로 사용,
+                     여러 War Room 프로세스/CLI가 같은 상태를 공유할 때)
+            min_tier_dwell_hours: 티어 조정 후 다시 강등하기까지 최소 유지 시간
         """
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"지원하지 않는 저장소: {backend}")
         self.config_path = Path(config_path)
         self.servers: Dict[str, ServerInfo] = {}
-        self.tier_thresholds = {
-            ServerTier.TIER_1_HOT: 10,   # 주간 10회 이상
-            ServerTier.TIER_2_WARM: 3,   # 주간 3-9회
-            ServerTier.TIER_3_COLD: 0    # 주간 0-2회
-        }
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_threshold = flush_threshold
+
+        self.compact_records = compact_records
+        self.compact_interval_seconds = compact_interval_seconds
+
+        # write-behind 상태: 서버별 직렬화 레코드 캐시 + 변경된 서버 이름
+        # (_unsaved: 저널에 없어서 스냅샷으로만 보존되는 변경)
+        self._records: Dict[str, Dict] = {}
+        self._dirty: Set[str] = set()
+        self._unsaved: Set[str] = set()
+        self._meta_dirty = False
+        self._last_flush = time.monotonic()
+        self._write_lock = threading.Lock()
+        # write_behind() 루프가 돌고 있으면 사용 기록 경로에서는 파일을 쓰지 않음
+        self._write_behind = False
+        self.flush_count = 0
+
+        # SQLite는 트랜잭션 단위로 영속화되고 사용 이벤트 테이블이 저널 역할을 하므로 저널 생략
+        self.store: Optional[SQLiteTierStore] = None
+        self._pending_usage: List[Tuple[str, float]] = []
+        self.journal: Optional[UsageJournal] = None
+        self._journal_seq = 0
+        if backend == "sqlite":
+            self.store = SQLiteTierStore(str(self.config_path))
+        elif journal:
+            self.journal = UsageJournal(str(self.config_path.with_suffix(".journal")))
+
+        # 최근 7일 사용 수 기준 (승격은 즉시, 강등은 낮은 기준 + 최소 유지 시간)
+        self.promote_thresholds = dict(PROMOTE_THRESHOLDS)
+        self.demote_thresholds = dict(DEMOTE_THRESHOLDS)
+        self.min_tier_dwell = timedelta(hours=min_tier_dwell_hours)
+
+        # 통계용 인덱스: 티어별 소속/캐시 집계, 전체 사용 수, 전체 최근 7일 윈도우, 최다 사용 서버
+        self._tier_index: Dict[ServerTier, TierIndex] = {tier: TierIndex() for tier in ServerTier}
+        self._total_usage = 0
+        self._usage_window = HourlyUsageWindow()
+        self._most_used: Optional[str] = None
+
+        # 키워드 → 서버 해석 캐시 (변경 시 메타데이터로 저장)
+        self.resolutions = ResolutionCache(on_change=self._mark_dirty)
 
         # 설정 디렉토리 생성
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 기존 설정 로드
+        # 기존 설정 로드 후 스냅샷 이후의 저널 재생
         self._load_config()
+        self._replay_journal()
+        self._rebuild_index()
+
+        # 프로세스 종료 시 저널에 없는 변경분 저장 (관리자 수명은 늘리지 않음)
+        close = weakref.WeakMethod(self.close)
+        atexit.register(lambda: close() and close()())
+
+    @contextmanager
+    def _file_lock(self):
+        """JSON 설정 파일 읽기/쓰기 중 다른 프로세스 배제 (flock)"""
+        if fcntl is None or self.store is not None:
+            yield
+            return
 
-        # 마지막 주간 리셋 시간
-        self.last_weekly_reset = self._get_last_weekly_reset()
+        lock_path = self.config_path.with_name(self.config_path.name + ".lock")
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
 
     def _load_config(self):
-        """설정 파일 로드"""
-        if not self.config_path.exists():
-            return
-
+        """설정 로드 (JSON 파일 또는 SQLite)"""
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
-
+            if self.store is not None:
+                records, meta = self.store.load()
+                data = {"servers": records, **meta}
+                # 사용 윈도우는 다른 프로세스 사용분까지 포함하도록 사용 이벤트에서 재구성
+                windows = self.store.usage_windows()
+                for record in records:
+                    record["usage_window"] = windows.get(record["name"])
+            elif self.config_path.exists():
+                with self._file_lock(), open(self.config_path, 'r') as f:
+                    data = json.load(f)
+            else:
+                return
+
+            self._journal_seq = data.get("journal_seq", 0)
+            resolutions = data.get("resolutions")
+            if isinstance(resolutions, str):  # SQLite 메타데이터는 JSON 문자열
+                resolutions = json.loads(resolutions)
+            self.resolutions.load(resolutions)
             for server_data in data.get("servers", []):
                 # datetime 복원
                 if server_data.get("last_used_at"):
@@ -149,39 +308,258 @@ class TierManager:
                         server_data["last_tier_adjustment"]
                     )
 
-                # ServerTier enum 복원
+                # ServerTier enum / 시작 비용 / 사용 윈도우 복원
                 server_data["tier"] = ServerTier(server_data["tier"])
+                server_data["start_cost"] = StartCost.from_dict(server_data.get("start_cost"))
+                legacy_start = server_data.pop("measured_start_seconds", None)
+                if legacy_start is not None and not server_data["start_cost"].samples:
+                    # 이전 형식(준비 시간 EWMA 단일 값) → MCP 준비 단계 측정값으로 이전
+                    server_data["start_cost"] = StartCost(ready_seconds=legacy_start, samples=1)
+                legacy_weekly = server_data.pop("weekly_usage_count", 0)
+                window = server_data.get("usage_window")
+                if isinstance(window, dict) or window is None:
+                    server_data["usage_window"] = HourlyUsageWindow.from_dict(window)
+                if window is None and legacy_weekly:
+                    # 이전 형식(주간 카운터): 마지막 사용 시각에 몰아서 넣고 7일에 걸쳐 빠지게 함
+                    used_at = server_data.get("last_used_at") or datetime.now()
+                    server_data["usage_window"].add(used_at.timestamp(), legacy_weekly)
 
                 server = ServerInfo(**server_data)
                 self.servers[server.name] = server
+                self._records[server.name] = self._serialize(server)
 
             logger.info(f"티어 설정 로드 완료: {len(self.servers)}개 서버")
 
         except Exception as e:
             logger.error(f"티어 설정 로드 실패: {e}")
 
-    def _save_config(self):
-        """설정 파일 저장"""
-        try:
-            data = {
-                "servers": [
-                    {
-                        **asdict(server),
-                        "tier": server.tier.value,
-                        "last_used_at": server.last_used_at.isoformat() if server.last_used_at else None,
-                        "first_seen_at": server.first_seen_at.isoformat() if server.first_seen_at else None,
-                        "last_tier_adjustment": server.last_tier_adjustment.isoformat() if server.last_tier_adjustment else None,
-                    }
-                    for server in self.servers.values()
-                ],
-                "last_weekly_reset": datetime.now().isoformat()
-            }
+    def _rebuild_index(self):
+        """로드/재생 후 통계 인덱스 전체 계산 (시작 시 1회)"""
+        self._tier_index = {tier: TierIndex() for tier in ServerTier}
+        self._total_usage = 0
+        self._usage_window = HourlyUsageWindow()
+        self._most_used = None
+        for server in self.servers.values():
+            self._index_add(server)
+            self._total_usage += server.total_usage_count
+            for hour, count in server.usage_window.hourly().items():
+                self._usage_window.add(hour * 3600, count)
+            self._update_most_used(server)
+
+    def _index_add(self, server: ServerInfo):
+        self._tier_index[server.tier].servers[server.name] = None
+        self._index_cache(server, 1)
+
+    def _index_remove(self, server: ServerInfo):
+        self._tier_index[server.tier].servers.pop(server.name, None)
+        self._index_cache(server, -1)
+
+    def _index_cache(self, server: ServerInfo, sign: int):
+        """캐시된 서버면 소속 티어 캐시 집계에 더하거나(+1) 뺌(-1)"""
+        if server.image_cached:
+            index = self._tier_index[server.tier]
+            index.cached_count += sign
+            index.cached_size_mb += sign * server.image_size_mb
+
+    def _update_most_used(self, server: ServerInfo):
+        """사용 수는 줄지 않으므로 갱신된 서버와 현재 최다 서버만 비교"""
+        current = self.servers.get(self._most_used) if self._most_used else None
+        if current is None or server.total_usage_count > current.total_usage_count:
+            self._most_used = server.name
+
+    def _replay_journal(self):
+        """스냅샷에 아직 반영되지 않은 저널 레코드 적용"""
+        if self.journal is None:
+            return
+
+        replayed = 0
+        for record in self.journal.replay(after_seq=self._journal_seq):
+            at = datetime.fromtimestamp(record.timestamp)
+            if record.op == "reg" and record.server_name not in self.servers:
+                self.servers[record.server_name] = ServerInfo(
+                    name=record.server_name,
+                    package=record.data.get("package", record.server_name),
+                    version=record.data.get("version", ""),
+                    tier=ServerTier(record.data.get("tier", ServerTier.TIER_3_COLD.value)),
+                    first_seen_at=at
+                )
+            elif record.op == "use" and record.server_name in self.servers:
+                self.servers[record.server_name].record_usage(at)
+            else:
+                continue
+            self._dirty.add(record.server_name)
+            replayed += 1
+
+        if replayed:
+            logger.info(f"사용 저널 재생: {replayed}건")
+
+    @staticmethod
+    def _serialize(server: ServerInfo) -> Dict:
+        """ServerInfo → JSON 레코드"""
+        return {
+            **asdict(server),
+            "tier": server.tier.value,
+            "usage_window": server.usage_window.to_dict(),
+            "last_used_at": server.last_used_at.isoformat() if server.last_used_at else None,
+            "first_seen_at": server.first_seen_at.isoformat() if server.first_seen_at else None,
+            "last_tier_adjustment": server.last_tier_adjustment.isoformat() if server.last_tier_adjustment else None,
+        }
 
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+    def _mark_dirty(self, server_name: Optional[str] = None, journaled: bool = False):
+        """
+        변경 표시 (메모리만 갱신)
 
-        except Exception as e:
-            logger.error(f"티어 설정 저장 실패: {e}")
+        Args:
+            journaled: 저널에 이미 기록된 변경이면 True (스냅샷 저장을 서두르지 않음)
+
+        write_behind() 루프가 없을 때(CLI, 테스트)만 저장 시점이 되면 바로 저장
+        """
+        if server_name is None:
+            self._meta_dirty = True
+        else:
+            self._dirty.add(server_name)
+            if not journaled:
+                self._unsaved.add(server_name)
+
+        if not self._write_behind and self.flush_due():
+            self.flush()
+
+    def flush_due(self) -> bool:
+        """
+        스냅샷 저장 시점 여부
+
+        - 저널에 없는 변경: 저장 주기 또는 변경 수 임계값
+        - 저널에만 있는 변경: 레코드 수 또는 compaction 주기 (이미 디스크에 있으므로 느슨하게)
+        """
+        elapsed = time.monotonic() - self._last_flush
+        if self._unsaved or self._meta_dirty:
+            if len(self._unsaved) >= self.flush_threshold or elapsed >= self.flush_interval_seconds:
+                return True
+        if not self._dirty:
+            return False
+        if self.journal is None:
+            return elapsed >= self.flush_interval_seconds
+        return (
+            self.journal.records >= self.compact_records
+            or elapsed >= self.compact_interval_seconds
+        )
+
+    def _snapshot(self) -> Dict:
+        """
+        변경된 서버만 다시 직렬화한 스냅샷 (이벤트 루프에서 호출)
+
+        JSON: 전체 서버 레코드 / SQLite: 변경된 레코드 + 쌓인 사용 이벤트
+        """
+        changed = []
+        for name in self._dirty:
+            server = self.servers.get(name)
+            if server is None:
+                self._records.pop(name, None)
+                continue
+            record = self._serialize(server)
+            previous = self._records.get(name)
+            self._records[name] = record
+            if previous is None:
+                changed.append(record)
+            else:
+                # SQLite에는 바뀐 필드만 보냄 (다른 프로세스가 바꾼 필드를 덮어쓰지 않도록)
+                changed.append({
+                    "name": name,
+                    **{k: v for k, v in record.items() if previous.get(k) != v}
+                })
+        meta_dirty = self._meta_dirty
+        self._dirty.clear()
+        self._unsaved.clear()
+        self._meta_dirty = False
+
+        if self.store is not None:
+            usage, self._pending_usage = self._pending_usage, []
+            meta = {"resolutions": json.dumps(self.resolutions.to_dict())} if meta_dirty else {}
+            return {"records": changed, "usage": usage, "meta": meta}
+
+        return {
+            "servers": list(self._records.values()),
+            "resolutions": self.resolutions.to_dict(),
+            # 이 seq까지의 저널 레코드는 스냅샷에 반영됨
+            "journal_seq": self.journal.seq if self.journal else 0
+        }
+
+    def _write(self, data: Dict):
+        """
+        임시 파일에 쓴 뒤 rename으로 원자적 교체 후 저널 compaction (블로킹)
+
+        rename 직후 중단되어도 재생 시 journal_seq 이하 레코드는 건너뛰므로 중복 적용 없음
+        """
+        if self.store is not None:
+            self._write_store(data)
+            return
+
+        with self._write_lock, self._file_lock():
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+                self.flush_count += 1
+                if self.journal:
+                    self.journal.compact(data["journal_seq"])
+
+            except Exception as e:
+                # 다음 저장 때 다시 시도 (레코드 캐시는 이미 최신)
+                self._meta_dirty = True
+                logger.error(f"티어 설정 저장 실패: {e}")
+
+            self._last_flush = time.monotonic()
+
+    def _write_store(self, data: Dict):
+        """SQLite에 한 트랜잭션으로 반영 (실패하면 다음 저장 때 다시 시도)"""
+        with self._write_lock:
+            try:
+                self.store.apply(data["records"], data["usage"], data["meta"])
+                self.flush_count += 1
+            except Exception as e:
+                self._pending_usage[:0] = data["usage"]
+                for record in data["records"]:
+                    self._dirty.add(record["name"])
+                    self._unsaved.add(record["name"])
+                self._meta_dirty = True
+                logger.error(f"티어 상태 저장 실패: {e}")
+
+            self._last_flush = time.monotonic()
+
+    def flush(self):
+        """변경분 즉시 저장 (종료 시 호출)"""
+        if not self._dirty and not self._meta_dirty:
+            return
+        self._write(self._snapshot())
+
+    def close(self):
+        """저널에 없는 변경분 저장 후 저널/SQLite 핸들 닫기 (종료 시 호출, 여러 번 호출해도 안전)"""
+        if self._unsaved or self._meta_dirty:
+            self.flush()
+        if self.journal:
+            self.journal.close()
+        if self.store:
+            self.store.close()
+
+    async def write_behind(self, poll_seconds: float = 1.0):
+        """
+        백그라운드 write-behind 루프
+
+        저장 시점이 되면 스냅샷은 이벤트 루프에서 만들고 파일 쓰기는 스레드에서 수행.
+        취소되면 남은 변경분을 저장하고 종료
+        """
+        self._write_behind = True
+        try:
+            while True:
+                await asyncio.sleep(min(poll_seconds, self.flush_interval_seconds))
+                if self.flush_due():
+                    await asyncio.to_thread(self._write, self._snapshot())
+        finally:
+            self._write_behind = False
+            self.flush()
 
     def register_server(
         self,
@@ -221,7 +599,13 @@ class TierManager:
         )
 
         self.servers[name] = server
-        self._save_config()
+        self._index_add(server)
+        if self.journal:
+            self.journal.append(
+                "reg", name, server.first_seen_at.timestamp(),
+                package=package, version=version, tier=tier.value
+            )
+        self._mark_dirty(name, journaled=self.journal is not None)
 
         logger.info(f"새 서버 등록: {name} (Tier: {tier.display_name})")
         return server
@@ -239,10 +623,30 @@ class TierManager:
 
         server = self.servers[server_name]
         server.record_usage()
-        self._save_config()
+        self._total_usage += 1
+        self._usage_window.add(server.last_used_at.timestamp())
+        self._update_most_used(server)
+        if self.journal:
+            self.journal.append("use", server_name, server.last_used_at.timestamp())
+        if self.store:
+            self._pending_usage.append((server_name, server.last_used_at.timestamp()))
+        self._mark_dirty(server_name, journaled=self.journal is not None)
 
         logger.debug(f"사용 기록: {server_name} (주간: {server.weekly_usage_count}회)")
 
+    def record_start_cost(self, sample: StartCostSample):
+        """오케스트레이터가 측정한 단계별 시작 비용 기록"""
+        server = self.servers.get(sample.server_name)
+        if not server:
+            return
+
+        server.start_cost.observe(sample)
+        self._mark_dirty(sample.server_name)
+        logger.debug(
+            f"시작 비용 기록: {sample.server_name} (이미지 {sample.image_seconds:.1f}초, "
+            f"실행 {sample.run_seconds:.1f}초, 준비 {sample.ready_seconds:.1f}초)"
+        )
+
     def get_tier(self, server_name: str) -> Optional[ServerTier]:
         """서버의 현재 티어 조회"""
         server = self.servers.get(server_name)
@@ -250,9 +654,24 @@ class TierManager:
 
     def get_servers_by_tier(self, tier: ServerTier) -> List[ServerInfo]:
         """특정 티어의 서버 목록"""
+        return [self.servers[name] for name in self._tier_index[tier].servers]
+
+    def usage_history(self) -> List[Tuple[str, datetime]]:
+        """
+        사용 이력 (서버 이름, 시각) - 사용 예측 초기 학습용
+
+        SQLite는 저장된 전체 사용 이벤트, JSON은 사용 윈도우의 최근 7일 (시간 단위)
+        """
+        if self.store is not None:
+            return [
+                (name, datetime.fromtimestamp(ts))
+                for name in self.servers
+                for ts in self.store.usage_events(name)
+            ]
         return [
-            server for server in self.servers.values()
-            if server.tier == tier
+            (name, datetime.fromtimestamp(hour * 3600))
+            for name, server in self.servers.items()
+            for hour in server.usage_window.hourly()
         ]
 
     def adjust_tiers(self) -> Dict[str, str]:
@@ -269,77 +688,58 @@ class TierManager:
             new_tier = self._calculate_tier(server)
 
             if old_tier != new_tier:
+                self._index_remove(server)
                 server.tier = new_tier
+                self._index_add(server)
                 server.last_tier_adjustment = datetime.now()
                 changes[name] = f"{old_tier.display_name} → {new_tier.display_name}"
+                self._mark_dirty(name)
 
                 logger.info(f"티어 조정: {name} - {changes[name]}")
 
-        if changes:
-            self._save_config()
-
         return changes
 
     def _calculate_tier(self, server: ServerInfo) -> ServerTier:
-        """사용 패턴 기반 티어 계산"""
-        usage = server.weekly_usage_count
+        """
+        최근 7일 수요 기반 티어 계산 (히스테리시스)
 
-        # Official 서버는 최소 Tier 2
+        수요 = 사용 수 × 측정된 시작 비용 배율 (느린 서버는 적게 써도 Warm 유지)
+        - 승격: 승격 임계값 이상이면 즉시
+        - 강등: 강등 임계값 미만이고 마지막 조정 후 min_tier_dwell이 지났을 때
+        - Official 서버는 최소 Tier 2
+        """
+        usage = server.demand_score
         is_official = "@modelcontextprotocol" in server.name
+        order = list(ServerTier)
 
-        if usage >= self.tier_thresholds[ServerTier.TIER_1_HOT]:
-            return ServerTier.TIER_1_HOT
-        elif usage >= self.tier_thresholds[ServerTier.TIER_2_WARM]:
-            return ServerTier.TIER_2_WARM
-        elif is_official and server.tier == ServerTier.TIER_2_WARM:
-            # Official은 Tier 2 유지
-            return ServerTier.TIER_2_WARM
+        if usage >= self.promote_thresholds[ServerTier.TIER_1_HOT]:
+            target = ServerTier.TIER_1_HOT
+        elif usage >= self.promote_thresholds[ServerTier.TIER_2_WARM]:
+            target = ServerTier.TIER_2_WARM
         else:
-            return ServerTier.TIER_3_COLD
-
-    def reset_weekly_stats(self):
-        """주간 통계 리셋 (매주 월요일 00:00)"""
-        logger.info("주간 통계 리셋 중...")
-
-        for server in self.servers.values():
-            server.weekly_usage_count = 0
-
-        self.last_weekly_reset = datetime.now()
-        self._save_config()
-
-        logger.info(f"주간 통계 리셋 완료: {len(self.servers)}개 서버")
-
-    def _get_last_weekly_reset(self) -> datetime:
-        """마지막 주간 리셋 시간 조회"""
-        if not self.config_path.exists():
-            return datetime.now()
-
-        try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
-                reset_str = data.get("last_weekly_reset")
-                if reset_str:
-                    return datetime.fromisoformat(reset_str)
-        except Exception:
-            pass
-
-        return datetime.now()
-
-    def should_reset_weekly(self) -> bool:
-        """주간 리셋 필요 여부 확인 (7일 경과)"""
-        return datetime.now() - self.last_weekly_reset > timedelta(days=7)
+            target = ServerTier.TIER_3_COLD
+        if order.index(target) < order.index(server.tier):
+            return target
+
+        if server.last_tier_adjustment and (
+            datetime.now() - server.last_tier_adjustment < self.min_tier_dwell
+        ):
+            return server.tier
+
+        tier = server.tier
+        while tier in self.demote_thresholds and usage < self.demote_thresholds[tier]:
+            lower = order[order.index(tier) + 1]
+            if lower == ServerTier.TIER_3_COLD and is_official:
+                # Official은 Tier 2 유지
+                break
+            tier = lower
+        return tier
 
     def optimize(self):
         """
         티어 최적화
-        - 주간 리셋 확인
-        - 티어 자동 조정
-        - 미사용 서버 정리
+        - 티어 자동 조정 (사용 수는 rolling window라 주간 리셋 없음)
         """
-        # 주간 리셋
-        if self.should_reset_weekly():
-            self.reset_weekly_stats()
-
         # 티어 조정
         changes = self.adjust_tiers()
 
@@ -353,38 +753,58 @@ class TierManager:
         return changes
 
     def get_stats(self) -> Dict:
-        """통계 정보"""
-        tier_counts = {
-            tier: len(self.get_servers_by_tier(tier))
-            for tier in ServerTier
-        }
-
-        total_usage = sum(s.total_usage_count for s in self.servers.values())
-        weekly_usage = sum(s.weekly_usage_count for s in self.servers.values())
+        """
+        통계 정보 (메모리 인덱스 기반 O(티어 수), 디스크 I/O 없음)
 
-        # 가장 많이 사용된 서버
-        most_used = None
-        if self.servers:
-            most_used = max(
-                self.servers.values(),
-                key=lambda s: s.total_usage_count
-            )
+        다른 프로세스 사용분까지 포함한 집계는 get_shared_stats()
+        """
+        most_used = self.servers.get(self._most_used) if self._most_used else None
 
         return {
             "total_servers": len(self.servers),
             "tier_distribution": {
-                tier.display_name: count
-                for tier, count in tier_counts.items()
+                tier.display_name: len(index.servers)
+                for tier, index in self._tier_index.items()
             },
-            "total_usage": total_usage,
-            "weekly_usage": weekly_usage,
+            "total_usage": self._total_usage,
+            "weekly_usage": self._usage_window.count(),
             "most_used_server": {
                 "name": most_used.name,
                 "tier": most_used.tier.display_name,
                 "usage": most_used.total_usage_count,
                 "weekly_usage": most_used.weekly_usage_count
-            } if most_used else None,
-            "last_weekly_reset": self.last_weekly_reset.isoformat()
+            } if most_used else None
+        }
+
+    async def get_shared_stats(self) -> Dict:
+        """
+        저장소 공유 통계 (SQLite: 모든 프로세스가 반영한 상태를 스레드에서 SQL 집계)
+
+        이 프로세스의 아직 저장되지 않은 변경분은 write-behind가 반영한 뒤부터 포함
+        """
+        if self.store is None:
+            return self.get_stats()
+        return await asyncio.to_thread(self._store_stats)
+
+    def _store_stats(self) -> Dict:
+        """SQL 집계 기반 get_stats (블로킹)"""
+        stats = self.store.tier_stats()
+        most_used = stats["most_used"]
+
+        return {
+            "total_servers": stats["total_servers"],
+            "tier_distribution": {
+                tier.display_name: stats["by_tier"].get(tier.value, 0)
+                for tier in ServerTier
+            },
+            "total_usage": stats["total_usage"],
+            "weekly_usage": stats["weekly_usage"],
+            "most_used_server": {
+                "name": most_used[0],
+                "tier": ServerTier(most_used[1]).display_name,
+                "usage": most_used[2],
+                "weekly_usage": most_used[3]
+            } if most_used else None
         }
 
     def get_recommended_servers(self, limit: int = 5) -> List[ServerInfo]:
@@ -429,25 +849,55 @@ class TierManager:
         """이미지 캐싱 완료 표시"""
         server = self.servers.get(server_name)
         if server:
+            self._index_cache(server, -1)
             server.image_name = image_name
             server.image_cached = True
             server.image_size_mb = size_mb
-            self._save_config()
+            self._index_cache(server, 1)
+            self._mark_dirty(server_name)
             logger.info(f"이미지 캐싱 완료: {server_name} ({size_mb}MB)")
 
-    def get_cache_summary(self) -> Dict:
-        """캐시 요약 정보"""
-        cached_servers = [s for s in self.servers.values() if s.image_cached]
-        total_size = sum(s.image_size_mb for s in cached_servers)
-
+    def mark_image_evicted(self, server_name: str):
+        """이미지 캐시 해제 표시 (정리되었거나 Docker에 없음)"""
+        server = self.servers.get(server_name)
+        if server and server.image_cached:
+            self._index_cache(server, -1)
+            server.image_cached = False
+            server.image_size_mb = 0
+            self._mark_dirty(server_name)
+            logger.info(f"이미지 캐시 해제: {server_name}")
+
+    async def get_shared_cache_summary(self) -> Dict:
+        """저장소 공유 캐시 요약 (SQLite: 스레드에서 SQL 집계)"""
+        if self.store is None:
+            return self.get_cache_summary()
+        return await asyncio.to_thread(self._store_cache_summary)
+
+    def _store_cache_summary(self) -> Dict:
+        """SQL 집계 기반 get_cache_summary (블로킹)"""
+        by_tier = self.store.cache_stats()
         return {
-            "cached_count": len(cached_servers),
-            "total_size_mb": total_size,
+            "cached_count": sum(count for count, _ in by_tier.values()),
+            "total_size_mb": sum(size for _, size in by_tier.values()),
             "by_tier": {
                 tier.display_name: {
-                    "count": sum(1 for s in cached_servers if s.tier == tier),
-                    "size_mb": sum(s.image_size_mb for s in cached_servers if s.tier == tier)
+                    "count": by_tier.get(tier.value, (0, 0))[0],
+                    "size_mb": by_tier.get(tier.value, (0, 0))[1]
                 }
                 for tier in ServerTier
             }
         }
+
+    def get_cache_summary(self) -> Dict:
+        """캐시 요약 정보 (메모리 인덱스 기반, 디스크 I/O 없음)"""
+        return {
+            "cached_count": sum(index.cached_count for index in self._tier_index.values()),
+            "total_size_mb": sum(index.cached_size_mb for index in self._tier_index.values()),
+            "by_tier": {
+                tier.display_name: {
+                    "count": index.cached_count,
+                    "size_mb": index.cached_size_mb
+                }
+                for tier, index in self._tier_index.items()
+            }
+        }
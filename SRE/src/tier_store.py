@@ -0,0 +1,269 @@
+"""
+SQLite Tier Store
+여러 War Room 프로세스가 공유하는 티어 상태 저장소 (WAL 모드)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .usage_window import HOURS_PER_WEEK, HourlyUsageWindow
+
+logger = logging.getLogger(__name__)
+
+
+# 카운터는 프로세스 간 덮어쓰기를 막기 위해 증분(UPDATE ... + n)으로만 반영
+COUNTER_COLUMNS = ("total_usage_count",)
+SERVER_COLUMNS = (
+    "name", "package", "version", "tier",
+    "last_used_at", "first_seen_at", "last_tier_adjustment",
+)
+# 이전 스키마 컬럼 (로드 시 TierManager가 시작 비용으로 이전, 새로 쓰지 않음)
+LEGACY_COLUMNS = ("measured_start_seconds",)
+IMAGE_FIELDS = ("image_name", "image_cached", "image_size_mb")
+# 사용 윈도우는 usage_events에서 재구성하므로 저장하지 않음
+DERIVED_FIELDS = ("usage_window",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS servers (
+    name TEXT PRIMARY KEY,
+    package TEXT NOT NULL,
+    version TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    total_usage_count INTEGER NOT NULL DEFAULT 0,
+    last_used_at TEXT,
+    first_seen_at TEXT,
+    last_tier_adjustment TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_servers_tier ON servers(tier);
+
+CREATE TABLE IF NOT EXISTS usage_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_name TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_usage_server_time ON usage_events(server_name, used_at);
+
+CREATE TABLE IF NOT EXISTS image_cache (
+    server_name TEXT PRIMARY KEY,
+    image_name TEXT,
+    size_mb INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteTierStore:
+    """
+    TierManager용 SQLite 저장소
+
+    주요 기능:
+    - WAL 모드: 읽기와 쓰기가 서로 막지 않음, busy_timeout으로 쓰기 경합 대기
+    - 사용 이벤트 테이블 + 서버 카운터 증분 반영 (다른 프로세스의 사용 수를 덮어쓰지 않음)
+    - 티어별 통계 / 캐시 요약을 SQL 집계로 계산
+    """
+
+    def __init__(self, path: str, busy_timeout_seconds: float = 30.0):
+        """
+        Args:
+            path: 데이터베이스 파일 경로
+            busy_timeout_seconds: 다른 프로세스가 쓰는 중일 때 최대 대기 시간
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def load(self) -> Tuple[List[Dict], Dict[str, str]]:
+        """(서버 레코드 목록, 메타데이터) 로드"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.*, c.image_name AS c_image_name, c.size_mb AS c_size_mb, "
+                "c.server_name IS NOT NULL AS c_cached "
+                "FROM servers s LEFT JOIN image_cache c ON c.server_name = s.name"
+            ).fetchall()
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+        records = []
+        for row in rows:
+            record = json.loads(row["extra"] or "{}")
+            record.update({column: row[column] for column in SERVER_COLUMNS + COUNTER_COLUMNS})
+            record.update({
+                column: row[column] for column in LEGACY_COLUMNS
+                if column in row.keys() and row[column] is not None
+            })
+            record["image_name"] = row["c_image_name"]
+            record["image_cached"] = bool(row["c_cached"])
+            record["image_size_mb"] = row["c_size_mb"] or 0
+            records.append(record)
+        return records, meta
+
+    def apply(
+        self,
+        records: Iterable[Dict],
+        usage: Iterable[Tuple[str, float]] = (),
+        meta: Optional[Dict[str, str]] = None
+    ):
+        """
+        변경분을 한 트랜잭션으로 반영
+
+        Args:
+            records: 서버별 변경된 필드만 담은 레코드 (name 필수, 카운터는 무시)
+                     신규 서버는 전체 필드, 카운터 0으로 생성
+            usage: 마지막 반영 이후 사용 이벤트 (서버 이름, epoch 초)
+            meta: 메타데이터 (key → 문자열 값)
+        """
+        usage = list(usage)
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for record in records:
+                    self._apply_record(conn, record)
+
+                conn.executemany(
+                    "INSERT INTO usage_events (server_name, used_at) VALUES (?, ?)", usage
+                )
+                for name, count in Counter(name for name, _ in usage).items():
+                    conn.execute(
+                        "UPDATE servers SET total_usage_count = total_usage_count + ? WHERE name = ?",
+                        (count, name)
+                    )
+
+                for key, value in (meta or {}).items():
+                    conn.execute(
+                        "INSERT INTO meta (key, value) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                        (key, value)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _apply_record(conn: sqlite3.Connection, record: Dict):
+        """
+        레코드에 있는 필드만 갱신 (다른 프로세스가 바꾼 필드는 건드리지 않음)
+        """
+        name = record["name"]
+        columns = [c for c in SERVER_COLUMNS[1:] if c in record]
+        extra = {
+            k: v for k, v in record.items()
+            if k not in SERVER_COLUMNS + COUNTER_COLUMNS + IMAGE_FIELDS + DERIVED_FIELDS
+        }
+
+        if all(c in record for c in ("package", "version", "tier")):
+            conn.execute(
+                "INSERT INTO servers (name, package, version, tier) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(name) DO NOTHING",
+                (name, record["package"], record["version"], record["tier"])
+            )
+        if columns:
+            conn.execute(
+                f"UPDATE servers SET {', '.join(f'{c} = ?' for c in columns)} WHERE name = ?",
+                [record[c] for c in columns] + [name]
+            )
+        if extra:
+            conn.execute(
+                "UPDATE servers SET extra = json_patch(COALESCE(extra, '{}'), ?) WHERE name = ?",
+                (json.dumps(extra), name)
+            )
+
+        if record.get("image_cached") is True or (
+            "image_cached" not in record and any(f in record for f in IMAGE_FIELDS)
+        ):
+            conn.execute(
+                "INSERT INTO image_cache (server_name, image_name, size_mb) VALUES (?, ?, ?) "
+                "ON CONFLICT(server_name) DO UPDATE SET "
+                "image_name = COALESCE(?, image_name), size_mb = COALESCE(?, size_mb)",
+                (name, record.get("image_name"), record.get("image_size_mb", 0),
+                 record.get("image_name"), record.get("image_size_mb"))
+            )
+        elif record.get("image_cached") is False:
+            conn.execute("DELETE FROM image_cache WHERE server_name = ?", (name,))
+
+    def usage_windows(self, now: Optional[float] = None) -> Dict[str, HourlyUsageWindow]:
+        """최근 7일 사용 이벤트 → 서버별 시간 단위 윈도우 (다른 프로세스 기록 포함)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT server_name, CAST(used_at / 3600 AS INTEGER) AS hour, COUNT(*) "
+                "FROM usage_events WHERE used_at >= ? GROUP BY server_name, hour",
+                (now - HOURS_PER_WEEK * 3600,)
+            ).fetchall()
+
+        windows: Dict[str, HourlyUsageWindow] = {}
+        for name, hour, count in rows:
+            windows.setdefault(name, HourlyUsageWindow()).add(hour * 3600, count)
+        return windows
+
+    def tier_stats(self, now: Optional[float] = None) -> Dict:
+        """티어별 서버 수, 전체/최근 7일 사용 합계, 최다 사용 서버"""
+        since = (time.time() if now is None else now) - HOURS_PER_WEEK * 3600
+        with self._lock:
+            by_tier = {
+                row[0]: row[1]
+                for row in self._conn.execute("SELECT tier, COUNT(*) FROM servers GROUP BY tier")
+            }
+            total, count = self._conn.execute(
+                "SELECT COALESCE(SUM(total_usage_count), 0), COUNT(*) FROM servers"
+            ).fetchone()
+            weekly = self._conn.execute(
+                "SELECT COUNT(*) FROM usage_events WHERE used_at >= ?", (since,)
+            ).fetchone()[0]
+            most_used = self._conn.execute(
+                "SELECT name, tier, total_usage_count, "
+                "(SELECT COUNT(*) FROM usage_events e WHERE e.server_name = s.name AND e.used_at >= ?) "
+                "FROM servers s ORDER BY total_usage_count DESC LIMIT 1",
+                (since,)
+            ).fetchone()
+        return {
+            "total_servers": count,
+            "by_tier": by_tier,
+            "total_usage": total,
+            "weekly_usage": weekly,
+            "most_used": tuple(most_used) if most_used else None,
+        }
+
+    def cache_stats(self) -> Dict[str, Tuple[int, int]]:
+        """티어별 (캐시된 이미지 수, 크기 MB)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.tier, COUNT(*), COALESCE(SUM(c.size_mb), 0) "
+                "FROM image_cache c JOIN servers s ON s.name = c.server_name GROUP BY s.tier"
+            ).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def usage_events(self, server_name: str, since: float = 0.0) -> List[float]:
+        """서버의 사용 시각 목록 (epoch 초, since 이후)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT used_at FROM usage_events WHERE server_name = ? AND used_at >= ? "
+                "ORDER BY used_at",
+                (server_name, since)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
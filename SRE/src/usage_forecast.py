@@ -0,0 +1,363 @@
+"""
+Usage Forecast
+요일×시간(hour-of-week) 사용 패턴 학습 → 수요 직전 사전 시작/사전 pull
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .eviction import TraceEvent, load_trace
+from .usage_window import HOURS_PER_WEEK
+
+logger = logging.getLogger(__name__)
+
+
+def week_slot(at: datetime) -> Tuple[int, int]:
+    """(월요일 시작 주 번호, 요일×시간 칸 0~167)"""
+    return (at.toordinal() - 1) // 7, at.weekday() * 24 + at.hour
+
+
+@dataclass
+class SeasonalProfile:
+    """
+    서버 1개의 요일×시간 칸별 사용 확률 추정
+
+    칸마다 "그 시간에 한 번 이상 사용된 주"를 지수 감쇠 가중치로 누적
+    (같은 주 같은 칸의 여러 사용은 1회로 봄)
+    """
+    server_name: str
+    first_week: int
+    weights: List[float] = field(default_factory=lambda: [0.0] * HOURS_PER_WEEK)
+    last_week: List[int] = field(default_factory=lambda: [-1] * HOURS_PER_WEEK)
+
+    def observe(self, week: int, slot: int, decay: float):
+        if self.last_week[slot] == week:
+            return
+        if self.last_week[slot] >= 0:
+            self.weights[slot] *= decay ** (week - self.last_week[slot])
+        self.weights[slot] += 1.0
+        self.last_week[slot] = week
+        self.first_week = min(self.first_week, week)
+
+    def probability(self, week: int, slot: int, decay: float) -> float:
+        """week 주의 slot 칸에 사용이 있을 확률 (그 이전 주들 기준)"""
+        observed_weeks = week - self.first_week
+        if self.last_week[slot] < 0 or observed_weeks <= 0:
+            return 0.0
+        # 1주 전 가중치 decay, 2주 전 decay^2 ... 의 합으로 정규화
+        total = (
+            decay * (1 - decay ** observed_weeks) / (1 - decay) if decay < 1 else observed_weeks
+        )
+        weight = self.weights[slot] * decay ** max(week - self.last_week[slot], 1)
+        return min(weight / total, 1.0)
+
+    def to_dict(self) -> Dict:
+        return {
+            "server_name": self.server_name,
+            "first_week": self.first_week,
+            # 사용이 있었던 칸만 저장: 칸 → [가중치, 마지막 주]
+            "slots": {
+                str(slot): [round(self.weights[slot], 6), self.last_week[slot]]
+                for slot in range(HOURS_PER_WEEK) if self.last_week[slot] >= 0
+            },
+        }
+
+
+@dataclass
+class PrewarmAction:
+    """다음 시간대 사전 준비 1건"""
+    server_name: str
+    at: datetime          # 수요가 예상되는 시간대 시작
+    probability: float
+    action: str           # "start" (컨테이너 사전 시작) 또는 "pull" (이미지만 준비)
+
+
+class UsageForecaster:
+    """
+    요일×시간 계절성 기반 사용 예측기
+
+    주요 기능:
+    - 서버별 168칸 사용 확률 프로필 (최근 주일수록 큰 가중치)
+    - 다음 정각 lead_minutes 전에 확률이 높은 서버는 사전 시작, 중간이면 이미지만 준비
+    - 프로필 JSON 저장/로드 (TierManager 설정과 같은 디렉토리)
+    """
+
+    def __init__(
+        self,
+        profile_path: Optional[str] = None,
+        half_life_weeks: float = 4.0,
+        min_weeks: int = 2,
+        start_probability: float = 0.5,
+        pull_probability: float = 0.2,
+        lead_minutes: float = 10.0
+    ):
+        """
+        Args:
+            profile_path: 프로필 저장 경로 (None이면 메모리에만 유지)
+            half_life_weeks: 과거 주 가중치가 절반이 되는 주 수
+            min_weeks: 예측을 시작하기 전 필요한 관측 주 수
+            start_probability: 이 확률 이상이면 컨테이너 사전 시작
+            pull_probability: 이 확률 이상이면 이미지 사전 준비
+            lead_minutes: 예상 수요 시간대 시작 몇 분 전에 준비할지
+        """
+        self.profile_path = Path(profile_path) if profile_path else None
+        self.decay = 0.5 ** (1.0 / half_life_weeks)
+        self.min_weeks = min_weeks
+        self.start_probability = start_probability
+        self.pull_probability = pull_probability
+        self.lead = timedelta(minutes=lead_minutes)
+        self.profiles: Dict[str, SeasonalProfile] = {}
+        self._planned_hour: Optional[datetime] = None
+        self._dirty = False
+        self.load()
+
+    def observe(self, server_name: str, at: Optional[datetime] = None):
+        """사용 1회 기록"""
+        week, slot = week_slot(at or datetime.now())
+        profile = self.profiles.get(server_name)
+        if profile is None:
+            profile = SeasonalProfile(server_name=server_name, first_week=week)
+            self.profiles[server_name] = profile
+        profile.observe(week, slot, self.decay)
+        self._dirty = True
+
+    def fit(self, history: Iterable[Tuple[str, datetime]]):
+        """사용 이력 (서버 이름, 시각)으로 프로필 학습 (시간순이 아니어도 됨)"""
+        for server_name, at in sorted(history, key=lambda item: item[1]):
+            self.observe(server_name, at)
+
+    def probability(self, server_name: str, at: datetime) -> float:
+        """at이 속한 시간대에 서버가 사용될 확률"""
+        profile = self.profiles.get(server_name)
+        if profile is None:
+            return 0.0
+        week, slot = week_slot(at)
+        if week - profile.first_week < self.min_weeks:
+            return 0.0
+        return profile.probability(week, slot, self.decay)
+
+    def forecast(self, now: Optional[datetime] = None) -> List[PrewarmAction]:
+        """
+        다음 정각 시간대의 사전 준비 목록 (확률 높은 순)
+
+        정각까지 lead_minutes보다 많이 남았거나 이미 계획한 시간대면 빈 목록
+        """
+        now = now or datetime.now()
+        next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        if next_hour - now > self.lead or next_hour == self._planned_hour:
+            return []
+        self._planned_hour = next_hour
+
+        actions = []
+        for server_name in self.profiles:
+            probability = self.probability(server_name, next_hour)
+            if probability >= self.start_probability:
+                actions.append(PrewarmAction(server_name, next_hour, probability, "start"))
+            elif probability >= self.pull_probability:
+                actions.append(PrewarmAction(server_name, next_hour, probability, "pull"))
+        actions.sort(key=lambda a: -a.probability)
+        return actions
+
+    def load(self):
+        """프로필 파일 로드"""
+        if not self.profile_path or not self.profile_path.exists():
+            return
+
+        try:
+            with open(self.profile_path, 'r') as f:
+                data = json.load(f)
+
+            for item in data.get("profiles", []):
+                profile = SeasonalProfile(
+                    server_name=item["server_name"], first_week=item["first_week"]
+                )
+                for slot, (weight, last_week) in item.get("slots", {}).items():
+                    profile.weights[int(slot)] = weight
+                    profile.last_week[int(slot)] = last_week
+                self.profiles[profile.server_name] = profile
+
+            logger.info(f"사용 예측 프로필 로드 완료: {len(self.profiles)}개 서버")
+
+        except Exception as e:
+            logger.error(f"사용 예측 프로필 로드 실패: {e}")
+
+    def save(self):
+        """변경된 프로필 저장"""
+        if not self.profile_path or not self._dirty:
+            return
+
+        try:
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.profile_path, 'w') as f:
+                json.dump({"profiles": [p.to_dict() for p in self.profiles.values()]}, f)
+            self._dirty = False
+
+        except Exception as e:
+            logger.error(f"사용 예측 프로필 저장 실패: {e}")
+
+
+# ========================================
+# 트레이스 재생 평가
+# ========================================
+
+@dataclass
+class PrewarmSimulationResult:
+    """사전 시작 재생 평가 결과 (반응형 풀 대비)"""
+    uses: int = 0
+    baseline_cold_starts: int = 0
+    cold_starts: int = 0
+    prewarm_starts: int = 0
+    prewarm_pulls: int = 0
+    # 사용되지 않고 Idle 타임아웃으로 종료된 사전 시작
+    wasted_prewarms: int = 0
+    baseline_container_minutes: float = 0.0
+    container_minutes: float = 0.0
+
+    @property
+    def cold_starts_avoided(self) -> int:
+        return self.baseline_cold_starts - self.cold_starts
+
+    @property
+    def extra_container_minutes(self) -> float:
+        return self.container_minutes - self.baseline_container_minutes
+
+
+class _ReplayPool:
+    """서버당 컨테이너 1개, 마지막 사용 후 idle 동안 유지되는 풀"""
+
+    def __init__(self, idle: timedelta, count_from: datetime):
+        self.idle = idle
+        self.count_from = count_from
+        # 서버 → [시작 시각, 종료 예정 시각, 사전 시작 후 미사용 여부]
+        self.alive: Dict[str, list] = {}
+        self.minutes = 0.0
+        self.wasted = 0
+
+    def _expire(self, server_name: str, now: datetime):
+        entry = self.alive.get(server_name)
+        if entry is None or entry[1] > now:
+            return
+        self._close(server_name)
+
+    def _close(self, server_name: str):
+        started, until, unused = self.alive.pop(server_name)
+        begin = max(started, self.count_from)
+        if until > begin:
+            self.minutes += (until - begin).total_seconds() / 60
+        if unused and started >= self.count_from:
+            self.wasted += 1
+
+    def use(self, server_name: str, now: datetime) -> bool:
+        """사용 1회 (콜드 스타트면 True)"""
+        self._expire(server_name, now)
+        entry = self.alive.get(server_name)
+        if entry is None:
+            self.alive[server_name] = [now, now + self.idle, False]
+            return True
+        entry[1] = max(entry[1], now + self.idle)
+        entry[2] = False
+        return False
+
+    def prewarm(self, server_name: str, now: datetime) -> bool:
+        """사전 시작 (이미 실행 중이면 False)"""
+        self._expire(server_name, now)
+        if server_name in self.alive:
+            return False
+        self.alive[server_name] = [now, now + self.idle, True]
+        return True
+
+    def finish(self):
+        for server_name in list(self.alive):
+            self._close(server_name)
+
+
+def simulate_prewarming(
+    trace: Iterable[TraceEvent],
+    forecaster: UsageForecaster,
+    idle_timeout_minutes: float = 30.0,
+    warmup_weeks: float = 2.0
+) -> PrewarmSimulationResult:
+    """
+    트레이스 재생: 반응형 풀과 예측 사전 시작 풀의 콜드 스타트/컨테이너 시간 비교
+
+    예측기는 재생 중 과거 사용만 보고 온라인으로 학습. 처음 warmup_weeks는 학습만 하고
+    집계에서 제외
+
+    Returns:
+        회피한 콜드 스타트 수와 추가 컨테이너 시간(분)
+    """
+    events = sorted(trace, key=lambda e: e.timestamp)
+    result = PrewarmSimulationResult()
+    if not events:
+        return result
+
+    idle = timedelta(minutes=idle_timeout_minutes)
+    count_from = events[0].timestamp + timedelta(weeks=warmup_weeks)
+    baseline = _ReplayPool(idle, count_from)
+    pool = _ReplayPool(idle, count_from)
+
+    # 정각 lead 전마다 예측 (이벤트 사이의 빈 시간대 포함)
+    next_hour = events[0].timestamp.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    def plan_until(now: datetime):
+        nonlocal next_hour
+        while next_hour - forecaster.lead <= now:
+            planned_at = next_hour - forecaster.lead
+            for action in forecaster.forecast(planned_at):
+                counted = planned_at >= count_from
+                if action.action == "start":
+                    if pool.prewarm(action.server_name, planned_at) and counted:
+                        result.prewarm_starts += 1
+                elif counted:
+                    result.prewarm_pulls += 1
+            next_hour += timedelta(hours=1)
+
+    for event in events:
+        plan_until(event.timestamp)
+        counted = event.timestamp >= count_from
+        cold_baseline = baseline.use(event.server_name, event.timestamp)
+        cold = pool.use(event.server_name, event.timestamp)
+        if counted:
+            result.uses += 1
+            result.baseline_cold_starts += cold_baseline
+            result.cold_starts += cold
+        forecaster.observe(event.server_name, event.timestamp)
+
+    baseline.finish()
+    pool.finish()
+    result.baseline_container_minutes = baseline.minutes
+    result.container_minutes = pool.minutes
+    result.wasted_prewarms = pool.wasted
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="예측 사전 시작 트레이스 평가")
+    parser.add_argument("trace", help="JSON Lines 사용 트레이스 파일")
+    parser.add_argument("--idle-minutes", type=float, default=30.0)
+    parser.add_argument("--lead-minutes", type=float, default=10.0)
+    parser.add_argument("--start-probability", type=float, default=0.5)
+    parser.add_argument("--warmup-weeks", type=float, default=2.0)
+    args = parser.parse_args()
+
+    r = simulate_prewarming(
+        load_trace(args.trace),
+        UsageForecaster(
+            lead_minutes=args.lead_minutes, start_probability=args.start_probability
+        ),
+        idle_timeout_minutes=args.idle_minutes,
+        warmup_weeks=args.warmup_weeks
+    )
+    print(f"사용: {r.uses}회")
+    print(f"콜드 스타트: {r.baseline_cold_starts} → {r.cold_starts} (회피 {r.cold_starts_avoided})")
+    print(f"사전 시작: {r.prewarm_starts}회 (미사용 {r.wasted_prewarms}), 사전 pull: {r.prewarm_pulls}회")
+    print(
+        f"컨테이너 시간: {r.baseline_container_minutes:.0f}분 → {r.container_minutes:.0f}분 "
+        f"(+{r.extra_container_minutes:.0f}분)"
+    )
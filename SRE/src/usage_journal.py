@@ -0,0 +1,161 @@
+"""
+Usage Journal
+서버 사용 이벤트 append-only 로그 (JSON Lines + CRC32)
+"""
+
+import json
+import logging
+import os
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JournalRecord:
+    """
+    저널 레코드 1건
+
+    op: "use" (사용 1회) 또는 "reg" (서버 등록, data에 package/version/tier)
+    """
+    seq: int
+    op: str
+    server_name: str
+    timestamp: float
+    data: Dict = field(default_factory=dict)
+
+    def encode(self) -> bytes:
+        """'<crc32 hex> <json>\\n' 형식 한 줄"""
+        payload = json.dumps(
+            {"n": self.seq, "op": self.op, "s": self.server_name, "ts": self.timestamp, **self.data},
+            separators=(",", ":"),
+            ensure_ascii=False
+        ).encode()
+        return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+    @classmethod
+    def decode(cls, line: bytes) -> Optional["JournalRecord"]:
+        """한 줄 복원 (잘린 줄이나 CRC 불일치면 None)"""
+        if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+            return None
+        payload = line[9:-1]
+        try:
+            if int(line[:8], 16) != zlib.crc32(payload):
+                return None
+            item = json.loads(payload)
+            seq, op, name, ts = item.pop("n"), item.pop("op"), item.pop("s"), item.pop("ts")
+        except (ValueError, KeyError):
+            return None
+        return cls(seq=seq, op=op, server_name=name, timestamp=ts, data=item)
+
+
+class UsageJournal:
+    """
+    append-only 사용 이벤트 로그
+
+    주요 기능:
+    - 사용 1회 = 한 줄 append (O(1), 파일 전체를 다시 쓰지 않음)
+    - 줄마다 CRC32 → 기록 도중 중단되어 잘린 마지막 줄은 재생 시 무시
+    - 스냅샷 저장 후 compact(seq)로 스냅샷에 반영된 레코드 제거
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 저널 파일 경로
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.seq = 0
+        # 마지막 compact 이후 append된 레코드 수
+        self.records = 0
+        self.corrupted = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def replay(self, after_seq: int = 0) -> Iterator[JournalRecord]:
+        """
+        seq > after_seq 인 레코드 순서대로 재생 (시작 시 1회)
+
+        손상된 줄은 건너뛰고, 잘린 마지막 줄은 잘라내서 이후 append가 이어지도록 함
+        """
+        if not self.path.exists():
+            self.seq = max(self.seq, after_seq)
+            return
+
+        valid_end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                record = JournalRecord.decode(line)
+                if record is None:
+                    if line.endswith(b"\n"):
+                        self.corrupted += 1
+                        valid_end += len(line)
+                        continue
+                    break  # 기록 도중 중단된 마지막 줄
+                valid_end += len(line)
+                self.seq = max(self.seq, record.seq)
+                self.records += 1
+                if record.seq > after_seq:
+                    yield record
+
+        if valid_end < self.path.stat().st_size:
+            logger.warning(f"사용 저널 끝의 잘린 레코드 제거: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+        if self.corrupted:
+            logger.warning(f"사용 저널 손상 레코드 {self.corrupted}건 무시")
+        self.seq = max(self.seq, after_seq)
+
+    def append(self, op: str, server_name: str, timestamp: float, **data) -> int:
+        """레코드 1건 추가 (OS 버퍼까지 기록, fsync는 compact 때)"""
+        with self._lock:
+            self.seq += 1
+            record = JournalRecord(self.seq, op, server_name, timestamp, data)
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(record.encode())
+            self._file.flush()
+            self.records += 1
+            return self.seq
+
+    def compact(self, upto_seq: int):
+        """
+        스냅샷에 반영된 레코드(seq <= upto_seq) 제거
+
+        스냅샷을 만든 뒤 추가된 레코드는 남김. 임시 파일 + rename으로 원자적 교체
+        """
+        with self._lock:
+            # 교체 전에 append 핸들을 닫음 (다음 append가 새 파일을 다시 엶)
+            self._close_file()
+            if not self.path.exists():
+                return
+
+            kept = []
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    record = JournalRecord.decode(line)
+                    if record is not None and record.seq > upto_seq:
+                        kept.append(line)
+
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.writelines(kept)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self.records = len(kept)
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """append 핸들 닫기 (여러 번 호출해도 안전, 이후 append는 파일을 다시 엶)"""
+        with self._lock:
+            self._close_file()
@@ -0,0 +1,87 @@
+"""
+Hourly Usage Window
+최근 7일 사용 수를 시간 단위 버킷 링 버퍼로 유지 (rolling window)
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+HOURS_PER_WEEK = 168
+
+
+def epoch_hour(timestamp: float) -> int:
+    """epoch 초 → 시간 인덱스"""
+    return int(timestamp // 3600)
+
+
+@dataclass
+class HourlyUsageWindow:
+    """
+    서버 1개의 최근 168시간 사용 수
+
+    버킷 168칸 고정 (서버당 O(1) 메모리). 새 시간이 되면 지난 버킷을 비우며 전진하므로
+    주간 카운터를 한꺼번에 초기화할 필요가 없음
+    """
+    buckets: List[int] = field(default_factory=lambda: [0] * HOURS_PER_WEEK)
+    # 가장 최근 버킷의 시간 인덱스
+    head_hour: int = 0
+    # 버킷 합계 (조회 O(1))
+    total: int = 0
+
+    def _advance(self, hour: int):
+        """hour까지 전진하며 윈도우를 벗어난 버킷 비움"""
+        if hour <= self.head_hour:
+            return
+        if hour - self.head_hour >= HOURS_PER_WEEK:
+            self.buckets = [0] * HOURS_PER_WEEK
+            self.total = 0
+        else:
+            for expired in range(self.head_hour + 1, hour + 1):
+                index = expired % HOURS_PER_WEEK
+                self.total -= self.buckets[index]
+                self.buckets[index] = 0
+        self.head_hour = hour
+
+    def add(self, timestamp: float, count: int = 1):
+        """사용 기록 (윈도우보다 오래된 시각은 무시)"""
+        hour = epoch_hour(timestamp)
+        self._advance(hour)
+        if hour <= self.head_hour - HOURS_PER_WEEK:
+            return
+        self.buckets[hour % HOURS_PER_WEEK] += count
+        self.total += count
+
+    def count(self, now: Optional[float] = None, hours: int = HOURS_PER_WEEK) -> int:
+        """최근 hours시간 사용 수 (기본: 7일)"""
+        self._advance(epoch_hour(time.time() if now is None else now))
+        if hours >= HOURS_PER_WEEK:
+            return self.total
+        return sum(
+            self.buckets[(self.head_hour - offset) % HOURS_PER_WEEK]
+            for offset in range(hours)
+        )
+
+    def hourly(self, now: Optional[float] = None) -> Dict[int, int]:
+        """시간 인덱스 → 사용 수 (0이 아닌 버킷만)"""
+        self._advance(epoch_hour(time.time() if now is None else now))
+        result = {}
+        for offset in range(HOURS_PER_WEEK):
+            hour = self.head_hour - offset
+            if self.buckets[hour % HOURS_PER_WEEK]:
+                result[hour] = self.buckets[hour % HOURS_PER_WEEK]
+        return result
+
+    def to_dict(self) -> Dict:
+        """0이 아닌 버킷만 저장"""
+        return {
+            "head_hour": self.head_hour,
+            "counts": {str(hour): count for hour, count in self.hourly(self.head_hour * 3600).items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "HourlyUsageWindow":
+        window = cls(head_hour=(data or {}).get("head_hour", 0))
+        for hour, count in (data or {}).get("counts", {}).items():
+            window.add(int(hour) * 3600, count)
+        return window
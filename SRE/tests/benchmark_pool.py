@@ -0,0 +1,313 @@
+"""
+War Room 2.0 - 컨테이너 풀 벤치마크 (가짜 Docker Engine 사용, Docker 불필요)
+
+장애 도착 트레이스를 IntegratedWarRoom.handle_incident로 재생하고
+처리량, 지연 시간 백분위수, 풀 적중률을 보고
+
+실행:
+    python tests/benchmark_pool.py --incidents 200 --rate 20
+    python tests/benchmark_pool.py --trace incidents.jsonl --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_docker_engine import EngineProfile, FakeDockerEngine
+
+from src.container_orchestrator import ContainerPoolConfig
+from src.integrated_war_room import IntegratedWarRoom
+from src.latency_stats import percentile
+from src.mcp_catalog import MCPServerCandidate
+
+# 키워드별 대표 장애 로그 (ProblemAnalyzer 패턴 규칙에 걸리는 문장)
+SAMPLE_LOGS = {
+    "docker": "Error: Cannot connect to the Docker daemon at unix:///var/run/docker.sock",
+    "kubernetes": "kubectl: pod api-7f9c CrashLoopBackOff in deployment api",
+    "postgres": "FATAL: psql could not connect, database connection refused",
+    "redis": "Error: connect ECONNREFUSED 127.0.0.1:6379 (redis)",
+    "aws": "botocore: AccessDenied when calling s3 PutObject",
+    "mongodb": "MongoNetworkError: connect ECONNREFUSED 127.0.0.1:27017",
+}
+
+SEVERITIES = ("critical", "high", "medium", "low")
+
+
+@dataclass
+class TraceEvent:
+    """장애 1건 (at: 트레이스 시작 기준 도착 시각, 초)"""
+    at: float
+    error_log: str
+    severity: str = "medium"
+    source: str = "default"
+
+
+def synthetic_trace(
+    count: int,
+    rate_per_second: float,
+    zipf_s: float = 1.2,
+    seed: int = 0
+) -> List[TraceEvent]:
+    """
+    포아송 도착 + Zipf 분포 서버 인기도 트레이스
+
+    Args:
+        count: 장애 수
+        rate_per_second: 평균 도착률
+        zipf_s: 인기도 치우침 (클수록 소수 서버에 집중)
+    """
+    rng = random.Random(seed)
+    keywords = list(SAMPLE_LOGS)
+    weights = [1 / (rank ** zipf_s) for rank in range(1, len(keywords) + 1)]
+
+    events = []
+    at = 0.0
+    for i in range(count):
+        at += rng.expovariate(rate_per_second)
+        keyword = rng.choices(keywords, weights)[0]
+        events.append(TraceEvent(
+            at=at,
+            error_log=SAMPLE_LOGS[keyword],
+            severity=rng.choices(SEVERITIES, (1, 3, 5, 2))[0],
+            source=f"alert-{i % 3}"
+        ))
+    return events
+
+
+def load_trace(path: str) -> List[TraceEvent]:
+    """JSONL 트레이스 로드 (줄마다 {"at", "error_log", "severity", "source"})"""
+    events = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                events.append(TraceEvent(
+                    at=float(item["at"]),
+                    error_log=item["error_log"],
+                    severity=item.get("severity", "medium"),
+                    source=item.get("source", "default")
+                ))
+    return sorted(events, key=lambda e: e.at)
+
+
+class FakeCatalog:
+    """키워드 → 고정 MCP 서버 후보 (npm 검색 대신)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @staticmethod
+    def server_name(keyword: str) -> str:
+        return f"@modelcontextprotocol/server-{keyword}"
+
+    def search_servers(self, keywords: List[str], limit: int = 5) -> List[MCPServerCandidate]:
+        self.calls += 1
+        candidates = [
+            MCPServerCandidate(
+                name=self.server_name(keyword),
+                description=f"{keyword} MCP server",
+                version="1.0.0",
+                downloads=10000,
+                last_updated=datetime.now(timezone.utc),
+                official=True
+            )
+            for keyword in keywords
+        ]
+        for candidate in candidates:
+            candidate.score = candidate.calculate_score()
+        return candidates[:limit]
+
+    def close(self):
+        pass
+
+
+@dataclass
+class BenchmarkReport:
+    """벤치마크 결과"""
+    incidents: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    wall_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    ready_seconds: List[float] = field(default_factory=list)
+    pool_hits: int = 0
+    containers_created: int = 0
+    peak_running: int = 0
+    engine_calls: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    # 장애 처리 엔진의 단계별 소요 시간 (queue, analyze, catalog, start, ready)
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.succeeded / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def pool_hit_rate(self) -> float:
+        return self.pool_hits / self.succeeded if self.succeeded else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "incidents": self.incidents,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_per_second": round(self.throughput, 2),
+            "latency_p50_seconds": round(percentile(self.latencies, 50), 3),
+            "latency_p95_seconds": round(percentile(self.latencies, 95), 3),
+            "latency_p99_seconds": round(percentile(self.latencies, 99), 3),
+            "ready_p50_seconds": round(percentile(self.ready_seconds, 50), 3),
+            "ready_p99_seconds": round(percentile(self.ready_seconds, 99), 3),
+            "pool_hit_rate": round(self.pool_hit_rate, 3),
+            "containers_created": self.containers_created,
+            "peak_running": self.peak_running,
+            "engine_calls": dict(self.engine_calls),
+            "errors": dict(self.errors),
+            "stages": dict(self.stages),
+        }
+
+
+def build_war_room(
+    engine: FakeDockerEngine,
+    config_dir: str,
+    pool_config: Optional[ContainerPoolConfig] = None
+) -> IntegratedWarRoom:
+    """가짜 엔진에 연결된 IntegratedWarRoom (샘플 서버 이미지는 미리 로드)"""
+    pool_config = replace(
+        pool_config or ContainerPoolConfig(),
+        docker_hosts={"fake": engine.base_url},
+        auto_build_images=False
+    )
+    # 같은 로그 반복 재생 → 상관 분석을 끄고 매번 풀 경로를 측정
+    war_room = IntegratedWarRoom(
+        config_dir=config_dir, container_config=pool_config, correlate_incidents=False
+    )
+    war_room.catalog = FakeCatalog()
+    # 컨테이너 stdio attach는 가짜 MCP 서버로 대체
+    war_room.orchestrator._open_attach_socket = engine.open_attach_socket
+
+    for keyword in SAMPLE_LOGS:
+        engine.add_image(war_room.orchestrator._get_image_name(FakeCatalog.server_name(keyword)))
+    return war_room
+
+
+async def replay(war_room: IntegratedWarRoom, trace: List[TraceEvent], time_scale: float = 1.0) -> BenchmarkReport:
+    """
+    트레이스 재생 (도착 시각에 맞춰 동시 처리)
+
+    Args:
+        time_scale: 도착 간격 배율 (0이면 전부 한꺼번에 도착)
+    """
+    report = BenchmarkReport(incidents=len(trace))
+    seen_containers = set()
+    readiness = war_room.orchestrator.readiness
+    if readiness:
+        readiness.add_listener(lambda result: report.ready_seconds.append(result.ready_seconds))
+    # 운영과 같이 장애 처리 엔진(대기열 + 워커 풀)을 거쳐 처리
+    war_room.incidents.start()
+    started = time.monotonic()
+
+    async def handle(event: TraceEvent):
+        await asyncio.sleep(max(0.0, started + event.at * time_scale - time.monotonic()))
+        incident_started = time.monotonic()
+        result = await war_room.incidents.process(
+            event.error_log,
+            auto_approve=True,
+            severity=event.severity,
+            source=event.source
+        )
+        latency = time.monotonic() - incident_started
+
+        if not result.get("success"):
+            report.failed += 1
+            message = result.get("error") or result.get("message", "")
+            report.errors[message] = report.errors.get(message, 0) + 1
+            return
+
+        report.succeeded += 1
+        report.latencies.append(latency)
+        if result["container_id"] in seen_containers:
+            report.pool_hits += 1
+        seen_containers.add(result["container_id"])
+
+    await asyncio.gather(*(handle(event) for event in trace))
+    report.wall_seconds = time.monotonic() - started
+    report.stages = war_room.incidents.get_stats()["stages"]
+    return report
+
+
+async def run_benchmark(
+    trace: List[TraceEvent],
+    profile: Optional[EngineProfile] = None,
+    pool_config: Optional[ContainerPoolConfig] = None,
+    time_scale: float = 1.0,
+    config_dir: Optional[str] = None
+) -> BenchmarkReport:
+    """가짜 엔진 기동 → 트레이스 재생 → 종료까지 수행하고 결과 반환"""
+    engine = FakeDockerEngine(profile)
+    with tempfile.TemporaryDirectory() as tmp:
+        war_room = build_war_room(engine, config_dir or tmp, pool_config)
+        try:
+            report = await replay(war_room, trace, time_scale)
+        finally:
+            await war_room.shutdown()
+            engine.close()
+
+    report.containers_created = engine.calls["create"]
+    report.peak_running = engine.peak_running
+    report.engine_calls = dict(engine.calls)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="War Room 컨테이너 풀 벤치마크")
+    parser.add_argument("--trace", help="JSONL 트레이스 경로 (없으면 합성 트레이스)")
+    parser.add_argument("--incidents", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=10.0, help="초당 장애 도착 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--start-seconds", type=float, default=0.05)
+    parser.add_argument("--ready-seconds", type=float, default=0.5)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="컨테이너 시작 실패 확률")
+    parser.add_argument("--max-containers", type=int, default=10)
+    parser.add_argument("--max-concurrent-starts", type=int, default=2)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    trace = load_trace(args.trace) if args.trace else synthetic_trace(
+        args.incidents, args.rate, seed=args.seed
+    )
+    profile = EngineProfile(
+        start_seconds=args.start_seconds,
+        ready_seconds=args.ready_seconds,
+        failure_rates={"start": args.failure_rate},
+        seed=args.seed
+    )
+    pool_config = ContainerPoolConfig(
+        max_concurrent_containers=args.max_containers,
+        max_concurrent_starts=args.max_concurrent_starts
+    )
+
+    report = asyncio.run(run_benchmark(trace, profile, pool_config, args.time_scale))
+    output = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+
+if __name__ == "__main__":
+    main()
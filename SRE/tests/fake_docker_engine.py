@@ -0,0 +1,462 @@
+"""
+테스트/벤치마크용 가짜 Docker Engine (HTTP, 프로세스 내 스레드 서버)
+
+docker.DockerClient(base_url=engine.base_url)로 실제 docker SDK 경로를 그대로 사용.
+이미지 pull/컨테이너 생성/시작/종료 지연, 메모리 사용량, 실패 주입을 설정 가능.
+MCP stdio(attach)는 HTTP 업그레이드 대신 open_attach_socket()이 가짜 MCP 서버를 연결
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from fake_mcp_server import FakeMCPServer
+
+API_VERSION = "1.44"
+MB = 1024 * 1024
+
+
+@dataclass
+class EngineProfile:
+    """엔진 동작 설정 (초 단위 지연, MB 단위 메모리)"""
+    pull_seconds: float = 0.0
+    create_seconds: float = 0.0
+    start_seconds: float = 0.0
+    # SIGTERM 후 종료까지 걸리는 시간 (None이면 SIGKILL 전까지 종료 안 함)
+    stop_seconds: Optional[float] = 0.0
+    # 시작 후 MCP 핸드셰이크가 가능해질 때까지 시간 (npm 설치 등)
+    ready_seconds: float = 0.0
+    memory_mb: int = 50
+    cpu_cores: float = 0.05
+    # 이미지별 덮어쓰기: 이미지 이름 → {"ready_seconds": ..., "memory_mb": ...}
+    image_overrides: Dict[str, Dict] = field(default_factory=dict)
+    # 작업별 실패 확률: "pull", "create", "start", "stop" → 0~1
+    failure_rates: Dict[str, float] = field(default_factory=dict)
+    mem_total_mb: int = 8192
+    ncpu: int = 4
+    seed: int = 0
+
+    def for_image(self, image: str, key: str):
+        return self.image_overrides.get(image, {}).get(key, getattr(self, key))
+
+
+@dataclass
+class FakeContainer:
+    id: str
+    name: str
+    image: str
+    labels: Dict[str, str]
+    env: List[str]
+    host_config: Dict
+    created_at: float
+    started_at: Optional[float] = None
+    exit_at: Optional[float] = None
+    oom_killed: bool = False
+
+    def running(self, now: float) -> bool:
+        return self.started_at is not None and (self.exit_at is None or now < self.exit_at)
+
+    def state(self, now: float) -> str:
+        if self.started_at is None:
+            return "created"
+        return "running" if self.running(now) else "exited"
+
+
+class FakeDockerEngine:
+    """
+    가짜 Docker Engine API 서버
+
+    사용 예:
+        engine = FakeDockerEngine(EngineProfile(start_seconds=0.05))
+        engine.add_image("mcp/server-docker:latest")
+        client = docker.DockerClient(base_url=engine.base_url)
+        ...
+        engine.close()
+    """
+
+    def __init__(self, profile: Optional[EngineProfile] = None):
+        self.profile = profile or EngineProfile()
+        self.images: Dict[str, Dict] = {}
+        self.containers: Dict[str, FakeContainer] = {}
+        self.networks: Dict[str, Dict] = {}
+        # 레지스트리에 있는 이미지 (pull 가능)
+        self.registry: Dict[str, int] = {}
+        self.calls: Counter = Counter()
+        self.peak_running = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._random = random.Random(self.profile.seed)
+        self._mcp_servers: List[FakeMCPServer] = []
+
+        engine = self
+
+        class Handler(_EngineHandler):
+            pass
+
+        Handler.engine = engine
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"tcp://{host}:{port}"
+
+    # ---- 상태 준비 -------------------------------------------------------
+
+    def add_image(self, name: str, size_mb: int = 150):
+        """로컬에 이미지 추가"""
+        if ":" not in name.rsplit("/", 1)[-1]:
+            name += ":latest"
+        with self._lock:
+            self.images[name] = {
+                "Id": "sha256:" + uuid.uuid5(uuid.NAMESPACE_URL, name).hex,
+                "RepoTags": [name],
+                "Size": size_mb * MB,
+                "Created": int(time.time()),
+            }
+
+    def add_registry_image(self, name: str, size_mb: int = 150):
+        """pull 가능한 레지스트리 이미지 추가"""
+        self.registry[name if ":" in name.rsplit("/", 1)[-1] else name + ":latest"] = size_mb
+
+    def running_count(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for c in self.containers.values() if c.running(now))
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        for server in self._mcp_servers:
+            server.close()
+
+    # ---- MCP stdio ------------------------------------------------------
+
+    def open_attach_socket(self, container_id: str):
+        """
+        컨테이너 stdio 대신 가짜 MCP 서버 연결
+
+        남은 준비 시간(ready_seconds - 경과 시간)만큼 늦게 응답하기 시작
+        """
+        with self._lock:
+            container = self.containers.get(container_id)
+            if container is None or not container.running(time.monotonic()):
+                raise OSError(f"컨테이너가 실행 중이 아님: {container_id}")
+            ready_at = container.started_at + self.profile.for_image(
+                container.image, "ready_seconds"
+            )
+        server = FakeMCPServer(startup_delay=max(0.0, ready_at - time.monotonic()))
+        self._mcp_servers.append(server)
+        return server.open_socket()
+
+    # ---- 요청 처리 (핸들러 스레드) ----------------------------------------
+
+    def _inject_failure(self, op: str) -> bool:
+        rate = self.profile.failure_rates.get(op, 0.0)
+        return rate > 0 and self._random.random() < rate
+
+    def _container(self, ref: str) -> Optional[FakeContainer]:
+        container = self.containers.get(ref)
+        if container:
+            return container
+        for container in self.containers.values():
+            if container.id.startswith(ref) or container.name.lstrip("/") == ref:
+                return container
+        return None
+
+    def _image_key(self, ref: str) -> Optional[str]:
+        """태그 또는 이미지 ID → images 키"""
+        if ref in self.images:
+            return ref
+        if ref + ":latest" in self.images:
+            return ref + ":latest"
+        for name, image in self.images.items():
+            if image["Id"] == ref or image["Id"] == "sha256:" + ref:
+                return name
+        return None
+
+    def _inspect(self, container: FakeContainer) -> Dict:
+        now = time.monotonic()
+        state = container.state(now)
+        return {
+            "Id": container.id,
+            "Name": container.name,
+            "Image": container.image,
+            "Created": "2025-01-01T00:00:00Z",
+            "Config": {
+                "Image": container.image,
+                "Labels": container.labels,
+                "Env": container.env,
+                "Tty": False,
+                "OpenStdin": True,
+            },
+            "HostConfig": container.host_config,
+            "State": {
+                "Status": state,
+                "Running": state == "running",
+                "ExitCode": 0 if state != "exited" else (137 if container.oom_killed else 0),
+                "OOMKilled": container.oom_killed,
+            },
+        }
+
+    def _stats(self, container: FakeContainer) -> Dict:
+        memory_mb = self.profile.for_image(container.image, "memory_mb")
+        cpu_cores = self.profile.for_image(container.image, "cpu_cores")
+        return {
+            "memory_stats": {
+                "usage": memory_mb * MB if container.running(time.monotonic()) else 0,
+                "limit": container.host_config.get("Memory") or self.profile.mem_total_mb * MB,
+            },
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": int(cpu_cores * 1e9)},
+                "system_cpu_usage": 10 ** 9,
+                "online_cpus": 1,
+            },
+            "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+        }
+
+    def _update_peak(self):
+        now = time.monotonic()
+        running = sum(1 for c in self.containers.values() if c.running(now))
+        self.peak_running = max(self.peak_running, running)
+
+    def handle(self, method: str, path: str, query: Dict, body: Optional[Dict]):
+        """(상태 코드, JSON 본문) 반환"""
+        path = re.sub(r"^/v[\d.]+", "", path)
+        profile = self.profile
+
+        if path == "/_ping":
+            return 200, "OK"
+        if path == "/version":
+            return 200, {"ApiVersion": API_VERSION, "MinAPIVersion": "1.24", "Version": "fake"}
+        if path == "/info":
+            self.calls["info"] += 1
+            return 200, {
+                "MemTotal": profile.mem_total_mb * MB,
+                "NCPU": profile.ncpu,
+                "Containers": len(self.containers),
+                "Name": "fake-engine",
+            }
+
+        # 네트워크
+        if path == "/networks/create" and method == "POST":
+            with self._lock:
+                self.networks[body["Name"]] = {"Id": uuid.uuid4().hex, "Name": body["Name"]}
+                return 201, {"Id": self.networks[body["Name"]]["Id"]}
+        match = re.fullmatch(r"/networks/([^/]+)", path)
+        if match and method == "GET":
+            network = next(
+                (n for n in self.networks.values() if match.group(1) in (n["Id"], n["Name"])),
+                None
+            )
+            return (200, network) if network else (404, {"message": "network not found"})
+
+        # 이미지
+        if path == "/images/json":
+            with self._lock:
+                return 200, list(self.images.values())
+        if path == "/images/create" and method == "POST":
+            self.calls["pull"] += 1
+            name = query["fromImage"] + ":" + query.get("tag", "latest")
+            time.sleep(profile.pull_seconds)
+            if self._inject_failure("pull") or name not in self.registry:
+                return 404, {"message": f"pull access denied for {name}, repository does not exist"}
+            self.add_image(name, self.registry[name])
+            return 200, {"status": f"Downloaded newer image for {name}"}
+        match = re.fullmatch(r"/images/(.+)/json", path)
+        if match:
+            key = self._image_key(match.group(1))
+            if key is None:
+                return 404, {"message": f"No such image: {match.group(1)}"}
+            return 200, self.images[key]
+        match = re.fullmatch(r"/images/(.+)", path)
+        if match and method == "DELETE":
+            with self._lock:
+                key = self._image_key(match.group(1))
+                image = self.images.pop(key) if key else None
+            if image is None:
+                return 404, {"message": f"No such image: {match.group(1)}"}
+            return 200, [{"Untagged": match.group(1)}, {"Deleted": image["Id"]}]
+
+        # 컨테이너
+        if path == "/containers/json":
+            filters = json.loads(query.get("filters", "{}") or "{}")
+            labels = filters.get("label", [])
+            labels = [labels] if isinstance(labels, str) else labels
+            now = time.monotonic()
+            with self._lock:
+                result = []
+                for container in self.containers.values():
+                    if not query.get("all") in ("1", "true") and not container.running(now):
+                        continue
+                    if not all(_label_matches(container.labels, f) for f in labels):
+                        continue
+                    result.append({
+                        "Id": container.id,
+                        "Names": [container.name],
+                        "Image": container.image,
+                        "Labels": container.labels,
+                        "State": container.state(now),
+                    })
+                return 200, result
+        if path == "/containers/create" and method == "POST":
+            self.calls["create"] += 1
+            time.sleep(profile.create_seconds)
+            image = body.get("Image", "")
+            if ":" not in image.rsplit("/", 1)[-1]:
+                image += ":latest"
+            if image not in self.images:
+                return 404, {"message": f"No such image: {image}"}
+            if self._inject_failure("create"):
+                return 500, {"message": "injected create failure"}
+            container = FakeContainer(
+                id=uuid.uuid4().hex + uuid.uuid4().hex,
+                name="/" + (query.get("name") or uuid.uuid4().hex[:12]),
+                image=image,
+                labels=body.get("Labels") or {},
+                env=body.get("Env") or [],
+                host_config=body.get("HostConfig") or {},
+                created_at=time.monotonic(),
+            )
+            with self._lock:
+                self.containers[container.id] = container
+            return 201, {"Id": container.id, "Warnings": []}
+
+        match = re.fullmatch(r"/containers/([^/]+)(/[a-z]+)?", path)
+        if not match:
+            return 404, {"message": f"page not found: {path}"}
+        container = self._container(match.group(1))
+        if container is None:
+            return 404, {"message": f"No such container: {match.group(1)}"}
+        action = match.group(2)
+
+        if action == "/json":
+            with self._lock:
+                return 200, self._inspect(container)
+        if action == "/start":
+            self.calls["start"] += 1
+            time.sleep(profile.start_seconds)
+            if self._inject_failure("start"):
+                return 500, {"message": "injected start failure"}
+            with self._lock:
+                container.started_at = time.monotonic()
+                self._update_peak()
+            return 204, None
+        if action == "/stats":
+            self.calls["stats"] += 1
+            return 200, self._stats(container)
+        if action == "/logs":
+            return 200, b""
+        if action == "/update":
+            with self._lock:
+                container.host_config.update(body or {})
+            return 200, {"Warnings": []}
+        if action == "/kill":
+            self.calls["kill"] += 1
+            signal = query.get("signal", "SIGKILL")
+            with self._lock:
+                now = time.monotonic()
+                if not container.running(now):
+                    return 409, {"message": f"Container {container.id} is not running"}
+                stop_seconds = profile.for_image(container.image, "stop_seconds")
+                if signal in ("SIGKILL", "KILL", "9") or stop_seconds == 0:
+                    container.exit_at = now
+                elif stop_seconds is not None:
+                    container.exit_at = min(container.exit_at or now + stop_seconds, now + stop_seconds)
+                self._changed.notify_all()
+            return 204, None
+        if action == "/stop":
+            self.calls["stop"] += 1
+            timeout = float(query.get("t", 10))
+            stop_seconds = profile.for_image(container.image, "stop_seconds")
+            wait = timeout if stop_seconds is None else min(stop_seconds, timeout)
+            time.sleep(wait)
+            with self._lock:
+                container.exit_at = time.monotonic()
+                self._changed.notify_all()
+            return 204, None
+        if action == "/wait":
+            with self._lock:
+                while container.running(time.monotonic()):
+                    remaining = (
+                        container.exit_at - time.monotonic() if container.exit_at else None
+                    )
+                    self._changed.wait(timeout=remaining if remaining and remaining > 0 else 0.5)
+            return 200, {"StatusCode": 0}
+        if action is None and method == "DELETE":
+            self.calls["remove"] += 1
+            force = query.get("force") in ("1", "true", "True")
+            with self._lock:
+                if container.running(time.monotonic()) and not force:
+                    return 409, {"message": "You cannot remove a running container"}
+                del self.containers[container.id]
+                self._changed.notify_all()
+            return 204, None
+
+        return 404, {"message": f"page not found: {method} {path}"}
+
+
+def _label_matches(labels: Dict[str, str], expression: str) -> bool:
+    key, _, value = expression.partition("=")
+    if key not in labels:
+        return False
+    return not value or labels[key] == value
+
+
+class _EngineHandler(BaseHTTPRequestHandler):
+    """HTTP ↔ FakeDockerEngine.handle 변환"""
+
+    engine: FakeDockerEngine = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # 요청 로그 생략
+
+    def _dispatch(self):
+        parsed = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None  # build context 등 JSON이 아닌 본문
+
+        status, payload = self.engine.handle(self.command, parsed.path, query, body)
+
+        if isinstance(payload, bytes):
+            data, content_type = payload, "application/vnd.docker.raw-stream"
+        elif isinstance(payload, str):
+            data, content_type = payload.encode(), "text/plain"
+        elif payload is None:
+            data, content_type = b"", "application/json"
+        else:
+            data, content_type = json.dumps(payload).encode(), "application/json"
+
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Api-Version", API_VERSION)
+            if status != 204:
+                self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if status != 204:
+                self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 먼저 끊음 (wait 시간 초과 등)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_DELETE = _dispatch
+    do_HEAD = _dispatch
@@ -0,0 +1,104 @@
+"""
+테스트용 가짜 MCP 서버 (Docker attach 소켓 흉내)
+
+socketpair 한쪽을 컨테이너 stdio처럼 다룸: stdin은 원본 바이트,
+stdout/stderr는 8바이트 헤더 프레임으로 전송
+"""
+
+import json
+import socket
+import struct
+import threading
+import time
+
+FRAME_HEADER = struct.Struct(">BxxxI")
+
+
+class FakeMCPServer:
+    """initialize / tools/list / tools/call에 응답하는 스레드 서버"""
+
+    def __init__(self, tools=("echo",), startup_delay: float = 0.0):
+        self.tools = list(tools)
+        self.startup_delay = startup_delay
+        self.requests = []
+        self.client_sock, self._server_sock = socket.socketpair()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def open_socket(self, container_id=None):
+        return self.client_sock
+
+    def disconnect(self):
+        """컨테이너 stdio 종료 흉내 (클라이언트는 EOF 수신)"""
+        try:
+            self._server_sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self):
+        for sock in (self.client_sock, self._server_sock):
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def _send(self, stream: int, payload: bytes):
+        # 프레임을 둘로 쪼개 보내 수신 측 버퍼링 검증
+        frame = FRAME_HEADER.pack(stream, len(payload)) + payload
+        middle = len(frame) // 2
+        with self._lock:
+            try:
+                self._server_sock.sendall(frame[:middle])
+                self._server_sock.sendall(frame[middle:])
+            except OSError:
+                pass  # 연결 종료됨
+
+    def _serve(self):
+        # npm 설치 중인 서버 흉내: stdin은 파이프에 쌓이고 나중에 처리
+        time.sleep(self.startup_delay)
+        self._send(2, b"Starting MCP Server: fake\n")
+
+        buffer = b""
+        while True:
+            try:
+                data = self._server_sock.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+
+            lines = (buffer + data).split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                if line.strip():
+                    self._handle(json.loads(line))
+
+    def _handle(self, request):
+        self.requests.append(request)
+        if "id" not in request:
+            return  # notification
+
+        method = request["method"]
+        if method == "initialize":
+            result = {
+                "protocolVersion": request["params"]["protocolVersion"],
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake", "version": "1.0.0"},
+            }
+        elif method == "tools/list":
+            result = {
+                "tools": [
+                    {"name": name, "inputSchema": {"type": "object"}}
+                    for name in self.tools
+                ]
+            }
+        elif method == "tools/call":
+            params = request["params"]
+            text = f"{params['name']}:{json.dumps(params.get('arguments') or {}, sort_keys=True)}"
+            result = {"content": [{"type": "text", "text": text}], "isError": False}
+        else:
+            result = {}
+
+        response = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        self._send(1, (json.dumps(response) + "\n").encode())
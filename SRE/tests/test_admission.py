@@ -0,0 +1,282 @@
+"""
+War Room 2.0 - 컨테이너 시작 승인 제어 테스트 (Docker 불필요)
+"""
+
+import asyncio
+
+from test_container_orchestrator import _make_orchestrator
+
+from src.admission import AdmissionController, AdmissionRejected
+from src.container_orchestrator import LaunchSpec
+
+
+async def _hold_slots(controller, count):
+    """슬롯을 모두 점유해 이후 요청이 대기열에 쌓이게 함"""
+    release = asyncio.Event()
+
+    async def hold():
+        async with controller.slot():
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(count)]
+    await asyncio.sleep(0)
+    return release, tasks
+
+
+def test_priority_then_fair_across_sources():
+    """심각도 → 티어 순으로 승인, 같은 우선순위는 출처별로 번갈아 승인"""
+    async def scenario():
+        controller = AdmissionController(max_concurrent_starts=1)
+        release, holders = await _hold_slots(controller, 1)
+        order = []
+
+        async def request(name, severity, tier=None, source="default"):
+            async with controller.slot(severity, tier, source):
+                order.append(name)
+
+        requests = [
+            ("a-low", "low", None, "a"),
+            ("a1", "medium", None, "a"),
+            ("a2", "medium", None, "a"),
+            ("a3", "medium", None, "a"),
+            ("b1", "medium", None, "b"),
+            ("cold", "critical", "tier3_cold", "c"),
+            ("hot", "critical", "tier1_hot", "c"),
+        ]
+        tasks = [asyncio.create_task(request(*r)) for r in requests]
+        await asyncio.sleep(0)
+        depth = controller.get_stats()["queue_depth"]
+
+        release.set()
+        await asyncio.gather(*holders, *tasks)
+        return order, depth, controller.get_stats()
+
+    order, depth, stats = asyncio.run(scenario())
+
+    assert depth == 7
+    assert order == ["hot", "cold", "a1", "b1", "a2", "a3", "a-low"]
+    assert stats["admitted"] == 8
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+
+def test_full_queue_sheds_least_urgent():
+    """대기열이 가득 차면 더 급한 요청이 가장 덜 급한 대기 요청을 밀어냄"""
+    async def scenario():
+        controller = AdmissionController(max_concurrent_starts=1, max_queue_size=2)
+        release, holders = await _hold_slots(controller, 1)
+
+        async def request(severity):
+            async with controller.slot(severity):
+                return severity
+
+        low = asyncio.create_task(request("low"))
+        medium = asyncio.create_task(request("medium"))
+        await asyncio.sleep(0)
+        critical = asyncio.create_task(request("critical"))
+        await asyncio.sleep(0)
+
+        rejected_new = None
+        try:
+            await request("low")
+        except AdmissionRejected as e:
+            rejected_new = e
+
+        release.set()
+        results = await asyncio.gather(low, medium, critical, return_exceptions=True)
+        await asyncio.gather(*holders)
+        return results, rejected_new, controller.get_stats()
+
+    (low, medium, critical), rejected_new, stats = asyncio.run(scenario())
+
+    assert isinstance(low, AdmissionRejected)
+    assert (medium, critical) == ("medium", "critical")
+    assert rejected_new is not None
+    assert stats["rejected"] == 2
+
+
+def test_cancelled_waiter_leaves_queue():
+    """대기 중 취소된 요청은 대기열과 슬롯을 남기지 않음"""
+    async def scenario():
+        controller = AdmissionController(max_concurrent_starts=1)
+        release, holders = await _hold_slots(controller, 1)
+
+        async def request():
+            async with controller.slot():
+                pass
+
+        waiter = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        depth = controller.queue_depth()
+
+        release.set()
+        await asyncio.gather(*holders)
+        # 대기열 카운트가 새면 다음 요청이 영원히 대기 → 시간 제한으로 실패 처리
+        await asyncio.wait_for(request(), timeout=2)
+        return depth, controller.get_stats()
+
+    depth, stats = asyncio.run(scenario())
+
+    assert depth == 0
+    assert stats["in_flight"] == 0
+
+
+def test_promote_raises_waiting_priority():
+    """대기 중인 요청에 더 급한 호출자가 합류하면 우선순위 상향"""
+    async def scenario():
+        controller = AdmissionController(max_concurrent_starts=1)
+        release, holders = await _hold_slots(controller, 1)
+        order = []
+
+        async def request(name, severity, key=None):
+            async with controller.slot(severity, key=key):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(request("replica", "background", key="server-docker")),
+            asyncio.create_task(request("other", "high")),
+        ]
+        await asyncio.sleep(0)
+        promoted = controller.promote("server-docker", "critical")
+        release.set()
+        await asyncio.gather(*holders, *tasks)
+        return order, promoted
+
+    order, promoted = asyncio.run(scenario())
+
+    assert promoted
+    assert order == ["replica", "other"]
+
+
+def test_orchestrator_limits_concurrent_starts():
+    """서로 다른 서버 동시 시작도 max_concurrent_starts개씩만 실행"""
+    async def scenario():
+        orchestrator, _ = _make_orchestrator(max_concurrent_starts=2)
+        statuses = await asyncio.gather(*[
+            orchestrator.start_container(f"server-{i}", source=f"team-{i % 2}")
+            for i in range(6)
+        ])
+        return orchestrator, statuses
+
+    orchestrator, statuses = asyncio.run(scenario())
+
+    assert len({s.container_id for s in statuses}) == 6
+    admission = orchestrator.get_stats()["admission"]
+    assert admission["admitted"] == 6
+    # 0.05초짜리 run 6개를 2개씩 → 마지막 요청은 두 번 대기
+    assert admission["wait_max_seconds"] >= 0.08
+
+
+def test_full_pool_evicts_idle_container():
+    """풀이 가득 차면 처리 중 요청이 없는 컨테이너를 퇴출하고 시작"""
+    async def scenario():
+        orchestrator, _ = _make_orchestrator(max_concurrent_containers=2)
+        busy = await orchestrator.acquire("server-busy")
+        await orchestrator.start_container("server-idle")
+        await orchestrator.start_container("server-new")
+        return orchestrator, busy
+
+    orchestrator, busy = asyncio.run(scenario())
+
+    names = sorted(s.mcp_server_name for s in orchestrator.containers.values())
+    assert names == ["server-busy", "server-new"]
+    assert busy.inflight_requests == 1
+
+
+def test_full_pool_without_evictable_container_rejects():
+    """퇴출할 컨테이너가 없으면 빈자리를 기다리다 거절 (최대 수를 넘겨 실행하지 않음)"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator(
+            max_concurrent_containers=1, capacity_wait_seconds=0.1
+        )
+        await orchestrator.acquire("server-busy")
+        try:
+            await orchestrator.start_container("server-other")
+        except AdmissionRejected:
+            rejected = True
+        else:
+            rejected = False
+        return orchestrator, client, rejected
+
+    orchestrator, client, rejected = asyncio.run(scenario())
+
+    assert rejected
+    assert len(orchestrator.containers) == 1
+    assert client.run_calls == 1
+
+
+def test_concurrent_starts_respect_pool_capacity():
+    """함께 승인된 시작 작업도 실행 중인 작업을 용량에 포함해 최대 수를 지킴"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator(
+            max_concurrent_containers=1,
+            max_concurrent_starts=2,
+            capacity_wait_seconds=0.5
+        )
+        peak = 0
+
+        def observe(**kwargs):
+            nonlocal peak
+            peak = max(peak, len(orchestrator.containers) + 1)
+            return client._run(**kwargs)
+
+        client.containers.run.side_effect = observe
+        first = await orchestrator.acquire("server-a")
+
+        async def release_later():
+            await asyncio.sleep(0.1)
+            orchestrator.release(first.container_id)
+
+        results = await asyncio.gather(
+            orchestrator.start_container("server-b"),
+            orchestrator.start_container("server-c"),
+            release_later(),
+            return_exceptions=True
+        )
+        return orchestrator, peak, results
+
+    orchestrator, peak, results = asyncio.run(scenario())
+
+    assert peak == 1
+    assert len(orchestrator.containers) == 1
+    assert sum(isinstance(r, AdmissionRejected) for r in results[:2]) <= 1
+
+
+def test_urgent_caller_promotes_background_replica_start():
+    """백그라운드 레플리카 시작에 합류한 급한 요청은 낮은 우선순위 뒤에서 기다리지 않음"""
+    async def scenario():
+        orchestrator, _ = _make_orchestrator(max_concurrent_starts=1)
+        release, holders = await _hold_slots(orchestrator.admission, 1)
+        orchestrator._spawn_replica("server-docker", LaunchSpec())
+        other = asyncio.create_task(orchestrator.start_container("server-other", severity="high"))
+        await asyncio.sleep(0)
+        urgent = asyncio.create_task(
+            orchestrator.start_container("server-docker", severity="critical")
+        )
+        await asyncio.sleep(0)
+        queued = orchestrator.admission.get_stats()["queued_by_severity"]
+
+        release.set()
+        await asyncio.gather(*holders)
+        first_done, _ = await asyncio.wait({urgent, other}, return_when=asyncio.FIRST_COMPLETED)
+        await asyncio.gather(urgent, other)
+        return queued, first_done, urgent
+
+    queued, first_done, urgent = asyncio.run(scenario())
+
+    assert queued == {"critical": 1, "high": 1}
+    assert first_done == {urgent}
+
+
+if __name__ == "__main__":
+    test_priority_then_fair_across_sources()
+    test_full_queue_sheds_least_urgent()
+    test_cancelled_waiter_leaves_queue()
+    test_promote_raises_waiting_priority()
+    test_orchestrator_limits_concurrent_starts()
+    test_full_pool_evicts_idle_container()
+    test_full_pool_without_evictable_container_rejects()
+    test_concurrent_starts_respect_pool_capacity()
+    test_urgent_caller_promotes_background_replica_start()
+    print("✅ 시작 승인 제어 테스트 통과")
@@ -0,0 +1,359 @@
+"""
+War Room 2.0 - Container Orchestrator 로직 테스트 (Docker 불필요)
+Docker 클라이언트를 간단한 Fake로 대체
+"""
+
+import asyncio
+import itertools
+import time
+from unittest.mock import Mock
+
+import docker
+
+from src.container_orchestrator import ContainerPoolConfig, ContainerPoolOrchestrator
+
+
+class FakeDockerClient:
+    """containers.run이 느린 Docker 클라이언트 흉내"""
+
+    def __init__(self, run_delay: float = 0.05, name: str = "fake"):
+        self.name = name
+        self.run_delay = run_delay
+        self.run_calls = 0
+        self.run_kwargs = []
+        self._ids = itertools.count()
+        self.networks = Mock()
+        self.images = Mock()
+        self.containers = Mock()
+        self.containers.run.side_effect = self._run
+        self.containers.get.side_effect = self._get
+        self.api = Mock()
+        self.memory_mb = {}
+        self.cpu_cores = {}
+        self.updates = []
+        self.stderr_logs = {}
+        self.info = Mock(return_value={"MemTotal": 1000 * 1024 * 1024})
+
+    def _run(self, **kwargs):
+        self.run_calls += 1
+        self.run_kwargs.append(kwargs)
+        time.sleep(self.run_delay)
+        container_id = f"{self.name}-{next(self._ids)}"
+        return Mock(id=container_id, short_id=container_id[:12])
+
+    def _get(self, container_id):
+        usage = self.memory_mb.get(container_id, 0) * 1024 * 1024
+        container = Mock(id=container_id)
+        # CPU: 1초 동안 시스템 전체 1e9ns 중 cpu_cores × 1e9ns 사용 (online_cpus=1)
+        cpu_ns = int(self.cpu_cores.get(container_id, 0) * 1e9)
+        container.stats.return_value = {
+            "memory_stats": {"usage": usage},
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": cpu_ns},
+                "system_cpu_usage": 10 ** 9,
+                "online_cpus": 1,
+            },
+            "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+        }
+        container.update.side_effect = lambda **kwargs: self.updates.append((container_id, kwargs))
+        container.logs.return_value = self.stderr_logs.get(container_id, b"")
+        return container
+
+    def close(self):
+        pass
+
+
+def _make_orchestrator(**config_kwargs):
+    client = FakeDockerClient()
+    # Fake 클라이언트에는 MCP stdio가 없음 (readiness는 test_readiness.py에서 검증)
+    config_kwargs.setdefault("readiness_probe", False)
+    orchestrator = ContainerPoolOrchestrator(
+        ContainerPoolConfig(**config_kwargs),
+        docker_client=client
+    )
+    return orchestrator, client
+
+
+def test_concurrent_starts_are_coalesced():
+    """같은 서버 동시 시작 요청은 하나의 컨테이너로 합쳐짐"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        results = await asyncio.gather(*[
+            orchestrator.start_container("server-docker") for _ in range(5)
+        ])
+        return orchestrator, client, results
+
+    orchestrator, client, results = asyncio.run(scenario())
+
+    assert client.run_calls == 1
+    assert len({status.container_id for status in results}) == 1
+    assert len(orchestrator.containers) == 1
+    assert not orchestrator._inflight_starts
+
+
+def test_failed_start_propagates_to_all_waiters():
+    """시작 실패는 모든 대기자에게 전달되고 다음 시도는 새로 실행"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        client.images.get.side_effect = docker.errors.ImageNotFound("missing")
+
+        results = await asyncio.gather(*[
+            orchestrator.start_container("server-missing") for _ in range(3)
+        ], return_exceptions=True)
+
+        client.images.get.side_effect = None
+        status = await orchestrator.start_container("server-missing")
+        return orchestrator, results, status
+
+    orchestrator, results, status = asyncio.run(scenario())
+
+    assert all(isinstance(r, docker.errors.ImageNotFound) for r in results)
+    assert orchestrator._find_running_container("server-missing") is status
+
+
+def test_cancelled_first_caller_does_not_cancel_waiters():
+    """첫 호출자가 취소돼도 합류한 대기자는 같은 컨테이너를 받음"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        first = asyncio.create_task(orchestrator.start_container("server-docker"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(orchestrator.start_container("server-docker"))
+        await asyncio.sleep(0)
+        first.cancel()
+        status = await second
+        return orchestrator, client, first, status
+
+    orchestrator, client, first, status = asyncio.run(scenario())
+
+    assert first.cancelled()
+    assert client.run_calls == 1
+    assert list(orchestrator.containers) == [status.container_id]
+
+
+def test_caller_cancel_survives_concurrent_start_cancel():
+    """호출자 취소와 시작 작업 취소(풀 종료)가 겹쳐도 호출자는 CancelledError를 받음"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        caller = asyncio.create_task(orchestrator.start_container("server-docker"))
+        await asyncio.sleep(0.01)
+        orchestrator._inflight_starts["server-docker"].cancel()
+        caller.cancel()
+        try:
+            await caller
+        except asyncio.CancelledError:
+            pass
+        await orchestrator.shutdown()
+        return caller
+
+    caller = asyncio.run(scenario())
+
+    assert caller.cancelled()
+
+
+def test_start_cancelled_by_shutdown_raises_runtime_error():
+    """취소되지 않은 호출자는 시작 작업이 취소되면 RuntimeError를 받음"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        caller = asyncio.create_task(orchestrator.start_container("server-docker"))
+        await asyncio.sleep(0.01)
+        orchestrator._inflight_starts["server-docker"].cancel()
+        try:
+            await caller
+            return None
+        except RuntimeError as e:
+            return e
+        finally:
+            await orchestrator.shutdown()
+
+    error = asyncio.run(scenario())
+
+    assert isinstance(error, RuntimeError)
+
+
+def test_abandoned_launch_is_removed_on_shutdown():
+    """종료로 취소된 시작 작업의 컨테이너는 뜨는 즉시 제거 (고아 없음)"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        client.run_delay = 0.2
+        removed = []
+
+        def run(**kwargs):
+            container = FakeDockerClient._run(client, **kwargs)
+            container.remove.side_effect = lambda force=False: removed.append(container.id)
+            return container
+
+        client.containers.run.side_effect = run
+        start = asyncio.create_task(orchestrator.start_container("server-docker"))
+        await asyncio.sleep(0.05)
+        await orchestrator.shutdown()
+        result = await asyncio.gather(start, return_exceptions=True)
+        return orchestrator, removed, result
+
+    orchestrator, removed, (result,) = asyncio.run(scenario())
+
+    assert isinstance(result, RuntimeError)
+    assert removed == ["fake-0"]
+    assert not orchestrator.containers
+    assert orchestrator.fleet.hosts["local"].containers == 0
+
+
+def test_name_index_follows_stop():
+    """컨테이너 종료 시 이름 인덱스도 함께 정리"""
+    async def scenario():
+        orchestrator, _ = _make_orchestrator()
+        status = await orchestrator.start_container("server-redis")
+        assert orchestrator._find_running_container("server-redis") is status
+
+        await orchestrator.stop_container(status.container_id)
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    assert orchestrator._find_running_container("server-redis") is None
+    assert not orchestrator._by_server
+    assert len(orchestrator._expiry) == 0
+
+
+def test_acquire_routes_to_least_loaded_and_scales_out():
+    """처리 중 요청이 임계값을 넘으면 레플리카 추가 후 least-loaded 라우팅"""
+    from src.container_orchestrator import ReplicaPolicy
+
+    async def scenario():
+        orchestrator, client = _make_orchestrator(
+            default_replica_policy=ReplicaPolicy(max_replicas=2, scale_out_queue_depth=2)
+        )
+        first = [await orchestrator.acquire("server-k8s") for _ in range(3)]
+        assert {r.container_id for r in first} == {first[0].container_id}
+
+        # 백그라운드 scale-out 완료 대기
+        await asyncio.gather(*orchestrator._background_tasks)
+        assert orchestrator.replica_count("server-k8s") == 2
+
+        second = await orchestrator.acquire("server-k8s")
+        assert second.container_id != first[0].container_id
+
+        # max_replicas 도달 후에는 더 늘리지 않음
+        rest = [await orchestrator.acquire("server-k8s") for _ in range(6)]
+        assert not orchestrator._background_tasks
+        assert client.run_calls == 2
+
+        for replica in first + [second] + rest:
+            orchestrator.release(replica.container_id)
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    for replica in orchestrator.containers.values():
+        assert replica.inflight_requests == 0
+        assert replica.status == "idle"
+
+
+def test_scale_out_respects_pool_limit():
+    """풀 전체 max_concurrent_containers를 넘는 scale-out은 하지 않음"""
+    from src.container_orchestrator import ReplicaPolicy
+
+    async def scenario():
+        orchestrator, client = _make_orchestrator(
+            max_concurrent_containers=2,
+            default_replica_policy=ReplicaPolicy(max_replicas=5, scale_out_queue_depth=1)
+        )
+        await orchestrator.acquire("server-a")
+        await orchestrator.acquire("server-b")
+        for _ in range(3):
+            await orchestrator.acquire("server-a")
+        return client
+
+    assert asyncio.run(scenario()).run_calls == 2
+
+
+def test_reconcile_adopts_labeled_containers():
+    """재시작 후 라벨이 붙은 실행 중 컨테이너를 목록 조회 1회로 재연결"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        status = await orchestrator.start_container("server-docker", tier="tier1_hot")
+        labels = client.run_kwargs[0]["labels"]
+
+        # 매니저 재시작: 새 오케스트레이터가 같은 Docker 데몬을 봄
+        restarted = ContainerPoolOrchestrator(ContainerPoolConfig(), docker_client=client)
+        client.api.containers.return_value = [
+            {"Id": status.container_id, "Labels": labels},
+            {"Id": "unlabeled", "Labels": {}},
+        ]
+        adopted = await restarted.reconcile()
+        reused = await restarted.start_container("server-docker")
+        return client, labels, adopted, reused
+
+    client, labels, adopted, reused = asyncio.run(scenario())
+
+    assert labels[ContainerPoolOrchestrator.SERVER_LABEL] == "server-docker"
+    assert labels[ContainerPoolOrchestrator.TIER_LABEL] == "tier1_hot"
+    assert client.api.containers.call_count == 1
+    assert [s.mcp_server_name for s in adopted] == ["server-docker"]
+    assert adopted[0].tier == "tier1_hot"
+    assert reused is adopted[0]
+    assert client.run_calls == 1
+
+
+def test_memory_pressure_evicts_until_below_target():
+    """메모리 압박 시 처리 중이 아닌 컨테이너를 목표치 아래까지 퇴출"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator(max_memory_percent=80.0)
+        busy = await orchestrator.acquire("server-busy")
+        idle = [await orchestrator.start_container(f"server-{i}") for i in range(4)]
+
+        client.memory_mb[busy.container_id] = 300
+        for status in idle:
+            client.memory_mb[status.container_id] = 150
+
+        # 900MB / 1000MB 사용 → 목표 700MB 이하까지 확보
+        await orchestrator._check_memory_pressure()
+        return orchestrator, busy
+
+    orchestrator, busy = asyncio.run(scenario())
+
+    assert busy.container_id in orchestrator.containers
+    assert sum(s.memory_usage_mb for s in orchestrator.containers.values()) <= 700
+    assert len(orchestrator.containers) == 3
+
+
+def test_npm_cache_volume_and_hit_rate():
+    """공용 npm 캐시 볼륨 마운트 및 fetch 로그 기반 적중률 집계"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator()
+        first = await orchestrator.start_container("server-a")
+        second = await orchestrator.start_container("server-b")
+
+        client.stderr_logs[first.container_id] = (
+            b"npm http fetch GET 200 https://registry.npmjs.org/server-a 812ms (cache miss)\n"
+        )
+        client.stderr_logs[second.container_id] = (
+            b"npm http fetch GET 200 https://registry.npmjs.org/server-a 3ms (cache hit)\n"
+            b"npm http fetch GET 200 https://registry.npmjs.org/zod 2ms (cache hit)\n"
+            b"npm http fetch GET 304 https://registry.npmjs.org/ajv 95ms (cache revalidated)\n"
+        )
+        await orchestrator.stop_container(first.container_id)
+        await orchestrator.list_containers()
+        return client, orchestrator.get_stats()["npm_cache"]
+
+    client, npm_cache = asyncio.run(scenario())
+
+    run_kwargs = client.run_kwargs[0]
+    assert run_kwargs["volumes"] == {"war-room-npm-cache": {"bind": "/root/.npm", "mode": "rw"}}
+    assert run_kwargs["environment"]["NPM_CONFIG_CACHE"] == "/root/.npm"
+    assert npm_cache == {"hits": 2, "misses": 1, "revalidated": 1, "hit_rate": 0.5}
+
+
+if __name__ == "__main__":
+    test_concurrent_starts_are_coalesced()
+    test_failed_start_propagates_to_all_waiters()
+    test_cancelled_first_caller_does_not_cancel_waiters()
+    test_caller_cancel_survives_concurrent_start_cancel()
+    test_start_cancelled_by_shutdown_raises_runtime_error()
+    test_abandoned_launch_is_removed_on_shutdown()
+    test_name_index_follows_stop()
+    test_acquire_routes_to_least_loaded_and_scales_out()
+    test_scale_out_respects_pool_limit()
+    test_reconcile_adopts_labeled_containers()
+    test_memory_pressure_evicts_until_below_target()
+    test_npm_cache_volume_and_hit_rate()
+    print("✅ Container Orchestrator 로직 테스트 통과")
@@ -0,0 +1,146 @@
+"""
+War Room 2.0 - 멀티 호스트 Docker 풀 테스트 (Docker 불필요)
+호스트마다 Fake Docker 클라이언트(엔드포인트)를 하나씩 사용
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import docker
+import requests
+
+from test_container_orchestrator import FakeDockerClient
+
+from src.container_orchestrator import (
+    ContainerPoolConfig,
+    ContainerPoolOrchestrator,
+    ReplicaPolicy,
+)
+from src.docker_fleet import DockerFleet, parse_memory_mb
+
+MB = 1024 * 1024
+
+
+def _make_fleet(mem_total_mb, **config_kwargs):
+    clients = {}
+    for name, mem in mem_total_mb.items():
+        client = FakeDockerClient(run_delay=0.01, name=name)
+        client.info = Mock(return_value={"MemTotal": mem * MB, "NCPU": 4})
+        clients[name] = client
+
+    config_kwargs.setdefault("readiness_probe", False)
+    config_kwargs.setdefault("auto_build_images", False)
+    orchestrator = ContainerPoolOrchestrator(
+        ContainerPoolConfig(**config_kwargs),
+        fleet=DockerFleet(clients)
+    )
+    return orchestrator, clients
+
+
+def test_parse_memory_mb():
+    assert parse_memory_mb("200m") == 200
+    assert parse_memory_mb("1g") == 1024
+    assert parse_memory_mb("512MB") == 512
+
+
+def test_replicas_spread_across_hosts():
+    """같은 서버 레플리카는 서로 다른 호스트에 배치"""
+    async def scenario():
+        orchestrator, clients = _make_fleet(
+            {"a": 4000, "b": 4000, "c": 4000},
+            default_replica_policy=ReplicaPolicy(min_replicas=3, max_replicas=3)
+        )
+        await orchestrator.start_container("server-docker")
+        while orchestrator._background_tasks:
+            await asyncio.gather(*list(orchestrator._background_tasks))
+        return orchestrator, clients
+
+    orchestrator, clients = asyncio.run(scenario())
+
+    hosts = sorted(s.host for s in orchestrator.containers.values())
+    assert hosts == ["a", "b", "c"]
+    assert all(client.run_calls == 1 for client in clients.values())
+    assert all(kwargs["mem_limit"] == "200m" for c in clients.values() for kwargs in c.run_kwargs)
+
+
+def test_placement_prefers_free_memory_and_skips_down_hosts():
+    """여유 메모리가 큰 호스트 우선, 응답 없는 호스트는 제외"""
+    async def scenario():
+        orchestrator, clients = _make_fleet({"small": 1000, "large": 8000, "down": 16000})
+        clients["down"].info.side_effect = docker.errors.APIError("connection refused")
+        first = await orchestrator.start_container("server-a")
+        second = await orchestrator.start_container("server-b")
+        return orchestrator, first, second
+
+    orchestrator, first, second = asyncio.run(scenario())
+
+    assert first.host == "large" and second.host == "large"
+    hosts = orchestrator.get_stats()["hosts"]
+    assert hosts["down"]["healthy"] is False
+    assert hosts["large"]["containers"] == 2
+    assert hosts["large"]["free_memory_mb"] == 8000 - 400
+
+
+def test_image_is_copied_from_primary_host():
+    """기본 호스트에만 있는 이미지는 배치된 호스트로 복사"""
+    async def scenario():
+        orchestrator, clients = _make_fleet({"primary": 1000, "remote": 8000})
+        clients["remote"].images.get.side_effect = docker.errors.ImageNotFound("없음")
+        clients["primary"].api.get_image.return_value = iter([b"tar"])
+        status = await orchestrator.start_container("server-docker")
+        return status, clients
+
+    status, clients = asyncio.run(scenario())
+
+    assert status.host == "remote"
+    clients["primary"].api.get_image.assert_called_once_with("mcp/server-docker:latest")
+    clients["remote"].api.load_image.assert_called_once()
+
+
+def test_memory_pressure_is_per_host():
+    """압박이 있는 호스트의 컨테이너만 퇴출하고 예약 자원 반환"""
+    async def scenario():
+        orchestrator, clients = _make_fleet({"a": 1000, "b": 1000})
+        statuses = [await orchestrator.start_container(f"server-{i}") for i in range(4)]
+        for status in statuses:
+            usage = 450 if status.host == "a" else 100
+            clients[status.host].memory_mb[status.container_id] = usage
+        await orchestrator._check_memory_pressure()
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    remaining = [s.host for s in orchestrator.containers.values()]
+    assert remaining.count("b") == 2
+    assert remaining.count("a") == 1
+    assert orchestrator.fleet.hosts["a"].containers == 1
+
+
+def test_failed_run_releases_placement():
+    """Docker 예외가 아닌 오류(연결 끊김 등)로 시작이 실패해도 호스트 예약 반환"""
+    async def scenario():
+        orchestrator, clients = _make_fleet({"a": 1000})
+        clients["a"].containers.run.side_effect = requests.exceptions.ConnectionError("reset")
+        for _ in range(3):
+            try:
+                await orchestrator.start_container("server-a")
+                assert False, "시작이 실패해야 함"
+            except requests.exceptions.ConnectionError:
+                pass
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    host = orchestrator.fleet.hosts["a"]
+    assert host.containers == 0 and host.reserved_memory_mb == 0 and host.reserved_cpus == 0
+    assert not orchestrator.containers
+
+
+if __name__ == "__main__":
+    test_parse_memory_mb()
+    test_replicas_spread_across_hosts()
+    test_placement_prefers_free_memory_and_skips_down_hosts()
+    test_image_is_copied_from_primary_host()
+    test_memory_pressure_is_per_host()
+    test_failed_run_releases_placement()
+    print("✅ 멀티 호스트 테스트 통과")
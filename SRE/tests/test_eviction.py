@@ -0,0 +1,149 @@
+"""
+War Room 2.0 - 퇴출 정책 및 트레이스 시뮬레이터 테스트 (Docker 불필요)
+"""
+
+from datetime import datetime, timedelta
+
+from src.eviction import (
+    EvictionCandidate,
+    GreedyDualSizePolicy,
+    LRUKPolicy,
+    LRUPolicy,
+    TraceEvent,
+    compare_policies,
+    load_trace,
+    make_policy,
+    save_trace,
+    simulate,
+)
+
+
+def _candidate(key, memory_mb=100, cost=5.0, tier="tier3_cold", minutes_ago=0):
+    return EvictionCandidate(
+        key=key,
+        server_name=key,
+        memory_mb=memory_mb,
+        restart_cost_seconds=cost,
+        tier=tier,
+        last_used_at=datetime.now() - timedelta(minutes=minutes_ago)
+    )
+
+
+def test_lru_evicts_oldest_until_enough_freed():
+    """LRU: 오래된 순으로 필요한 만큼만 퇴출"""
+    candidates = [
+        _candidate("new", minutes_ago=1),
+        _candidate("old", minutes_ago=30),
+        _candidate("mid", minutes_ago=10),
+    ]
+    victims = LRUPolicy().select_victims(candidates, memory_to_free_mb=150)
+    assert [v.key for v in victims] == ["old", "mid"]
+
+
+def test_greedy_dual_size_keeps_expensive_servers():
+    """GDS: 재시작 비용이 큰 Hot 서버보다 싸고 큰 Cold 서버를 먼저 퇴출"""
+    policy = GreedyDualSizePolicy()
+    expensive = _candidate("slow-hot", memory_mb=100, cost=60.0, tier="tier1_hot", minutes_ago=30)
+    cheap = _candidate("cheap-cold", memory_mb=300, cost=2.0, minutes_ago=1)
+    for c in (expensive, cheap):
+        policy.on_access(c)
+
+    victims = policy.select_victims([expensive, cheap], memory_to_free_mb=50)
+    assert [v.key for v in victims] == ["cheap-cold"]
+
+
+def test_lru_k_prefers_one_shot_servers():
+    """LRU-K: 한 번만 쓰인 서버를 반복 사용 서버보다 먼저 퇴출"""
+    policy = LRUKPolicy(k=2)
+    frequent = _candidate("frequent", minutes_ago=20)
+    policy.on_access(frequent)
+    policy.on_access(_candidate("frequent", minutes_ago=15))
+    one_shot = _candidate("one-shot", minutes_ago=0)
+    policy.on_access(one_shot)
+
+    victims = policy.select_victims([frequent, one_shot], memory_to_free_mb=50)
+    assert [v.key for v in victims] == ["one-shot"]
+
+
+def test_simulation_replays_trace(tmp_path):
+    """트레이스 재생으로 정책별 적중률/재시작 비용 비교"""
+    start = datetime(2025, 12, 1, 9, 0)
+    trace = []
+    for i in range(200):
+        # 무겁고 느린 서버는 드물게, 가볍고 빠른 서버들은 번갈아 사용
+        if i % 10 == 0:
+            trace.append(TraceEvent(start + timedelta(minutes=i), "slow", 150, 60.0, "tier2_warm"))
+        trace.append(TraceEvent(
+            start + timedelta(minutes=i, seconds=30), f"fast-{i % 4}", 100, 2.0, "tier3_cold"
+        ))
+
+    path = tmp_path / "trace.jsonl"
+    save_trace(trace, str(path))
+    loaded = load_trace(str(path))
+    assert loaded == trace
+
+    results = {r.policy: r for r in compare_policies(loaded, capacity_mb=400)}
+    assert set(results) == {"lru", "lru_k", "greedy_dual_size"}
+    for r in results.values():
+        assert r.hits + r.misses == len(trace)
+        assert r.peak_memory_mb <= 400 + 150
+
+    # 비용 인지 정책은 느린 서버를 유지해 재시작 비용이 LRU보다 작아야 함
+    assert results["greedy_dual_size"].restart_seconds < results["lru"].restart_seconds
+
+
+def test_simulate_compares_hit_cost_on_fixed_trace():
+    """고정 트레이스에서 정책별 적중/재시작 비용: GDS는 느린 서버를 유지해 비용 최소"""
+    start = datetime(2025, 12, 1, 9, 0)
+    servers = {
+        "slow": (100, 60.0, "tier1_hot"),
+        "a": (100, 2.0, "tier3_cold"),
+        "b": (100, 2.0, "tier3_cold"),
+        "c": (100, 2.0, "tier3_cold"),
+    }
+    sequence = "slow a b c a b slow c a b c slow".split()
+    trace = [
+        TraceEvent(start + timedelta(minutes=i), name, *servers[name])
+        for i, name in enumerate(sequence)
+    ]
+
+    results = {
+        name: simulate(trace, make_policy(name), capacity_mb=300)
+        for name in ("lru", "lru_k", "greedy_dual_size")
+    }
+
+    # LRU: 느린 서버를 세 번 모두 다시 띄움 (3 × 60초 + 6 × 2초)
+    assert (results["lru"].hits, results["lru"].misses) == (3, 9)
+    assert results["lru"].restart_seconds == 192.0
+    # LRU-K: 반복 사용 서버를 더 오래 유지해 적중은 가장 많지만 느린 서버는 여전히 재시작
+    assert (results["lru_k"].hits, results["lru_k"].misses) == (5, 7)
+    assert results["lru_k"].restart_seconds == 188.0
+    # GDS: 적중 수는 가장 적어도 느린 서버는 처음 한 번만 시작 (60초 + 9 × 2초)
+    assert (results["greedy_dual_size"].hits, results["greedy_dual_size"].misses) == (2, 10)
+    assert results["greedy_dual_size"].restart_seconds == 78.0
+    for result in results.values():
+        assert result.peak_memory_mb <= 300
+        assert result.evictions == result.misses - 3  # 처음 3개는 용량 안에 들어감
+
+def test_make_policy_rejects_unknown_name():
+    """지원하지 않는 정책 이름은 ValueError"""
+    assert make_policy("lru").name == "lru"
+    try:
+        make_policy("random")
+    except ValueError:
+        return
+    raise AssertionError("ValueError가 발생해야 함")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_lru_evicts_oldest_until_enough_freed()
+    test_greedy_dual_size_keeps_expensive_servers()
+    test_lru_k_prefers_one_shot_servers()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_simulation_replays_trace(Path(tmp))
+    test_simulate_compares_hit_cost_on_fixed_trace()
+    test_make_policy_rejects_unknown_name()
+    print("✅ 퇴출 정책 테스트 통과")
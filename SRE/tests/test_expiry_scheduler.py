@@ -0,0 +1,97 @@
+"""
+War Room 2.0 - 만료 스케줄러 테스트 (Docker 불필요)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from src.expiry_scheduler import ExpiryScheduler
+
+
+def _make_scheduler(deadlines, expired):
+    async def on_expire(key):
+        expired.append(key)
+
+    return ExpiryScheduler(
+        resolve_deadline=lambda key: deadlines.get(key),
+        on_expire=on_expire
+    )
+
+
+def test_pop_due_in_deadline_order():
+    """데드라인이 지난 키만 순서대로 반환"""
+    now = datetime.now()
+    deadlines = {
+        "a": now - timedelta(seconds=5),
+        "b": now - timedelta(seconds=10),
+        "c": now + timedelta(minutes=5),
+    }
+    scheduler = _make_scheduler(deadlines, [])
+    for key, deadline in deadlines.items():
+        scheduler.schedule(key, deadline)
+
+    assert scheduler.pop_due(now) == ["b", "a"]
+    assert scheduler.next_deadline() == deadlines["c"]
+    assert len(scheduler) == 1
+
+
+def test_extended_deadline_is_rescheduled():
+    """update_last_used로 연장된 데드라인은 pop 시점에 재등록"""
+    now = datetime.now()
+    deadlines = {"a": now - timedelta(seconds=1)}
+    scheduler = _make_scheduler(deadlines, [])
+    scheduler.schedule("a", deadlines["a"])
+
+    # 스케줄러에 알리지 않고 데드라인 연장 (lazy 처리 대상)
+    deadlines["a"] = now + timedelta(minutes=30)
+
+    assert scheduler.pop_due(now) == []
+    assert scheduler.next_deadline() == deadlines["a"]
+
+
+def test_cancel_and_compaction():
+    """취소된 엔트리는 반환되지 않고 힙은 재구성됨"""
+    now = datetime.now()
+    deadlines = {f"c{i}": now - timedelta(seconds=i) for i in range(1000)}
+    scheduler = _make_scheduler(deadlines, [])
+    for key, deadline in deadlines.items():
+        scheduler.schedule(key, deadline)
+
+    for i in range(900):
+        scheduler.cancel(f"c{i}")
+
+    assert len(scheduler) == 100
+    assert len(scheduler._heap) <= 2 * 100 + 1
+    assert sorted(scheduler.pop_due(now)) == sorted(f"c{i}" for i in range(900, 1000))
+
+
+def test_run_wakes_exactly_at_deadline():
+    """루프가 폴링 없이 데드라인 시점에 만료 처리"""
+    async def scenario():
+        expired = []
+        deadlines = {}
+        scheduler = _make_scheduler(deadlines, expired)
+        task = asyncio.create_task(scheduler.run())
+
+        # 루프가 대기 상태로 들어간 뒤 새 데드라인 등록 → 즉시 깨어나야 함
+        await asyncio.sleep(0.01)
+        deadlines["x"] = datetime.now() + timedelta(milliseconds=50)
+        scheduler.schedule("x", deadlines["x"])
+
+        await asyncio.sleep(0.2)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return expired
+
+    assert asyncio.run(scenario()) == ["x"]
+
+
+if __name__ == "__main__":
+    test_pop_due_in_deadline_order()
+    test_extended_deadline_is_rescheduled()
+    test_cancel_and_compaction()
+    test_run_wakes_exactly_at_deadline()
+    print("✅ 만료 스케줄러 테스트 통과")
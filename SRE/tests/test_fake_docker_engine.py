@@ -0,0 +1,139 @@
+"""
+War Room 2.0 - 가짜 Docker Engine / 풀 벤치마크 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import time
+
+import docker
+
+from benchmark_pool import (
+    SAMPLE_LOGS,
+    FakeCatalog,
+    build_war_room,
+    run_benchmark,
+    synthetic_trace,
+)
+from fake_docker_engine import EngineProfile, FakeDockerEngine
+
+from src.container_orchestrator import ContainerPoolConfig
+
+
+def test_docker_sdk_round_trip():
+    """docker SDK로 생성/조회/종료/제거가 실제 엔진처럼 동작"""
+    engine = FakeDockerEngine(EngineProfile(stop_seconds=0.2, memory_mb=80))
+    try:
+        engine.add_image("mcp/server-docker:latest")
+        client = docker.DockerClient(base_url=engine.base_url)
+
+        container = client.containers.run(
+            "mcp/server-docker:latest",
+            name="round-trip",
+            detach=True,
+            labels={"war-room.pool": "test"},
+            mem_limit="256m"
+        )
+        running = client.api.containers(filters={"label": "war-room.pool=test", "status": "running"})
+        assert [c["Id"] for c in running] == [container.id]
+
+        stats = client.containers.get(container.id).stats(stream=False)
+        assert stats["memory_stats"]["usage"] == 80 * 1024 * 1024
+
+        # SIGTERM 후 stop_seconds 뒤에 종료
+        container.kill(signal="SIGTERM")
+        started = time.monotonic()
+        container.wait(timeout=2)
+        assert 0.1 < time.monotonic() - started < 1.0
+
+        container.remove()
+        assert engine.containers == {}
+        assert engine.calls["create"] == 1 and engine.peak_running == 1
+
+        print("✅ docker SDK 왕복 테스트 통과")
+    finally:
+        engine.close()
+
+
+def test_failure_injection_and_missing_image():
+    """주입된 시작 실패와 없는 이미지가 docker 예외로 전달됨"""
+    engine = FakeDockerEngine(EngineProfile(failure_rates={"start": 1.0}))
+    try:
+        engine.add_image("mcp/server-redis:latest")
+        client = docker.DockerClient(base_url=engine.base_url)
+
+        try:
+            client.containers.run("mcp/server-redis:latest", detach=True)
+            assert False, "시작 실패가 주입되어야 함"
+        except docker.errors.APIError as e:
+            assert e.status_code == 500
+
+        try:
+            client.containers.run("mcp/server-unknown:latest", detach=True)
+            assert False, "없는 이미지는 실패해야 함"
+        except docker.errors.ImageNotFound:
+            pass
+
+        print("✅ 실패 주입 테스트 통과")
+    finally:
+        engine.close()
+
+
+def test_benchmark_replays_trace():
+    """합성 트레이스 재생: 전부 성공하고 같은 서버는 풀에서 재사용"""
+    trace = synthetic_trace(count=30, rate_per_second=50, seed=1)
+    report = asyncio.run(run_benchmark(
+        trace,
+        EngineProfile(start_seconds=0.01, ready_seconds=0.1),
+        ContainerPoolConfig(max_concurrent_containers=10)
+    ))
+
+    result = report.to_dict()
+    assert result["succeeded"] == 30 and result["failed"] == 0
+    # 서버 종류(최대 6개)만큼만 생성되고 나머지는 적중
+    assert result["containers_created"] <= 6
+    assert result["pool_hit_rate"] >= 0.8
+    assert result["latency_p99_seconds"] >= result["latency_p50_seconds"]
+    assert result["engine_calls"]["remove"] == result["containers_created"]
+    assert {"queue", "analyze", "catalog", "start", "ready"} <= set(result["stages"])
+
+    print(f"✅ 벤치마크 재생 테스트 통과: {result}")
+
+
+def test_start_cost_is_measured_per_phase(tmp_path):
+    """오케스트레이터가 실행/MCP 준비 단계를 나눠 측정해 티어 관리자에 기록"""
+    engine = FakeDockerEngine(EngineProfile(create_seconds=0.05, start_seconds=0.1, ready_seconds=0.4))
+
+    async def scenario():
+        war_room = build_war_room(engine, str(tmp_path))
+        try:
+            result = await war_room.handle_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+            assert result["success"]
+            return war_room.tier_manager.servers[FakeCatalog.server_name("redis")]
+        finally:
+            await war_room.shutdown()
+
+    try:
+        server = asyncio.run(scenario())
+    finally:
+        engine.close()
+
+    cost = server.start_cost
+    assert cost.samples == 1 and cost.image_seconds is None  # 이미지는 미리 로드됨
+    assert 0.15 <= cost.run_seconds < 1.0
+    assert 0.3 <= cost.ready_seconds < 1.5
+    assert server.expected_start_time == round(cost.run_seconds + cost.ready_seconds, 1)
+
+    print("✅ 단계별 시작 비용 측정 테스트 통과")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    print("🧪 가짜 Docker Engine / 벤치마크 테스트 시작\n")
+    test_docker_sdk_round_trip()
+    test_failure_injection_and_missing_image()
+    test_benchmark_replays_trace()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_start_cost_is_measured_per_phase(Path(tmp))
+    print("\n✅ 모든 테스트 통과!")
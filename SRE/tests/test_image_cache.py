@@ -0,0 +1,128 @@
+"""
+War Room 2.0 - 이미지 캐시 예산 관리 테스트 (Docker 불필요)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import docker
+
+from src.image_cache import ImageCacheManager
+from src.tier_manager import ServerTier, TierManager
+
+MB = 1024 * 1024
+
+
+def _image_name(server_name):
+    return f"mcp/{server_name}:latest"
+
+
+def _image(tag, size_mb):
+    return Mock(tags=[tag], attrs={"Size": size_mb * MB})
+
+
+def _make_manager(tmp_path, docker_images=(), **kwargs):
+    tier_manager = TierManager(str(tmp_path / "tier-config.json"))
+    client = Mock()
+    client.images.list.return_value = list(docker_images)
+    manager = ImageCacheManager(client, tier_manager, _image_name, **kwargs)
+    return manager, tier_manager, client
+
+
+def _register(tier_manager, name, tier, days_ago=0, size_mb=0):
+    tier_manager.register_server(name, f"@mcp/{name}", "1.0.0", tier)
+    server = tier_manager.servers[name]
+    server.last_used_at = datetime.now() - timedelta(days=days_ago)
+    if size_mb:
+        tier_manager.mark_image_cached(name, _image_name(name), size_mb)
+    return server
+
+
+def test_reconcile_matches_docker_images(tmp_path):
+    """Docker에 있는 이미지는 캐시로, 외부에서 삭제된 이미지는 해제로 기록"""
+    manager, tier_manager, _ = _make_manager(
+        tmp_path, docker_images=[_image("mcp/present:latest", 120)]
+    )
+    _register(tier_manager, "present", ServerTier.TIER_2_WARM)
+    _register(tier_manager, "deleted", ServerTier.TIER_1_HOT, size_mb=300)
+
+    report = asyncio.run(manager.reconcile())
+
+    assert report.added == ["present"]
+    assert report.removed == ["deleted"]
+    summary = tier_manager.get_cache_summary()
+    assert summary["cached_count"] == 1
+    assert summary["total_size_mb"] == 120
+
+
+def test_enforce_budget_prunes_old_and_large_cold_images(tmp_path):
+    """예산 초과 시 Cold 티어에서 오래되고 큰 이미지부터 정리, Hot은 유지"""
+    manager, tier_manager, client = _make_manager(tmp_path, budget_mb=500)
+    _register(tier_manager, "hot", ServerTier.TIER_1_HOT, days_ago=30, size_mb=300)
+    _register(tier_manager, "cold-recent", ServerTier.TIER_3_COLD, days_ago=1, size_mb=200)
+    _register(tier_manager, "cold-old-small", ServerTier.TIER_3_COLD, days_ago=20, size_mb=50)
+    _register(tier_manager, "cold-old-large", ServerTier.TIER_3_COLD, days_ago=20, size_mb=150)
+
+    pruned = asyncio.run(manager.enforce_budget())
+
+    # 합계 700MB → 오래된 Cold 2개(200MB) 정리로 예산 충족
+    assert pruned == ["cold-old-large", "cold-old-small"]
+    assert [c.args[0] for c in client.images.remove.call_args_list] == [
+        "mcp/cold-old-large:latest", "mcp/cold-old-small:latest"
+    ]
+    assert tier_manager.servers["hot"].image_cached
+    assert tier_manager.get_cache_summary()["total_size_mb"] == 500
+
+
+def test_enforce_budget_skips_images_in_use(tmp_path):
+    """실행 중인 컨테이너가 쓰는 이미지는 정리하지 않음"""
+    manager, tier_manager, client = _make_manager(tmp_path, budget_mb=100)
+    _register(tier_manager, "busy", ServerTier.TIER_3_COLD, days_ago=10, size_mb=200)
+    _register(tier_manager, "free", ServerTier.TIER_3_COLD, days_ago=5, size_mb=200)
+
+    def remove(image_name):
+        if image_name == "mcp/busy:latest":
+            raise docker.errors.APIError("conflict: image is being used")
+
+    client.images.remove.side_effect = remove
+
+    pruned = asyncio.run(manager.enforce_budget())
+
+    assert pruned == ["free"]
+    assert tier_manager.servers["busy"].image_cached
+
+
+def test_prewarm_pulls_hot_and_warm_in_parallel(tmp_path):
+    """Tier 1/2 미캐시 이미지를 병렬로 pull, Cold는 건너뜀"""
+    manager, tier_manager, client = _make_manager(
+        tmp_path, max_parallel_pulls=2, pull_from_registry=True
+    )
+    _register(tier_manager, "hot", ServerTier.TIER_1_HOT)
+    _register(tier_manager, "warm", ServerTier.TIER_2_WARM)
+    _register(tier_manager, "cold", ServerTier.TIER_3_COLD)
+    client.images.pull.return_value = _image("ignored", 80)
+
+    prepared = asyncio.run(manager.prewarm())
+
+    assert sorted(prepared) == ["hot", "warm"]
+    assert sorted(c.args[0] for c in client.images.pull.call_args_list) == [
+        "mcp/hot:latest", "mcp/warm:latest"
+    ]
+    assert tier_manager.servers["hot"].image_size_mb == 80
+    assert not tier_manager.servers["cold"].image_cached
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    for test in (
+        test_reconcile_matches_docker_images,
+        test_enforce_budget_prunes_old_and_large_cold_images,
+        test_enforce_budget_skips_images_in_use,
+        test_prewarm_pulls_hot_and_warm_in_parallel,
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ 이미지 캐시 테스트 통과")
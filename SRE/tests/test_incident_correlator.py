@@ -0,0 +1,155 @@
+"""
+War Room 2.0 - 장애 상관 분석 테스트 (Docker 불필요)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from benchmark_pool import SAMPLE_LOGS, build_war_room
+from fake_docker_engine import EngineProfile, FakeDockerEngine
+
+from src.incident_correlator import IncidentCorrelator, normalize_tokens
+
+
+def test_correlates_duplicates_and_near_duplicates():
+    """호스트/시각/ID만 다른 로그와 한두 단어 다른 로그는 같은 장애, 창이 지나면 새 장애"""
+    correlator = IncidentCorrelator(window_seconds=600)
+    now = datetime(2026, 10, 19, 9, 0)
+    base = (
+        "2026-10-19T09:00:01Z ERROR worker-{host} request {rid} failed: "
+        "connect ECONNREFUSED 10.0.{host}.5:6379 redis connection pool exhausted "
+        "after 3 retries, giving up on cache write for session store"
+    )
+
+    assert normalize_tokens(base.format(host=1, rid="a3f9c0d2-1b2c-4d5e-8f90-123456789abc")) == \
+        normalize_tokens(base.format(host=7, rid="0b1c2d3e-4f50-6172-8394-a5b6c7d8e9f0"))
+
+    first, is_new = correlator.correlate(base.format(host=1, rid="r1"), source="host-1", now=now)
+    assert is_new
+    for host in range(2, 40):
+        incident, is_new = correlator.correlate(
+            base.format(host=host, rid=f"r{host}"),
+            source=f"host-{host}",
+            now=now + timedelta(seconds=host)
+        )
+        assert not is_new and incident is first
+
+    # 문구가 조금 다른 로그 (MinHash/LSH 유사 매칭)
+    near = base.replace("giving up on", "abandoning")
+    incident, is_new = correlator.correlate(near.format(host=2, rid="r2"), now=now + timedelta(seconds=60))
+    assert not is_new and incident is first
+
+    other, is_new = correlator.correlate(
+        "botocore: AccessDenied when calling s3 PutObject on bucket logs", now=now
+    )
+    assert is_new and other is not first
+
+    assert first.occurrences == 40 and len(first.sources) == 40
+    stats = correlator.get_stats()
+    assert stats["active_incidents"] == 2 and stats["deduplicated"] == 39
+    assert stats["top_incidents"][0]["incident_id"] == first.incident_id
+
+    # 마지막 발생(60초) + 창(600초)이 지나면 새 장애
+    _, is_new = correlator.correlate(base.format(host=1, rid="r1"), now=now + timedelta(seconds=661))
+    assert is_new
+
+    # 처리 실패로 종료한 장애는 다음 발생이 다시 처리됨
+    correlator.close(other.incident_id)
+    _, is_new = correlator.correlate("botocore: AccessDenied when calling s3 PutObject on bucket logs")
+    assert is_new
+
+    print("✅ 장애 상관 분석 테스트 통과")
+
+
+def test_incident_storm_runs_pipeline_once(tmp_path):
+    """여러 호스트에서 같은 장애가 동시에 들어와도 분석/검색/컨테이너 시작은 1회"""
+    engine = FakeDockerEngine(EngineProfile(ready_seconds=0.2))
+    searches = []
+
+    async def scenario():
+        war_room = build_war_room(engine, str(tmp_path))
+        war_room.correlator = IncidentCorrelator()
+        search = war_room.catalog.search_servers
+        war_room.catalog.search_servers = lambda *args: searches.append(args) or search(*args)
+        try:
+            logs = [
+                SAMPLE_LOGS["redis"].replace("127.0.0.1", f"10.0.0.{i}") for i in range(30)
+            ]
+            results = await asyncio.gather(*[
+                war_room.handle_incident(log, auto_approve=True, source=f"host-{i}")
+                for i, log in enumerate(logs)
+            ])
+            later = await war_room.handle_incident(logs[0], auto_approve=True)
+            return results, later, len(engine.containers)
+        finally:
+            await war_room.shutdown()
+
+    try:
+        results, later, containers = asyncio.run(scenario())
+    finally:
+        engine.close()
+
+    first = [r for r in results if not r.get("deduplicated")]
+    assert len(first) == 1 and first[0]["success"]
+    assert len(searches) == 1 and containers == 1
+    assert all(r["incident_id"] == first[0]["incident_id"] for r in results)
+    # 첫 발생 처리 중에 들어온 발생도 첫 발생의 실제 결과를 기다려서 공유
+    assert all(r["success"] and r["container_id"] == first[0]["container_id"] for r in results)
+    assert later["deduplicated"] and later["success"]
+    assert later["container_id"] == first[0]["container_id"]
+    assert later["occurrences"] == 31
+
+    print("✅ 장애 폭주 시 1회 처리 테스트 통과")
+
+
+def test_duplicates_share_failed_first_outcome(tmp_path):
+    """첫 발생이 실패하면 처리 중에 묶인 발생도 실패로 끝나고, 다음 발생은 다시 처리"""
+    engine = FakeDockerEngine(EngineProfile())
+
+    async def scenario():
+        war_room = build_war_room(engine, str(tmp_path))
+        war_room.correlator = IncidentCorrelator()
+        war_room.incidents.start()
+        attempts = []
+
+        async def failing_start(**kwargs):
+            attempts.append(kwargs["mcp_server_name"])
+            await asyncio.sleep(0.1)
+            raise RuntimeError("image pull failed")
+
+        war_room.orchestrator.start_container = failing_start
+        try:
+            futures = [
+                await war_room.submit_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+                for _ in range(5)
+            ]
+            results = await asyncio.gather(*futures)
+            retry = await war_room.handle_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+            return results, retry, attempts, war_room.incidents.get_stats()
+        finally:
+            await war_room.shutdown()
+
+    try:
+        results, retry, attempts, stats = asyncio.run(scenario())
+    finally:
+        engine.close()
+
+    assert not any(r["success"] for r in results)
+    assert sum(1 for r in results if r.get("deduplicated")) == 4
+    assert stats["succeeded"] == 0 and stats["failed"] == 5
+    # 실패한 장애는 종료되어 다음 발생이 다시 시작을 시도
+    assert not retry.get("deduplicated") and len(attempts) == 2
+
+    print("✅ 첫 발생 실패 공유 테스트 통과")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_correlates_duplicates_and_near_duplicates()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_incident_storm_runs_pipeline_once(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_duplicates_share_failed_first_outcome(Path(tmp))
+    print("✅ 장애 상관 분석 테스트 통과")
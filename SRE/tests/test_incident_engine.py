@@ -0,0 +1,93 @@
+"""
+War Room 2.0 - 장애 동시 처리 엔진 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import time
+
+from src.incident_engine import IncidentEngine, IncidentQueueFull, timed_stage
+
+
+def test_incidents_run_in_parallel_with_stage_timings():
+    """블로킹 단계를 스레드로 넘긴 장애들이 워커 수만큼 동시에 처리됨"""
+    async def handler(error_log, severity="medium"):
+        timings = {}
+        with timed_stage(timings, "catalog"):
+            await asyncio.to_thread(time.sleep, 0.2)  # 동기 HTTP 검색 흉내
+        return {"success": True, "message": error_log, "severity": severity, "timings": timings}
+
+    async def scenario():
+        engine = IncidentEngine(handler, workers=10, max_queue_size=50)
+        engine.start()
+        started = time.monotonic()
+        futures = [await engine.submit(f"incident-{i}", severity="high") for i in range(20)]
+        results = await asyncio.gather(*futures)
+        elapsed = time.monotonic() - started
+        await engine.stop()
+        return engine, results, elapsed
+
+    engine, results, elapsed = asyncio.run(scenario())
+
+    # 20건 × 0.2초를 워커 10개로: 직렬(4초)이 아니라 두 번에 나눠 처리
+    assert elapsed < 1.5
+    assert [r["message"] for r in results] == [f"incident-{i}" for i in range(20)]
+    assert all(r["timings"]["catalog"] >= 0.19 for r in results)
+    assert all("queue" in r["timings"] for r in results)
+
+    stats = engine.get_stats()
+    assert stats["succeeded"] == 20 and stats["failed"] == 0
+    assert stats["stages"]["catalog"]["p50_seconds"] >= 0.19
+    # 뒤쪽 10건은 앞 10건이 끝날 때까지 대기열에서 기다림
+    assert stats["stages"]["queue"]["p95_seconds"] >= 0.15
+
+    print("✅ 장애 동시 처리 테스트 통과")
+
+
+def test_backpressure_and_timeout():
+    """대기열이 가득 차면 거절, 시간 제한을 넘긴 장애는 실패 결과"""
+    release = None
+
+    async def handler(error_log):
+        if error_log == "slow":
+            await asyncio.sleep(10)
+        await release.wait()
+        return {"success": True, "message": error_log}
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        engine = IncidentEngine(handler, workers=1, max_queue_size=2, timeout_seconds=0.1)
+        engine.start()
+
+        slow = await engine.submit("slow")
+        await asyncio.sleep(0.01)  # 워커가 slow를 가져감
+        queued = [await engine.submit("a"), await engine.submit("b")]
+        try:
+            await engine.submit("c")
+            assert False, "대기열이 가득 차면 거절되어야 함"
+        except IncidentQueueFull:
+            pass
+
+        # wait=True면 빈자리가 날 때까지 기다림
+        waiting = asyncio.ensure_future(engine.submit("d", wait=True))
+        timed_out = await slow
+        release.set()
+        results = await asyncio.gather(*queued, await waiting)
+        await engine.stop()
+        return engine, timed_out, results
+
+    engine, timed_out, results = asyncio.run(scenario())
+
+    assert timed_out["timed_out"] and not timed_out["success"]
+    assert [r["message"] for r in results] == ["a", "b", "d"]
+    stats = engine.get_stats()
+    assert stats["rejected"] == 1 and stats["timed_out"] == 1
+    assert stats["succeeded"] == 3 and stats["failed"] == 1
+
+    print("✅ 대기열 포화/시간 제한 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_incidents_run_in_parallel_with_stage_timings()
+    test_backpressure_and_timeout()
+    print("✅ 장애 처리 엔진 테스트 통과")
@@ -0,0 +1,154 @@
+"""
+War Room 2.0 - MCP readiness 프로브 테스트 (Docker 불필요)
+가짜 MCP 서버를 attach 소켓처럼 연결
+"""
+
+import asyncio
+
+from fake_mcp_server import FRAME_HEADER, FakeMCPServer
+from test_container_orchestrator import FakeDockerClient
+
+from src.container_orchestrator import ContainerPoolConfig, ContainerPoolOrchestrator
+from src.docker_stdio import AttachStreamDemuxer
+from src.readiness import ReadinessError, ReadinessProber, TimeToReadyHistogram
+
+
+def test_demuxer_handles_split_frames():
+    """recv 경계와 무관하게 stdout/stderr 프레임 분리"""
+    data = FRAME_HEADER.pack(1, 5) + b"hello" + FRAME_HEADER.pack(2, 3) + b"err"
+    demuxer = AttachStreamDemuxer()
+
+    frames = []
+    for i in range(0, len(data), 3):
+        frames.extend(demuxer.feed(data[i:i + 3]))
+
+    assert frames == [(1, b"hello"), (2, b"err")]
+
+
+def test_probe_handshakes_and_records_histogram():
+    """initialize + list_tools 성공 시점을 time-to-ready로 기록"""
+    server = FakeMCPServer(tools=["list_containers", "logs"], startup_delay=0.2)
+
+    async def scenario():
+        prober = ReadinessProber(None, open_socket=server.open_socket)
+        ready = []
+        prober.add_listener(ready.append)
+        prober.start_probe("c1", "server-docker")
+        result = await prober.wait_ready("c1", timeout=5)
+        return prober, ready, result
+
+    try:
+        prober, ready, result = asyncio.run(scenario())
+    finally:
+        server.close()
+
+    assert result.tools == ["list_containers", "logs"]
+    assert result.ready_seconds >= 0.2
+    assert ready == [result]
+    assert prober.is_ready("c1")
+    assert prober.histograms["server-docker"].count == 1
+    assert prober.expected_start_time("server-docker") == result.ready_seconds
+    assert [r["method"] for r in server.requests] == [
+        "initialize", "notifications/initialized", "tools/list"
+    ]
+
+
+def test_wait_ready_times_out_while_probe_continues():
+    """wait_ready 시간 초과는 프로브를 취소하지 않음"""
+    server = FakeMCPServer(startup_delay=0.3)
+
+    async def scenario():
+        prober = ReadinessProber(None, open_socket=server.open_socket)
+        prober.start_probe("c1", "slow")
+        try:
+            await prober.wait_ready("c1", timeout=0.05)
+        except asyncio.TimeoutError:
+            timed_out = True
+        else:
+            timed_out = False
+        result = await prober.wait_ready("c1", timeout=5)
+        return timed_out, result
+
+    try:
+        timed_out, result = asyncio.run(scenario())
+    finally:
+        server.close()
+
+    assert timed_out
+    assert result.tools == ["echo"]
+
+
+def test_orchestrator_marks_running_after_handshake():
+    """컨테이너는 핸드셰이크 전 starting, 성공 후 running + 재시작 비용 기록"""
+    server = FakeMCPServer(startup_delay=0.1)
+
+    async def scenario():
+        orchestrator = ContainerPoolOrchestrator(
+            ContainerPoolConfig(auto_build_images=False),
+            docker_client=FakeDockerClient(run_delay=0)
+        )
+        orchestrator._open_attach_socket = server.open_socket
+
+        status = await orchestrator.start_container("server-docker")
+        before = status.status
+        result = await orchestrator.wait_ready(status.container_id, timeout=5)
+        return orchestrator, status, before, result
+
+    try:
+        orchestrator, status, before, result = asyncio.run(scenario())
+    finally:
+        server.close()
+
+    assert before == "starting"
+    assert status.status == "running"
+    assert orchestrator._restart_cost["server-docker"] == result.ready_seconds
+    assert orchestrator.get_stats()["time_to_ready"]["server-docker"]["count"] == 1
+
+
+def test_failed_probe_stops_container():
+    """핸드셰이크 실패한 컨테이너는 풀에서 제거"""
+    def refuse(container_id):
+        raise OSError("attach 실패")
+
+    async def scenario():
+        orchestrator = ContainerPoolOrchestrator(
+            ContainerPoolConfig(auto_build_images=False),
+            docker_client=FakeDockerClient(run_delay=0)
+        )
+        orchestrator._open_attach_socket = refuse
+
+        status = await orchestrator.start_container("broken")
+        try:
+            await orchestrator.wait_ready(status.container_id, timeout=5)
+        except ReadinessError:
+            failed = True
+        else:
+            failed = False
+        await asyncio.gather(*orchestrator._background_tasks)
+        return orchestrator, failed
+
+    orchestrator, failed = asyncio.run(scenario())
+
+    assert failed
+    assert orchestrator.replica_count("broken") == 0
+
+
+def test_histogram_buckets():
+    """고정 버킷 누적 및 백분위수"""
+    histogram = TimeToReadyHistogram(buckets=(1, 10))
+    for seconds in (0.5, 2, 3, 30):
+        histogram.observe(seconds)
+
+    assert histogram.bucket_counts == [1, 2, 1]
+    assert histogram.percentile(50) == 3
+    assert histogram.to_dict()["count"] == 4
+
+
+if __name__ == "__main__":
+    test_demuxer_handles_split_frames()
+    test_probe_handshakes_and_records_histogram()
+    test_wait_ready_times_out_while_probe_continues()
+    test_orchestrator_marks_running_after_handshake()
+    test_failed_probe_stops_container()
+    test_histogram_buckets()
+    print("✅ readiness 테스트 통과")
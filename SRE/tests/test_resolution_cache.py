@@ -0,0 +1,120 @@
+"""
+War Room 2.0 - 해석 캐시 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import time
+
+from benchmark_pool import SAMPLE_LOGS, FakeCatalog, build_war_room
+from fake_docker_engine import EngineProfile, FakeDockerEngine
+
+from src.tier_manager import TierManager
+
+
+def test_resolutions_persist_with_tier_state(tmp_path):
+    """해석 캐시가 JSON/SQLite 티어 상태와 함께 저장되고, Catalog 결과가 바뀌면 교체"""
+    catalog = FakeCatalog()
+    for backend, filename in (("json", "tier-config.json"), ("sqlite", "tier-state.db")):
+        path = str(tmp_path / filename)
+        manager = TierManager(path, backend=backend, flush_interval_seconds=0)
+        manager.resolutions.put(["Redis", "cache"], catalog.search_servers(["redis", "cache"]))
+        manager.flush()
+
+        reloaded = TierManager(path, backend=backend)
+        resolution = reloaded.resolutions.get(["cache", "redis", "redis"])
+        assert resolution is not None, backend
+        assert resolution.server_name == FakeCatalog.server_name("redis")
+
+        # 같은 검색 결과면 유지, 버전이 바뀌면 새 결과로 교체
+        assert reloaded.resolutions.revalidate(["redis", "cache"], catalog.search_servers(["redis", "cache"]))
+        changed = catalog.search_servers(["redis", "cache"])
+        changed[0].version = "2.0.0"
+        assert not reloaded.resolutions.revalidate(["redis", "cache"], changed)
+        assert reloaded.resolutions.get(["redis", "cache"]).version == "2.0.0"
+
+        assert reloaded.resolutions.stale(3600) == []
+        assert reloaded.resolutions.stale(3600, now=time.time() + 3600) == [["cache", "redis"]]
+
+        reloaded.resolutions.invalidate(["redis", "cache"])
+        reloaded.flush()
+        assert TierManager(path, backend=backend).resolutions.get(["redis", "cache"]) is None
+
+    print("✅ 해석 캐시 저장 테스트 통과")
+
+
+def test_revalidated_timestamp_survives_restart(tmp_path):
+    """재검증으로 갱신된 검증 시각이 저장되어 재시작 후에도 오래된 항목으로 보이지 않음"""
+    catalog = FakeCatalog()
+    path = str(tmp_path / "tier-config.json")
+    manager = TierManager(path, flush_interval_seconds=3600)
+    manager.resolutions.put(["redis"], catalog.search_servers(["redis"]))
+    manager.resolutions.get(["redis"]).resolved_at -= 7200
+    manager.flush()
+    assert TierManager(path).resolutions.stale(3600) == [["redis"]]
+
+    assert manager.resolutions.revalidate(["redis"], catalog.search_servers(["redis"]))
+    manager.flush()
+
+    reloaded = TierManager(path)
+    assert reloaded.resolutions.stale(3600) == []
+    assert reloaded.resolutions.get(["redis"]).resolved_at > time.time() - 60
+
+    print("✅ 재검증 시각 저장 테스트 통과")
+
+
+def test_repeat_incident_skips_catalog(tmp_path):
+    """같은 유형의 장애는 Catalog 검색 없이 시작, 시작 실패 시 무효화되어 다시 검색"""
+    engine = FakeDockerEngine(EngineProfile(ready_seconds=0.1))
+
+    async def scenario():
+        war_room = build_war_room(engine, str(tmp_path))
+        catalog = war_room.catalog
+        try:
+            first = await war_room.handle_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+            repeat = await war_room.handle_incident(
+                SAMPLE_LOGS["redis"].replace("127.0.0.1", "10.1.2.3"), auto_approve=True
+            )
+            assert catalog.calls == 1
+
+            start_container = war_room.orchestrator.start_container
+
+            async def failing_start(**kwargs):
+                raise RuntimeError("image pull failed")
+
+            war_room.orchestrator.start_container = failing_start
+            failed = await war_room.handle_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+            war_room.orchestrator.start_container = start_container
+            retried = await war_room.handle_incident(SAMPLE_LOGS["redis"], auto_approve=True)
+            return first, repeat, failed, retried, catalog.calls, war_room.tier_manager.resolutions
+        finally:
+            await war_room.shutdown()
+
+    try:
+        first, repeat, failed, retried, calls, resolutions = asyncio.run(scenario())
+    finally:
+        engine.close()
+
+    assert first["success"] and first["resolution"] == "catalog"
+    assert repeat["success"] and repeat["resolution"] == "cache"
+    assert "catalog" not in repeat["timings"]
+    assert repeat["server_name"] == first["server_name"]
+    # 실패한 해석은 무효화 → 다음 장애는 다시 검색 후 캐시
+    assert not failed["success"]
+    assert retried["success"] and retried["resolution"] == "catalog" and calls == 2
+    stats = resolutions.get_stats()
+    assert stats["entries"] == 1 and stats["invalidations"] == 1 and stats["hits"] == 2
+
+    print("✅ 반복 장애 Catalog 생략 테스트 통과")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_resolutions_persist_with_tier_state(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_revalidated_timestamp_survives_restart(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_repeat_incident_skips_catalog(Path(tmp))
+    print("✅ 해석 캐시 테스트 통과")
@@ -0,0 +1,103 @@
+"""
+War Room 2.0 - 자원 제한 자동 조정 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from test_container_orchestrator import _make_orchestrator
+
+from src.latency_stats import percentile
+from src.resource_limits import LimitsAutotuner, cpu_cores_from_stats
+
+
+def test_recommend_uses_p95_with_headroom():
+    """샘플이 쌓이기 전에는 기본값, 이후 p95 × 여유율 (16MB 단위 올림)"""
+    tuner = LimitsAutotuner(headroom=1.25, min_samples=20)
+    for _ in range(19):
+        tuner.observe("server-light", 60, 0.04)
+    assert tuner.recommend("server-light", 200, 0.5) == (200, 0.5)
+
+    # 100개 중 상위 5개는 튀는 값 → p95는 평상시 값
+    for _ in range(76):
+        tuner.observe("server-light", 60, 0.04)
+    for _ in range(5):
+        tuner.observe("server-light", 180, 0.3)
+
+    assert percentile(range(1, 101), 95) == 95
+    memory_mb, cpus = tuner.recommend("server-light", 200, 0.5)
+    assert memory_mb == 80  # ceil(60 × 1.25 / 16) × 16
+    assert cpus == 0.1      # 최소 CPU
+
+
+def test_saturated_server_grows():
+    """사용량이 제한에 붙어 있으면 p95와 무관하게 단계적으로 상향"""
+    tuner = LimitsAutotuner(headroom=1.1, min_samples=3)
+    for _ in range(3):
+        tuner.observe("server-heavy", 195, 0.5, memory_limit_mb=200, cpu_limit=0.5)
+
+    memory_mb, cpus = tuner.recommend("server-heavy", 200, 0.5)
+    assert memory_mb == 304  # 200 × 1.5 → 16MB 단위
+    assert cpus == 0.75
+
+
+def test_profiles_persist():
+    """프로필 저장 후 새 인스턴스에서 그대로 추천"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "resource-profiles.json"
+        tuner = LimitsAutotuner(str(path), min_samples=2)
+        tuner.observe("server-docker", 100, 0.2)
+        tuner.observe("server-docker", 120, 0.3)
+        tuner.save()
+
+        reloaded = LimitsAutotuner(str(path), min_samples=2)
+        assert reloaded.recommend("server-docker", 200, 0.5) == tuner.recommend(
+            "server-docker", 200, 0.5
+        )
+
+
+def test_cpu_cores_from_stats():
+    stats = {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": 300, "percpu_usage": [0, 0, 0, 0]},
+            "system_cpu_usage": 2000,
+        },
+        "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},
+    }
+    assert cpu_cores_from_stats(stats) == 0.8
+    assert cpu_cores_from_stats({}) == 0.0
+
+
+def test_orchestrator_applies_tuned_limits():
+    """측정 사용량으로 실행 중 컨테이너는 update, 다음 시작은 조정된 제한으로 실행"""
+    async def scenario():
+        orchestrator, client = _make_orchestrator(limits_min_samples=3)
+        status = await orchestrator.start_container("server-light")
+        client.memory_mb[status.container_id] = 50
+        client.cpu_cores[status.container_id] = 0.05
+        for _ in range(3):
+            await orchestrator._check_memory_pressure()
+
+        await orchestrator.stop_container(status.container_id)
+        await orchestrator.start_container("server-light")
+        return orchestrator, client, status
+
+    orchestrator, client, status = asyncio.run(scenario())
+
+    assert client.run_kwargs[0]["mem_limit"] == "200m"
+    assert client.updates == [
+        (status.container_id, {"mem_limit": "80m", "memswap_limit": "160m", "cpu_quota": 10000})
+    ]
+    assert client.run_kwargs[1]["mem_limit"] == "80m"
+    assert client.run_kwargs[1]["cpu_quota"] == 10000
+    assert orchestrator.get_stats()["resource_limits"]["server-light"]["samples"] == 3
+
+
+if __name__ == "__main__":
+    test_recommend_uses_p95_with_headroom()
+    test_saturated_server_grows()
+    test_profiles_persist()
+    test_cpu_cores_from_stats()
+    test_orchestrator_applies_tuned_limits()
+    print("✅ 자원 제한 자동 조정 테스트 통과")
@@ -0,0 +1,86 @@
+"""
+War Room 2.0 - MCP 세션 풀 테스트 (Docker 불필요)
+"""
+
+import asyncio
+
+from fake_mcp_server import FakeMCPServer
+from test_container_orchestrator import FakeDockerClient
+
+from src.container_orchestrator import ContainerPoolConfig, ContainerPoolOrchestrator
+from src.session_pool import MCPSessionPool
+
+
+def _make_orchestrator(open_socket):
+    orchestrator = ContainerPoolOrchestrator(
+        ContainerPoolConfig(auto_build_images=False),
+        docker_client=FakeDockerClient(run_delay=0)
+    )
+    orchestrator._open_attach_socket = open_socket
+    return orchestrator
+
+
+def test_concurrent_calls_share_readiness_session():
+    """readiness 핸드셰이크 세션을 재사용해 동시 호출을 한 세션으로 다중화"""
+    server = FakeMCPServer(tools=["echo"])
+
+    async def scenario():
+        orchestrator = _make_orchestrator(server.open_socket)
+        results = await asyncio.gather(*[
+            orchestrator.call_tool("server-docker", "echo", {"n": i})
+            for i in range(5)
+        ])
+        tools = await orchestrator.list_tools("server-docker")
+        sessions = orchestrator.get_stats()["mcp_sessions"]
+        await orchestrator.sessions.shutdown()
+        return results, tools, sessions
+
+    try:
+        results, tools, sessions = asyncio.run(scenario())
+    finally:
+        server.close()
+
+    assert [r.content[0].text for r in results] == [f'echo:{{"n": {i}}}' for i in range(5)]
+    assert [t.name for t in tools] == ["echo"]
+    assert sessions == 1
+    methods = [r["method"] for r in server.requests]
+    assert methods.count("initialize") == 1
+    assert methods.count("tools/list") == 1
+    assert methods.count("tools/call") == 5
+
+
+def test_reconnects_after_connection_loss():
+    """컨테이너 stdio 연결이 끊기면 재연결 후 재시도"""
+    servers = []
+
+    def open_socket(container_id):
+        servers.append(FakeMCPServer())
+        return servers[-1].open_socket()
+
+    async def scenario():
+        pool = MCPSessionPool(open_socket)
+        first = await pool.call_tool("c1", "server-docker", "echo", {"n": 1})
+
+        # 서버 쪽 stdio 종료 → 기존 세션은 다음 호출에서 끊김 감지
+        servers[0].disconnect()
+        await asyncio.sleep(0.05)
+
+        second = await pool.call_tool("c1", "server-docker", "echo", {"n": 2}, timeout=5)
+        await pool.shutdown()
+        return first, second
+
+    try:
+        first, second = asyncio.run(scenario())
+    finally:
+        for server in servers:
+            server.close()
+
+    assert first.content[0].text == 'echo:{"n": 1}'
+    assert second.content[0].text == 'echo:{"n": 2}'
+    assert len(servers) == 2
+
+
+if __name__ == "__main__":
+    test_concurrent_calls_share_readiness_session()
+    test_reconnects_after_connection_loss()
+    print("✅ 세션 풀 테스트 통과")
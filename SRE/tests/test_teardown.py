@@ -0,0 +1,92 @@
+"""
+War Room 2.0 - 일괄 종료 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import time
+
+import docker
+import requests
+
+from test_container_orchestrator import FakeDockerClient
+
+from src.container_orchestrator import ContainerPoolConfig, ContainerPoolOrchestrator
+from src.teardown import TeardownTarget, teardown_containers
+
+
+class SlowExitDockerClient(FakeDockerClient):
+    """SIGTERM 후 종료까지 걸리는 시간을 컨테이너별로 흉내"""
+
+    def __init__(self, exit_delay=None, **kwargs):
+        super().__init__(run_delay=0, **kwargs)
+        self.exit_delay = exit_delay or {}
+        self.signals = []
+        self.removed = []
+
+    def _get(self, container_id):
+        if container_id.startswith("gone"):
+            raise docker.errors.NotFound("없음")
+        container = super()._get(container_id)
+        container.attrs = {"Config": {}}
+        delay = self.exit_delay.get(container_id, 0.0)
+
+        def wait(timeout):
+            if delay > timeout:
+                time.sleep(timeout)
+                raise requests.exceptions.ReadTimeout()
+            time.sleep(delay)
+            return {"StatusCode": 0}
+
+        container.wait.side_effect = wait
+        container.kill.side_effect = lambda signal="SIGKILL": self.signals.append((container_id, signal))
+        container.remove.side_effect = lambda force=False: self.removed.append(container_id)
+        return container
+
+
+def test_stragglers_share_one_grace_deadline():
+    """느린 컨테이너가 여럿이어도 전체 대기는 유예 시간 1번"""
+    ids = [f"c{i}" for i in range(6)]
+    client = SlowExitDockerClient({cid: 5.0 for cid in ids[:3]})
+
+    async def scenario():
+        targets = [TeardownTarget(cid, "server", client) for cid in ids + ["gone-1"]]
+        started = time.monotonic()
+        report = await teardown_containers(targets, grace_seconds=0.3)
+        return report, time.monotonic() - started
+
+    report, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 1.5
+    assert (report.graceful, report.killed, report.missing) == (3, 3, 1)
+    assert not report.failed
+    assert set(report.phase_seconds) == {"signal", "grace", "kill", "remove"}
+    assert sorted(cid for cid, sig in client.signals if sig == "SIGKILL") == ids[:3]
+    assert sorted(client.removed) == ids
+
+
+def test_orchestrator_shutdown_uses_bulk_teardown():
+    """shutdown은 모든 컨테이너를 한 번에 종료하고 결과 보고"""
+    client = SlowExitDockerClient()
+
+    async def scenario():
+        orchestrator = ContainerPoolOrchestrator(
+            ContainerPoolConfig(readiness_probe=False, auto_build_images=False),
+            docker_client=client
+        )
+        for i in range(4):
+            await orchestrator.start_container(f"server-{i}")
+        await orchestrator.shutdown()
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    assert not orchestrator.containers
+    assert orchestrator.fleet.hosts["local"].containers == 0
+    assert orchestrator.last_teardown.graceful == 4
+    assert len(client.removed) == 4
+
+
+if __name__ == "__main__":
+    test_stragglers_share_one_grace_deadline()
+    test_orchestrator_shutdown_uses_bulk_teardown()
+    print("✅ 일괄 종료 테스트 통과")
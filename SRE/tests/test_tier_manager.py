@@ -0,0 +1,369 @@
+"""
+War Room 2.0 - TierManager 저장/통계 테스트 (Docker 불필요)
+"""
+
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.start_cost import StartCostSample
+from src.tier_manager import ServerTier, TierManager
+from src.usage_window import HourlyUsageWindow
+
+
+def test_write_behind_batches_usage(tmp_path):
+    """사용 기록은 메모리만 갱신하고, 임계값/flush 때만 파일을 씀"""
+    path = tmp_path / "tier-config.json"
+    manager = TierManager(str(path), flush_interval_seconds=3600, flush_threshold=3, journal=False)
+
+    manager.register_server("a", "@mcp/a", "1.0.0")
+    for _ in range(500):
+        manager.record_usage("a")
+    manager.record_start_cost(StartCostSample("a", 0.0, 1.0, 3.0))
+    assert manager.flush_count == 0 and not path.exists()
+
+    # 변경된 서버 수가 임계값에 도달하면 바로 저장
+    manager.register_server("b", "@mcp/b", "1.0.0")
+    manager.register_server("c", "@mcp/c", "1.0.0")
+    assert manager.flush_count == 1
+    assert not path.with_name(path.name + ".tmp").exists()
+
+    manager.record_usage("b")
+    manager.flush()
+    assert manager.flush_count == 2
+    manager.flush()  # 변경 없으면 쓰지 않음
+    assert manager.flush_count == 2
+
+    reloaded = TierManager(str(path))
+    assert reloaded.servers["a"].total_usage_count == 500
+    assert reloaded.servers["a"].expected_start_time == 4.0
+    assert reloaded.servers["b"].total_usage_count == 1
+
+    print("✅ write-behind 일괄 저장 테스트 통과")
+
+
+def test_write_behind_loop_flushes_on_cancel(tmp_path):
+    """백그라운드 루프가 주기마다 저장하고, 취소 시 남은 변경분도 저장"""
+    path = tmp_path / "tier-config.json"
+
+    async def scenario():
+        manager = TierManager(
+            str(path), flush_interval_seconds=0.05, flush_threshold=1000,
+            compact_interval_seconds=0.05
+        )
+        writer = asyncio.create_task(manager.write_behind(poll_seconds=0.01))
+        await asyncio.sleep(0)
+
+        manager.register_server("a", "@mcp/a", "1.0.0")
+        # 루프가 돌고 있으면 사용 기록 경로에서는 쓰지 않음
+        await asyncio.sleep(0.2)
+        assert manager.flush_count == 1
+        data = json.loads(path.read_text())
+        assert [s["name"] for s in data["servers"]] == ["a"]
+
+        manager.record_usage("a")
+        manager.mark_image_cached("a", "mcp/a:latest", 120)
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        return manager
+
+    manager = asyncio.run(scenario())
+    reloaded = TierManager(str(path))
+    assert reloaded.servers["a"].total_usage_count == 1
+    assert reloaded.servers["a"].image_cached
+    assert reloaded.get_tier("a") == manager.get_tier("a") == ServerTier.TIER_3_COLD
+
+    print("✅ write-behind 루프 테스트 통과")
+
+
+def test_usage_journal_replay_and_compaction(tmp_path):
+    """스냅샷 없이 중단돼도 저널로 복구되고, compaction 후 중복 적용 없음"""
+    path = tmp_path / "tier-config.json"
+    manager = TierManager(str(path), flush_interval_seconds=3600, compact_interval_seconds=3600)
+    manager.register_server("a", "@mcp/a", "1.0.0", ServerTier.TIER_1_HOT)
+    for _ in range(50):
+        manager.record_usage("a")
+    # 저널에만 있는 변경은 스냅샷을 서두르지 않음
+    assert manager.flush_count == 0 and manager.journal.records == 51
+    manager.journal.close()
+
+    # 기록 도중 중단된 마지막 줄
+    journal_path = path.with_suffix(".journal")
+    with open(journal_path, "ab") as f:
+        f.write(b'0000abcd {"n":52,"op":"use"')
+
+    recovered = TierManager(str(path))
+    server = recovered.servers["a"]
+    assert server.total_usage_count == 50 and server.tier == ServerTier.TIER_1_HOT
+    assert journal_path.read_bytes().endswith(b"\n")
+
+    # 스냅샷 저장 → 저널 compaction
+    recovered.record_usage("a")
+    recovered.flush()
+    assert recovered.journal.records == 0 and journal_path.read_bytes() == b""
+    recovered.record_usage("a")
+    recovered.journal.close()
+
+    reloaded = TierManager(str(path))
+    assert reloaded.servers["a"].total_usage_count == 52
+
+    print("✅ 사용 저널 재생/compaction 테스트 통과")
+
+
+def test_journal_handle_closed_on_compact_and_close(tmp_path):
+    """저널 append 핸들은 compaction과 관리자 종료 때 닫히고, 이후 append는 다시 엶"""
+    path = tmp_path / "tier-config.json"
+    manager = TierManager(str(path), flush_interval_seconds=3600, compact_interval_seconds=3600)
+    manager.register_server("a", "@mcp/a", "1.0.0", ServerTier.TIER_3_COLD)
+    journal = manager.journal
+    assert journal._file is not None and not journal._file.closed
+
+    handle = journal._file
+    manager.flush()
+    assert handle.closed and journal._file is None
+
+    manager.record_usage("a")
+    handle = journal._file
+    manager.close()
+    assert handle.closed and journal._file is None
+    manager.close()  # 두 번 호출해도 안전
+
+    manager.record_usage("a")
+    journal.close()
+    assert TierManager(str(path)).servers["a"].total_usage_count == 2
+
+    print("✅ 저널 핸들 정리 테스트 통과")
+
+def test_sqlite_backend_shares_counters(tmp_path):
+    """두 관리자가 같은 DB를 써도 서로의 사용 수를 덮어쓰지 않음"""
+    path = str(tmp_path / "tier-state.db")
+    first = TierManager(path, backend="sqlite", flush_interval_seconds=3600)
+    first.register_server("a", "@mcp/a", "1.0.0", ServerTier.TIER_2_WARM)
+    first.flush()
+    second = TierManager(path, backend="sqlite", flush_interval_seconds=3600)
+
+    for _ in range(3):
+        first.record_usage("a")
+    for _ in range(4):
+        second.record_usage("a")
+    first.mark_image_cached("a", "mcp/a:latest", 120)
+    first.flush()
+    second.flush()
+
+    # 공유 통계는 두 프로세스 사용분 합계 (SQL 집계), 로컬 통계는 메모리 인덱스만
+    stats = asyncio.run(first.get_shared_stats())
+    assert stats["total_usage"] == 7 and stats["weekly_usage"] == 7
+    assert stats["tier_distribution"][ServerTier.TIER_2_WARM.display_name] == 1
+    assert stats["most_used_server"]["name"] == "a"
+    assert asyncio.run(second.get_shared_cache_summary())["total_size_mb"] == 120
+    assert first.get_stats()["total_usage"] == 3
+    assert first.get_cache_summary()["total_size_mb"] == 120
+
+    # 통계 조회만으로는 저장하지 않음 (write-behind가 저장 시점 결정)
+    first.record_usage("a")
+    flushes = first.flush_count
+    first.get_stats()
+    first.get_cache_summary()
+    assert first.flush_count == flushes
+    assert len(first.store.usage_events("a")) == 7
+
+    # 사용 윈도우는 사용 이벤트에서 재구성 (두 프로세스 합계)
+    reloaded = TierManager(path, backend="sqlite")
+    assert reloaded.servers["a"].total_usage_count == 7
+    assert reloaded.servers["a"].weekly_usage_count == 7
+    assert reloaded.servers["a"].image_cached
+
+    print("✅ SQLite 공유 저장소 테스트 통과")
+
+
+def test_rolling_window_expires_old_usage(tmp_path):
+    """7일 지난 사용은 한 시간씩 빠지고, 저장/로드 후에도 윈도우 유지"""
+    now = time.time()
+    window = HourlyUsageWindow()
+    window.add(now - 8 * 24 * 3600)       # 윈도우 밖
+    window.add(now - 6 * 24 * 3600, 4)
+    window.add(now - 1800, 2)
+    assert window.count(now) == 6
+    assert window.count(now, hours=24) == 2
+    assert window.count(now + 2 * 24 * 3600) == 2
+    assert window.count(now + 8 * 24 * 3600) == 0
+
+    path = str(tmp_path / "tier-config.json")
+    manager = TierManager(path, journal=False)
+    manager.register_server("a", "@mcp/a", "1.0.0")
+    for _ in range(5):
+        manager.record_usage("a")
+    manager.flush()
+
+    reloaded = TierManager(path)
+    assert reloaded.servers["a"].weekly_usage_count == 5
+
+    # 이전 형식(weekly_usage_count)은 마지막 사용 시각의 버킷으로 이전
+    data = json.loads(Path(path).read_text())
+    record = data["servers"][0]
+    del record["usage_window"]
+    record["weekly_usage_count"] = 9
+    Path(path).write_text(json.dumps(data))
+    assert TierManager(path).servers["a"].weekly_usage_count == 9
+
+    print("✅ rolling window 테스트 통과")
+
+
+def test_tier_hysteresis(tmp_path):
+    """승격은 즉시, 강등은 낮은 기준 + 최소 유지 시간 후 한 단계씩"""
+    manager = TierManager(str(tmp_path / "tier-config.json"), journal=False)
+    manager.register_server("a", "@mcp/a", "1.0.0")
+    for _ in range(10):
+        manager.record_usage("a")
+    manager.optimize()
+    server = manager.servers["a"]
+    assert server.tier == ServerTier.TIER_1_HOT
+
+    # 사용이 승격 기준 아래로 떨어져도 강등 기준(3회) 이상이면 HOT 유지
+    server.usage_window = HourlyUsageWindow()
+    server.usage_window.add(time.time(), 5)
+    server.last_tier_adjustment -= timedelta(days=1)
+    manager.optimize()
+    assert server.tier == ServerTier.TIER_1_HOT
+
+    # 강등 기준 미만이어도 최소 유지 시간 안이면 유지
+    server.usage_window = HourlyUsageWindow()
+    server.last_tier_adjustment = datetime.now()
+    manager.optimize()
+    assert server.tier == ServerTier.TIER_1_HOT
+
+    # 유지 시간이 지나면 강등, Official은 Tier 2 아래로 내려가지 않음
+    server.last_tier_adjustment -= timedelta(hours=7)
+    manager.optimize()
+    assert server.tier == ServerTier.TIER_3_COLD
+
+    manager.register_server(
+        "@modelcontextprotocol/server-x", "@modelcontextprotocol/server-x", "1.0.0",
+        ServerTier.TIER_1_HOT
+    )
+    manager.servers["@modelcontextprotocol/server-x"].last_tier_adjustment = (
+        datetime.now() - timedelta(days=1)
+    )
+    manager.optimize()
+    assert manager.get_tier("@modelcontextprotocol/server-x") == ServerTier.TIER_2_WARM
+
+    print("✅ 티어 히스테리시스 테스트 통과")
+
+
+def test_stats_index_matches_full_scan(tmp_path):
+    """티어/캐시/사용 인덱스 통계가 전체 스캔 결과와 같음 (서버 수천 개)"""
+    rng = random.Random(3)
+    manager = TierManager(str(tmp_path / "tier-config.json"), journal=False, flush_threshold=10 ** 6)
+    names = [f"@mcp/server-{i}" for i in range(3000)]
+    for name in names:
+        manager.register_server(name, name, "1.0.0")
+    for _ in range(5000):
+        manager.record_usage(rng.choice(names[:200]))
+    for name in rng.sample(names, 300):
+        manager.mark_image_cached(name, f"mcp/{name}:latest", rng.randint(50, 300))
+    for name in rng.sample(names, 100):
+        manager.mark_image_evicted(name)
+    manager.optimize()
+
+    servers = list(manager.servers.values())
+    stats = manager.get_stats()
+    assert stats["total_usage"] == sum(s.total_usage_count for s in servers) == 5000
+    assert stats["weekly_usage"] == sum(s.weekly_usage_count for s in servers)
+    assert stats["most_used_server"]["usage"] == max(s.total_usage_count for s in servers)
+    for tier in ServerTier:
+        expected = [s for s in servers if s.tier == tier]
+        assert sorted(s.name for s in manager.get_servers_by_tier(tier)) == sorted(
+            s.name for s in expected
+        )
+        assert stats["tier_distribution"][tier.display_name] == len(expected)
+
+    cache = manager.get_cache_summary()
+    cached = [s for s in servers if s.image_cached]
+    assert cache["cached_count"] == len(cached)
+    assert cache["total_size_mb"] == sum(s.image_size_mb for s in cached)
+    for tier in ServerTier:
+        assert cache["by_tier"][tier.display_name]["size_mb"] == sum(
+            s.image_size_mb for s in cached if s.tier == tier
+        )
+
+    # 재로드 후 인덱스 재구성
+    manager.flush()
+    reloaded = TierManager(str(tmp_path / "tier-config.json"))
+    assert reloaded.get_stats() == stats
+    assert reloaded.get_cache_summary() == cache
+
+    print("✅ 통계 인덱스 테스트 통과")
+
+
+def test_start_cost_weights_tier(tmp_path):
+    """느린 서버는 드물게 써도 Warm, 빠른 서버는 자주 써도 Hot 승격만 늦춤"""
+    path = str(tmp_path / "tier-config.json")
+    manager = TierManager(path, journal=False)
+    manager.register_server("slow", "@mcp/slow", "1.0.0")
+    manager.register_server("fast", "@mcp/fast", "1.0.0")
+    manager.register_server("unknown", "@mcp/unknown", "1.0.0")
+
+    manager.record_start_cost(StartCostSample("slow", 40.0, 2.0, 18.0, image_prepared=True))
+    manager.record_start_cost(StartCostSample("fast", 0.1, 0.5, 1.0))
+    manager.record_usage("slow")
+    for _ in range(10):
+        manager.record_usage("fast")
+        manager.record_usage("unknown")
+
+    manager.optimize()
+    assert manager.get_tier("slow") == ServerTier.TIER_2_WARM
+    # 2초 안에 뜨는 서버도 주 10회 쓰면 Warm 아래로 내려가지 않음 (Hot 승격만 보류)
+    assert manager.get_tier("fast") == ServerTier.TIER_2_WARM
+    # 측정값이 없으면 사용 빈도만으로 판단
+    assert manager.get_tier("unknown") == ServerTier.TIER_1_HOT
+
+    # 이미지가 캐시되면 예상 시작 시간에서 이미지 준비 시간 제외
+    slow = manager.servers["slow"]
+    assert slow.expected_start_time == 60.0
+    manager.mark_image_cached("slow", "mcp/slow:latest", 300)
+    assert slow.expected_start_time == 20.0
+
+    manager.flush()
+    reloaded = TierManager(path).servers["slow"]
+    assert reloaded.start_cost == slow.start_cost
+
+    print("✅ 시작 비용 가중 티어 테스트 통과")
+
+
+def test_legacy_start_time_migrates_to_start_cost(tmp_path):
+    """이전 형식의 준비 시간 EWMA(measured_start_seconds)는 시작 비용으로 이전"""
+    path = tmp_path / "tier-config.json"
+    path.write_text(json.dumps({"servers": [{
+        "name": "a", "package": "@mcp/a", "version": "1.0.0",
+        "tier": ServerTier.TIER_2_WARM.value, "measured_start_seconds": 12.0,
+    }]}))
+
+    server = TierManager(str(path), journal=False).servers["a"]
+    assert server.start_cost.ready_seconds == 12.0
+    assert server.expected_start_time == 12.0 and server.cold_start_seconds == 12.0
+    assert not hasattr(server, "measured_start_seconds")
+
+    print("✅ 이전 시작 시간 이전 테스트 통과")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    for test in (
+        test_write_behind_batches_usage,
+        test_write_behind_loop_flushes_on_cancel,
+        test_usage_journal_replay_and_compaction,
+        test_journal_handle_closed_on_compact_and_close,
+        test_sqlite_backend_shares_counters,
+        test_rolling_window_expires_old_usage,
+        test_tier_hysteresis,
+        test_stats_index_matches_full_scan,
+        test_start_cost_weights_tier,
+        test_legacy_start_time_migrates_to_start_cost,
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ TierManager 테스트 통과")
@@ -0,0 +1,89 @@
+"""
+War Room 2.0 - 요일×시간 사용 예측 및 사전 시작 평가 테스트 (Docker 불필요)
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from src.eviction import TraceEvent
+from src.usage_forecast import UsageForecaster, simulate_prewarming
+
+
+def _weekly_trace(weeks=6, seed=7):
+    """평일 14시 배포 창구 + 무작위 시각의 드문 사용"""
+    rng = random.Random(seed)
+    start = datetime(2025, 12, 1)  # 월요일
+    trace = []
+    for day in range(weeks * 7):
+        date = start + timedelta(days=day)
+        if date.weekday() < 5:
+            for _ in range(3):
+                trace.append(TraceEvent(
+                    date + timedelta(hours=14, minutes=rng.randint(0, 15)),
+                    "deploy-mcp", 200, 20.0
+                ))
+        if rng.random() < 0.3:
+            trace.append(TraceEvent(
+                date + timedelta(hours=rng.randint(0, 23), minutes=rng.randint(0, 59)),
+                "rare-mcp", 150, 10.0
+            ))
+    return trace
+
+
+def test_forecast_learns_hour_of_week(tmp_path):
+    """반복되는 시간대는 높은 확률, 수요 직전에만 사전 시작 계획"""
+    path = tmp_path / "usage-forecast.json"
+    forecaster = UsageForecaster(profile_path=str(path))
+    forecaster.fit((e.server_name, e.timestamp) for e in _weekly_trace(weeks=4))
+
+    monday = datetime(2025, 12, 29)
+    assert forecaster.probability("deploy-mcp", monday.replace(hour=14)) > 0.9
+    assert forecaster.probability("deploy-mcp", monday.replace(hour=3)) == 0.0
+    # 주말에는 배포 없음
+    assert forecaster.probability("deploy-mcp", monday.replace(hour=14) - timedelta(days=1)) == 0.0
+
+    # 정각 lead_minutes 전까지는 계획 없음, 같은 시간대는 한 번만
+    assert forecaster.forecast(monday.replace(hour=13, minute=30)) == []
+    actions = forecaster.forecast(monday.replace(hour=13, minute=52))
+    assert [(a.server_name, a.action) for a in actions] == [("deploy-mcp", "start")]
+    assert actions[0].at == monday.replace(hour=14)
+    assert forecaster.forecast(monday.replace(hour=13, minute=55)) == []
+
+    # 프로필 저장/로드
+    forecaster.save()
+    reloaded = UsageForecaster(profile_path=str(path))
+    assert abs(
+        reloaded.probability("deploy-mcp", monday.replace(hour=14))
+        - forecaster.probability("deploy-mcp", monday.replace(hour=14))
+    ) < 1e-6
+
+    print("✅ 요일×시간 예측 테스트 통과")
+
+
+def test_replay_reports_avoided_cold_starts():
+    """재생 평가: 배포 창구 콜드 스타트를 피하고 추가 컨테이너 시간을 보고"""
+    trace = _weekly_trace(weeks=6)
+    result = simulate_prewarming(trace, UsageForecaster(), idle_timeout_minutes=30)
+
+    # 학습 2주 뒤 4주 × 평일 5일 배포 창구가 모두 사전 시작으로 처리
+    assert result.baseline_cold_starts >= 20
+    assert result.cold_starts_avoided >= 18
+    assert result.prewarm_starts >= 18
+    # 사전 시작 1회당 추가 실행은 lead(10분) + Idle 타임아웃(30분) 이내
+    assert 0 < result.extra_container_minutes <= result.prewarm_starts * 40
+
+    # 예측하지 않으면 반응형 풀과 동일
+    never = simulate_prewarming(trace, UsageForecaster(start_probability=2.0, pull_probability=2.0))
+    assert never.cold_starts_avoided == 0 and never.extra_container_minutes == 0
+
+    print("✅ 사전 시작 재생 평가 테스트 통과")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_forecast_learns_hour_of_week(Path(tmp))
+    test_replay_reports_avoided_cold_starts()
+    print("✅ 사용 예측 테스트 통과")